@@ -1,8 +1,18 @@
 """
 ReVerse - Level Data
 Unity Scene benzeri level verileri
+Leveller Levels/Data altındaki metin dosyalarından (grid sembol dili) okunur,
+ilk yüklemede ikili forma derlenip cache'lenir (bkz. LevelFormat).
+config.LEVEL_PACK ayarlıysa (veya use_pack ile) leveller mmap'li paketten gelir (bkz. LevelPack).
 """
+import hashlib
+import os
+import config
+from config import LEVELS_PATH, LEVEL_CACHE_PATH
 from Scripts.Utils.Constants import *
+from Scripts.Utils.Path import asset_path
+from Levels.LevelFormat import LEVEL_EXTENSION, load_level_file
+from Levels.LevelPack import LevelPack
 
 class LevelData:
     """
@@ -10,70 +20,130 @@ class LevelData:
     Unity Inspector benzeri yapı
     """
     
-    # ============================================
-    # LEVEL 1 - Tutorial
-    # ============================================
-    LEVEL_1 = {
-        "name": "Tutorial",
-        "description": "Learn the basics of ReVerse",
-        "grid": [
-            ["K", "R", "X", ".", "X", "*"],  # Row A
-            [".", "X", ">", ".", ".", "."],  # Row B
-            ["X", ".", "S", "D", "X", "."],  # Row C
-            [".", "X", ".", ".", ".", "X"],  # Row D
-            ["R", "X", "X", "<", "X", "*"]   # Row E
-        ],
-        "stars_required": 2,  # Kazanmak için gereken yıldız
-        "time_limit": None,   # Zaman sınırı (None = sınırsız)
-        "background_color": (20, 20, 30),
-        "hint": "Collect stars and avoid black platforms!"
-    }
-    
-    # ============================================
-    # LEVEL 2 - Mirror World
-    # ============================================
-    LEVEL_2 = {
-        "name": "Mirror World",
-        "description": "Triangles are reversed",
-        "grid": [
-            ["K", "R", "X", ".", "X", "*"],  # Row A
-            [".", "X", "<", ".", ".", "."],  # Row B (Ters yön)
-            ["X", ".", "S", "D", "X", "."],  # Row C
-            [".", "X", ".", ".", ".", "X"],  # Row D
-            ["R", "X", "X", ">", "X", "*"]   # Row E (Ters yön)
-        ],
-        "stars_required": 2,
-        "time_limit": 120,  # 2 dakika
-        "background_color": (30, 20, 20),
-        "hint": "Watch out for reversed push directions!"
-    }
-    
+    _files = None   # Sıralı level dosyaları (ilk erişimde bulunur)
+    _levels = {}    # Level numarası -> yüklenmiş level (her çağrıda aynı dict)
+    _pack = None    # Açık LevelPack (varsa dosyalar yerine kullanılır)
+    _digest = None  # Level dosyalarının içerik özeti (content_digest)
+
     # ============================================
     # STATIC METHODS
     # ============================================
-    
+
+    @staticmethod
+    def level_files():
+        """
+        Levels/Data altındaki level dosyaları (level_01.txt, level_02.txt, ...)
+
+        Returns:
+            list: Dosya yolları, isim sırasıyla (1. dosya = Level 1)
+        """
+        if LevelData._files is None:
+            folder = asset_path(LEVELS_PATH)
+            names = sorted(name for name in os.listdir(folder) if name.endswith(LEVEL_EXTENSION)) \
+                if os.path.isdir(folder) else []
+            LevelData._files = [os.path.join(folder, name) for name in names]
+        return LevelData._files
+
     @staticmethod
     def get_level(level_number):
         """
         Level numarasına göre level verisi döndür
-        
+        İlk istekte dosya derlenmiş cache'ten (yoksa metinden) okunur, sonra bellekte tutulur.
+
         Args:
             level_number (int): Level numarası (1, 2, ...)
-            
+
         Returns:
             dict: Level verisi veya None
         """
-        levels = {
-            1: LevelData.LEVEL_1,
-            2: LevelData.LEVEL_2
-        }
-        return levels.get(level_number, None)
-    
+        pack = LevelData.get_pack()
+        if pack is not None:
+            return pack.get_level(level_number)  # Paket: isteğe bağlı decode + LRU
+        level = LevelData._levels.get(level_number)
+        if level is None:
+            files = LevelData.level_files()
+            if not isinstance(level_number, int) or not 1 <= level_number <= len(files):
+                return None
+            level, _ = load_level_file(files[level_number - 1], asset_path(LEVEL_CACHE_PATH))
+            LevelData._levels[level_number] = level
+        return level
+
     @staticmethod
     def get_total_levels():
         """Toplam level sayısını döndür"""
-        return 2
-    
+        pack = LevelData.get_pack()
+        return len(pack) if pack is not None else len(LevelData.level_files())
+
+    @staticmethod
+    def content_digest():
+        """
+        Tüm level'ların ham içeriğinin özeti (decode edilmez; replay config hash'i için)
+
+        Returns:
+            bytes: 16 baytlık özet (paket varsa paketin kendi özeti)
+        """
+        pack = LevelData.get_pack()
+        if pack is not None:
+            return pack.content_digest()
+        if LevelData._digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for path in LevelData.level_files():
+                with open(path, "rb") as f:
+                    raw = f.read()
+                digest.update(len(raw).to_bytes(4, "little") + raw)
+            LevelData._digest = digest.digest()
+        return LevelData._digest
+
+    @staticmethod
+    def iter_levels(start=1):
+        """
+        Level'ları sırayla ver (paketten okunurken bellekte sadece LRU kadar level kalır)
+
+        Args:
+            start (int): İlk level numarası
+
+        Yields:
+            tuple: (level numarası, level verisi)
+        """
+        for number in range(start, LevelData.get_total_levels() + 1):
+            yield number, LevelData.get_level(number)
+
+    @staticmethod
+    def get_pack():
+        """
+        Returns:
+            LevelPack: Aktif paket veya None (config.LEVEL_PACK ilk istekte açılır)
+        """
+        if LevelData._pack is None and config.LEVEL_PACK:
+            LevelData.use_pack(config.LEVEL_PACK)
+        return LevelData._pack
+
+    @staticmethod
+    def use_pack(path, cache_size=None):
+        """
+        Level'ları .rvpk paketinden oku (None = açık paketi kapat)
+
+        Args:
+            path (str): Paket dosyası
+            cache_size (int): Decode edilmiş level LRU kapasitesi
+
+        Raises:
+            ValueError: Dosya paket formatında değilse
+        """
+        if LevelData._pack is not None:
+            LevelData._pack.close()
+            LevelData._pack = None
+        if path:
+            LevelData._pack = LevelPack(asset_path(path), cache_size)
+            print(f"📦 {LevelData._pack}")
+
+    @staticmethod
+    def reload():
+        """Dosya listesini ve yüklenmiş levelleri unut (level dosyaları değiştiyse)"""
+        LevelData._files = None
+        LevelData._levels = {}
+        LevelData._digest = None
+
     @staticmethod
     def validate_grid(grid):
         """
@@ -0,0 +1,309 @@
+"""
+ReVerse - Level Format
+Level metin dosyaları (grid sembol dili) ve derlenmiş ikili önbellek.
+
+Metin formatı (Levels/Data/level_XX.txt):
+    name: Tutorial                 <- "anahtar: değer" meta satırları
+    stars_required: 2
+    time_limit: none
+    background_color: 20, 20, 30
+                                   <- boş satır
+    K R X . X *                    <- grid satırları (boşluklu veya bitişik)
+    ...
+
+İkili form (cache, içerik hash'i ile adlandırılır):
+    MAGIC (4) | sürüm (1) | cols (1) | rows (1) | stars_required (1) | time_limit (u16, 0xFFFF = yok)
+    | arka plan RGB (3) | name, description, hint (u16 uzunluk + UTF-8) | cols x rows uint8 hücre kodu
+"""
+import hashlib
+import os
+import struct
+from config import STARS_TO_WIN
+from Scripts.Utils.Constants import *
+
+MAGIC = b"RVLV"
+VERSION = 1
+LEVEL_EXTENSION = ".txt"   # Level metin dosyası uzantısı
+
+# Hücre kodu (uint8) <-> sembol
+SYMBOLS = (TILE_EMPTY, TILE_DAMAGE, TILE_START, TILE_DOOR, TILE_KEY, TILE_STAR, TILE_ROTATE,
+           TILE_PUSH_RIGHT, TILE_PUSH_LEFT, TILE_PUSH_UP, TILE_PUSH_DOWN)
+SYMBOL_CODES = {symbol: code for code, symbol in enumerate(SYMBOLS)}
+
+NO_TIME_LIMIT = 0xFFFF
+DEFAULT_BACKGROUND = (20, 20, 30)
+
+_HEADER = struct.Struct("<4sBBBBH3B")
+_TEXT_FIELDS = ("name", "description", "hint")
+
+
+# ============================================
+# METİN (Text)
+# ============================================
+
+def parse_level_text(text, source="<level>"):
+    """
+    Level metnini LevelData sözlüğüne çevir
+
+    Args:
+        text (str): Dosya içeriği
+        source (str): Hata mesajları için dosya adı
+
+    Returns:
+        dict: LevelData formatında level
+
+    Raises:
+        ValueError: Bilinmeyen anahtar / sembol veya eksik grid
+    """
+    level = {
+        "name": os.path.splitext(os.path.basename(source))[0],
+        "description": "",
+        "grid": [],
+        "stars_required": STARS_TO_WIN,
+        "time_limit": None,
+        "background_color": DEFAULT_BACKGROUND,
+        "hint": ""
+    }
+    for number, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        if sep and not level["grid"] and key.strip().isidentifier():
+            _set_meta(level, key.strip(), value.strip(), f"{source}:{number}")
+            continue
+        row = line.split() if " " in line else list(line)
+        for cell in row:
+            if cell not in SYMBOL_CODES:
+                raise ValueError(f"❌ {source}:{number}: Unknown tile symbol '{cell}'")
+        level["grid"].append(row)
+
+    if not level["grid"]:
+        raise ValueError(f"❌ {source}: Level has no grid rows")
+    if any(len(row) != len(level["grid"][0]) for row in level["grid"]):
+        raise ValueError(f"❌ {source}: Grid rows have inconsistent length")
+    return level
+
+
+def _set_meta(level, key, value, where):
+    if key in ("name", "description", "hint"):
+        level[key] = value
+    elif key == "stars_required":
+        level[key] = int(value)
+    elif key == "time_limit":
+        level[key] = None if value.lower() in ("", "none") else int(value)
+    elif key == "background_color":
+        level[key] = tuple(int(part) for part in value.split(","))
+    else:
+        raise ValueError(f"❌ {where}: Unknown level field '{key}'")
+
+
+def format_level_text(level):
+    """
+    LevelData sözlüğünü metin formatına çevir (parse_level_text'in tersi)
+
+    Returns:
+        str: Dosya içeriği
+    """
+    time_limit = level.get("time_limit")
+    lines = [
+        f"name: {level.get('name', '')}",
+        f"description: {level.get('description', '')}",
+        f"stars_required: {level.get('stars_required', STARS_TO_WIN)}",
+        f"time_limit: {'none' if time_limit is None else time_limit}",
+        f"background_color: {', '.join(str(c) for c in level.get('background_color', DEFAULT_BACKGROUND))}",
+        f"hint: {level.get('hint', '')}",
+        ""
+    ]
+    lines.extend(" ".join(row) for row in level["grid"])
+    return "\n".join(lines) + "\n"
+
+
+# ============================================
+# İKİLİ FORM (Binary)
+# ============================================
+
+def encode_text_fields(level):
+    """
+    name, description, hint alanları: her biri u16 uzunluk + UTF-8
+
+    Returns:
+        bytes: Ardışık kodlanmış alanlar
+    """
+    out = bytearray()
+    for field in _TEXT_FIELDS:
+        encoded = level.get(field, "").encode("utf-8")
+        out += struct.pack("<H", len(encoded)) + encoded
+    return bytes(out)
+
+
+def decode_text_fields(data, pos, level):
+    """
+    encode_text_fields çıktısını level sözlüğüne oku
+
+    Args:
+        data: bytes / mmap
+        pos (int): Başlangıç konumu
+        level (dict): Alanların yazılacağı sözlük
+
+    Returns:
+        int: Alanlardan sonraki konum
+    """
+    for field in _TEXT_FIELDS:
+        (length,) = struct.unpack_from("<H", data, pos)
+        pos += 2
+        level[field] = bytes(data[pos:pos + length]).decode("utf-8")
+        pos += length
+    return pos
+
+
+def header_fields(level, where="Level"):
+    """
+    İkili başlığa giren alanları doğrula ve kodla (compile_level ve
+    LevelPack.write_pack ortak; ikisi de aynı girdileri reddeder)
+
+    Args:
+        level (dict): LevelData formatında level
+        where (str): Hata mesajları için level adı
+
+    Returns:
+        tuple: (cols, rows, stars_required, time_limit kodu, (r, g, b))
+
+    Raises:
+        ValueError: Grid boş veya 255 hücreden geniş, ya da meta alanları ikili forma sığmıyorsa
+    """
+    grid = level["grid"]
+    if not grid or not grid[0]:
+        raise ValueError(f"❌ {where} has an empty grid")
+    rows = len(grid)
+    cols = len(grid[0])
+    if cols > 255 or rows > 255:
+        raise ValueError(f"❌ {where}: grids are limited to 255x255 (got {cols}x{rows})")
+    stars_required = level.get("stars_required", STARS_TO_WIN)
+    if not 0 <= stars_required <= 255:
+        raise ValueError(f"❌ {where}: stars_required must be 0-255 (got {stars_required})")
+    time_limit = level.get("time_limit")
+    if time_limit is not None and not 0 <= time_limit < NO_TIME_LIMIT:
+        raise ValueError(f"❌ {where}: time_limit must be 0-{NO_TIME_LIMIT - 1} (got {time_limit})")
+    background = tuple(level.get("background_color", DEFAULT_BACKGROUND))
+    if len(background) != 3 or not all(0 <= c <= 255 for c in background):
+        raise ValueError(f"❌ {where}: background_color must be three 0-255 values (got {background})")
+    return cols, rows, stars_required, NO_TIME_LIMIT if time_limit is None else time_limit, background
+
+
+def compile_level(level):
+    """
+    Returns:
+        bytes: Level'ın kompakt ikili hali
+
+    Raises:
+        ValueError: Grid boş, 255 hücreden geniş veya meta alanları ikili forma sığmıyorsa (bkz. header_fields)
+    """
+    cols, rows, stars_required, time_limit, background = header_fields(level, level.get("name") or "Level")
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, cols, rows, stars_required, time_limit, *background))
+    out += encode_text_fields(level)
+    out += bytes(SYMBOL_CODES[cell] for row in level["grid"] for cell in row)
+    return bytes(out)
+
+
+def decode_level(data):
+    """
+    compile_level çıktısını LevelData sözlüğüne çevir
+
+    Raises:
+        ValueError: Bozuk veya farklı sürüm ikili veri
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("❌ Compiled level is truncated")
+    magic, version, cols, rows, stars_required, time_limit, r, g, b = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("❌ Not a compiled ReVerse level (or old version)")
+    level = {
+        "stars_required": stars_required,
+        "time_limit": None if time_limit == NO_TIME_LIMIT else time_limit,
+        "background_color": (r, g, b)
+    }
+    pos = decode_text_fields(data, _HEADER.size, level)
+    cells = data[pos:pos + cols * rows]
+    if len(cells) != cols * rows:
+        raise ValueError("❌ Compiled level grid is truncated")
+    level["grid"] = [[SYMBOLS[code] for code in cells[y * cols:(y + 1) * cols]] for y in range(rows)]
+    return level
+
+
+# ============================================
+# ÖNBELLEKLİ YÜKLEME (Cache)
+# ============================================
+
+def content_hash(raw):
+    """Metin içeriğinin (ve format sürümünün) özeti -> cache dosya adı"""
+    return hashlib.blake2b(raw + bytes((VERSION,)), digest_size=16).hexdigest()
+
+
+def load_level_file(path, cache_dir=None):
+    """
+    Level dosyasını yükle: içerik hash'i cache'te varsa ikili formdan oku,
+    yoksa metni parse edip derle ve cache'e yaz
+
+    Args:
+        path (str): Level metin dosyası
+        cache_dir (str): Derlenmiş levellerin klasörü (None = cache yok)
+
+    Returns:
+        tuple: (level dict, "cache" | "parsed")
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    cache_path = os.path.join(cache_dir, content_hash(raw) + ".rvl") if cache_dir else None
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return decode_level(f.read()), "cache"
+        except (OSError, ValueError):
+            pass  # Bozuk cache -> yeniden derle
+
+    level = parse_level_text(raw.decode("utf-8"), source=path)
+    if cache_path:
+        try:
+            compiled = compile_level(level)
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(compiled)
+            os.replace(temp_path, cache_path)  # Yarım yazılmış cache okunmasın
+        except (OSError, ValueError) as e:
+            # İkili forma sığmayan level (ör. 255'ten geniş grid) metinden yüklenmeye devam eder
+            print(f"⚠️ Level cache not written ({cache_path}): {e}")
+    return level, "parsed"
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import tempfile
+
+    print("=== LevelFormat Test ===\n")
+    sample = parse_level_text(
+        "name: Sample\nstars_required: 1\ntime_limit: 90\n\nS . *\nX K D\n", source="sample.txt"
+    )
+    blob = compile_level(sample)
+    print(f"Sample: {len(blob)} bytes -> {decode_level(blob)}")
+    print(f"Round trip: {'✅' if decode_level(blob) == sample else '❌'}")
+    print(f"Text round trip: {'✅' if parse_level_text(format_level_text(sample)) == sample else '❌'}")
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "sample.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(format_level_text(sample))
+    first = load_level_file(path, os.path.join(folder, "cache"))
+    second = load_level_file(path, os.path.join(folder, "cache"))
+    print(f"Loads: {first[1]} -> {second[1]} | Same: {'✅' if first[0] == second[0] else '❌'}")
+
+    wide = os.path.join(folder, "wide.txt")
+    with open(wide, "w", encoding="utf-8") as f:
+        f.write(format_level_text(dict(sample, grid=[["."] * 300, ["S"] + ["."] * 299])))
+    level, source = load_level_file(wide, os.path.join(folder, "cache"))
+    print(f"300-wide grid: {source} ({len(level['grid'][0])} cols, not cached)")
+    print("\n=== Test Complete ===")
@@ -0,0 +1,240 @@
+"""
+ReVerse - Level Generator
+Mevcut sembol diliyle rastgele level üretir; her aday validate_grid,
+yapısal kontroller ve solver (çözülebilirlik + en kısa hamle hedefi)
+geçerse kabul edilir. Deterministik seed'ler, process pool.
+"""
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from Scripts.Utils.Constants import *
+from Scripts.Core import Rules
+from Levels.LevelSolver import METHOD_BFS
+from Levels.LevelValidator import mirror_level, validate_level
+from Levels.LevelPack import PACK_EXTENSION, write_pack
+
+# Zorluk hedefleri: yoğunluklar (boş hücre başına olasılık) ve kabul edilen en kısa çözüm aralığı
+DIFFICULTIES = {
+    "easy": {"damage": 0.15, "arrows": 0.08, "min_moves": 8, "max_moves": 18},
+    "normal": {"damage": 0.25, "arrows": 0.12, "min_moves": 14, "max_moves": 26},
+    "hard": {"damage": 0.35, "arrows": 0.15, "min_moves": 20, "max_moves": 40}
+}
+
+DEFAULT_COLS = 6
+DEFAULT_ROWS = 5
+DEFAULT_MAX_STATES = 200_000  # Aday başına solver sınırı (aşılırsa aday reddedilir)
+DEFAULT_MAX_ATTEMPTS = 500    # Level başına en fazla aday
+
+_ARROWS = tuple(Rules.ARROW_DIRECTIONS)
+
+
+class GenerationTarget:
+    """Üretim parametreleri (boyut, sembol sayıları, yoğunluklar, zorluk hedefi)"""
+
+    def __init__(self, difficulty="normal", cols=DEFAULT_COLS, rows=DEFAULT_ROWS, stars=2,
+                 stars_required=2, rotates=2, max_states=DEFAULT_MAX_STATES,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, **overrides):
+        """
+        Args:
+            difficulty (str): DIFFICULTIES anahtarı (yoğunluk ve hamle aralığı varsayılanları)
+            cols, rows (int): Grid boyutu
+            stars (int): Yıldız sayısı
+            stars_required (int): Kapı için gereken yıldız
+            rotates (int): Rotate sembolü sayısı (anahtar sadece ayna levelde çıkar)
+            overrides: damage, arrows, min_moves, max_moves değerlerini ezer
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        preset = dict(DIFFICULTIES[difficulty], **overrides)
+        self.difficulty = difficulty
+        self.cols = cols
+        self.rows = rows
+        self.stars = stars
+        self.stars_required = stars_required
+        self.rotates = rotates
+        self.damage = preset["damage"]
+        self.arrows = preset["arrows"]
+        self.min_moves = preset["min_moves"]
+        self.max_moves = preset["max_moves"]
+        self.max_states = max_states
+        self.max_attempts = max_attempts
+
+        fixed = 3 + stars + rotates  # S, D, K + yıldızlar + rotate'ler
+        if fixed > cols * rows:
+            raise ValueError(f"❌ {cols}x{rows} grid is too small for {fixed} fixed symbols")
+
+    def to_dict(self):
+        """JSON / pickle için"""
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict çıktısından (worker process'te) yeniden oluştur"""
+        data = dict(data)
+        return cls(data.pop("difficulty"), data.pop("cols"), data.pop("rows"), data.pop("stars"),
+                   data.pop("stars_required"), data.pop("rotates"), data.pop("max_states"),
+                   data.pop("max_attempts"), **data)
+
+
+# ============================================
+# ADAY ÜRETİMİ (Sampling)
+# ============================================
+
+def random_grid(rng, target):
+    """
+    Tek aday grid
+
+    Args:
+        rng (random.Random): Deterministik üreteç
+        target (GenerationTarget): Parametreler
+
+    Returns:
+        list: 2D sembol listesi
+    """
+    cells = [(gx, gy) for gy in range(target.rows) for gx in range(target.cols)]
+    rng.shuffle(cells)
+    grid = [[TILE_EMPTY] * target.cols for _ in range(target.rows)]
+
+    fixed = [TILE_START, TILE_DOOR, TILE_KEY] + [TILE_ROTATE] * target.rotates + [TILE_STAR] * target.stars
+    for symbol, (gx, gy) in zip(fixed, cells):
+        grid[gy][gx] = symbol
+    for gx, gy in cells[len(fixed):]:
+        roll = rng.random()
+        if roll < target.damage:
+            grid[gy][gx] = TILE_DAMAGE
+        elif roll < target.damage + target.arrows:
+            grid[gy][gx] = rng.choice(_ARROWS)
+    return grid
+
+
+def level_seed(seed, index):
+    """Level indeksinin deterministik seed'i (process / job sayısından bağımsız)"""
+    return f"reverse-gen:{seed}:{index}"
+
+
+def generate_level(job):
+    """
+    Kabul edilen ilk adayı bul (ProcessPoolExecutor worker'ı)
+
+    Args:
+        job (tuple): (level indeksi, ana seed, GenerationTarget dict'i)
+
+    Returns:
+        dict: {"index", "attempts", "elapsed", "level" (veya None), "rejections"}
+    """
+    index, seed, target_data = job
+    target = GenerationTarget.from_dict(target_data)
+    rng = random.Random(level_seed(seed, index))
+    started = time.perf_counter()
+    rejections = {}
+
+    for attempt in range(1, target.max_attempts + 1):
+        level = {
+            "name": f"Generated #{index}",
+            "description": f"{target.difficulty.capitalize()} {target.cols}x{target.rows} (seed {seed})",
+            "grid": random_grid(rng, target),
+            "stars_required": target.stars_required,
+            "time_limit": None,
+            "background_color": (20, 20, 30),
+            "hint": "Collect stars, rotate the world and find the key!"
+        }
+        report = validate_level((index, {1: level, 2: mirror_level(level)}, 1, METHOD_BFS, target.max_states))
+        if not report["ok"]:
+            reason = report["status"]
+        elif report["moves"] < target.min_moves:
+            reason = "too_easy"
+        elif report["moves"] > target.max_moves:
+            reason = "too_hard"
+        else:
+            level["optimal_moves"] = report["moves"]
+            level["solution"] = report["actions"]
+            level["seed"] = level_seed(seed, index)
+            return {"index": index, "attempts": attempt, "elapsed": round(time.perf_counter() - started, 3),
+                    "level": level, "rejections": rejections}
+        rejections[reason] = rejections.get(reason, 0) + 1
+
+    return {"index": index, "attempts": target.max_attempts, "elapsed": round(time.perf_counter() - started, 3),
+            "level": None, "rejections": rejections}
+
+
+# ============================================
+# TOPLU ÜRETİM (Batch)
+# ============================================
+
+def generate_pack(count, target=None, seed=0, workers=None, first_index=1):
+    """
+    count adet doğrulanmış level üret
+
+    Args:
+        count (int): Level sayısı
+        target (GenerationTarget): Parametreler (None = normal)
+        seed (int): Ana seed (aynı seed + parametreler -> aynı paket)
+        workers (int): Process sayısı (None = CPU sayısı, 1 = aynı process)
+        first_index (int): İlk level indeksi (paketleri parça parça üretmek için)
+
+    Returns:
+        dict: {"generator": parametreler, "summary": {...}, "levels": [...]}
+              (levels, LevelValidator.load_pack ile okunabilir)
+    """
+    target = target or GenerationTarget()
+    jobs = [(index, seed, target.to_dict()) for index in range(first_index, first_index + count)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [generate_level(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate_level, jobs, chunksize=1))
+
+    levels = [result["level"] for result in results if result["level"] is not None]
+    rejections = {}
+    for result in results:
+        for reason, number in result["rejections"].items():
+            rejections[reason] = rejections.get(reason, 0) + number
+    return {
+        "generator": dict(target.to_dict(), seed=seed, first_index=first_index),
+        "summary": {
+            "requested": count,
+            "accepted": len(levels),
+            "failed": [result["index"] for result in results if result["level"] is None],
+            "attempts": sum(result["attempts"] for result in results),
+            "rejections": rejections,
+            "jobs": workers,
+            "elapsed": round(time.perf_counter() - started, 3)
+        },
+        "levels": levels
+    }
+
+
+def save_pack(pack, path):
+    """
+    Üretilen paketi kaydet (main.py validate --pack ile doğrulanabilir)
+    .rvpk uzantısı = mmap'li ikili paket (sadece leveller), diğerleri JSON (özet + çözümler)
+    """
+    if path.endswith(PACK_EXTENSION):
+        write_pack(pack["levels"], path)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(pack, f, indent=1, ensure_ascii=False)
+        f.write("\n")
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    print("=== LevelGenerator Test ===\n")
+    pack = generate_pack(3, GenerationTarget("easy"), seed=42, workers=1)
+    print(f"Summary: {pack['summary']}")
+    for level in pack["levels"]:
+        print(f"\n{level['name']} - {level['optimal_moves']} moves")
+        for i, row in enumerate(level["grid"]):
+            print(f"  Row {chr(65+i)}: {' '.join(row)}")
+
+    again = generate_pack(3, GenerationTarget("easy"), seed=42, workers=2)
+    same = [l["grid"] for l in again["levels"]] == [l["grid"] for l in pack["levels"]]
+    print(f"\nDeterministic across job counts: {'✅' if same else '❌'}")
+    print("\n=== Test Complete ===")
@@ -3,20 +3,211 @@ ReVerse - Level Loader
 Unity LevelManager benzeri harita yükleme sistemi
 """
 import pygame
-from config import GRID_SIZE, STARS_TO_WIN
+from collections import OrderedDict
+from config import GRID_SIZE, STARS_TO_WIN, BG_COLOR, GRID_LINE_COLOR, SHOW_GRID, LEVEL_BUILD_CACHE_SIZE
 from Scripts.Utils.Constants import *
-from Scripts.Entities.Tile import TileFactory
-from Scripts.Entities.Collectible import CollectibleFactory
+from Scripts.Entities.Tile import Tile, TileFactory
+from Scripts.Entities.Collectible import CollectibleFactory, Key
+from Scripts.Systems.PrefabPool import PrefabPool
+from Scripts.Systems.ChunkCache import ChunkCache
 from Scripts.Core.Player import Player
 
+class CellIndex:
+    """
+    Hücre başına tile / collectible / trigger (rotate sembolü) indeksi.
+    Level yüklenirken kurulur; çizim tüm listeleri taramak yerine sadece
+    kamera alanındaki hücrelere bakar (tiles_in, *_touching). Oynanış
+    kontrolleri GameState'in kendi hücre kümelerini kullanır.
+    Sadece aktif (toplanmamış / tüketilmemiş) objeler indekste tutulur.
+    """
+    
+    def __init__(self, width=0, height=0, cell_size=GRID_SIZE):
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self._tiles = [None] * (width * height)
+        self._collectibles = [[] for _ in range(width * height)]
+        self._triggers = [None] * (width * height)
+    
+    def _slot(self, gx, gy):
+        """Hücrenin düz liste indeksi (harita dışıysa -1)"""
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            return gy * self.width + gx
+        return -1
+    
+    def _slot_of(self, obj):
+        return self._slot(obj.x // self.cell_size, obj.y // self.cell_size)
+    
+    # Tiles
+    def set_tile(self, tile):
+        slot = self._slot_of(tile)
+        if slot >= 0:
+            self._tiles[slot] = tile
+    
+    # Collectibles
+    def add_collectible(self, item):
+        slot = self._slot_of(item)
+        if slot >= 0 and item not in self._collectibles[slot]:
+            self._collectibles[slot].append(item)
+    
+    def remove_collectible(self, item):
+        slot = self._slot_of(item)
+        if slot >= 0 and item in self._collectibles[slot]:
+            self._collectibles[slot].remove(item)
+    
+    # Triggers (rotate sembolleri)
+    def add_trigger(self, symbol):
+        slot = self._slot_of(symbol)
+        if slot >= 0:
+            self._triggers[slot] = symbol
+    
+    def remove_trigger(self, symbol):
+        slot = self._slot_of(symbol)
+        if slot >= 0 and self._triggers[slot] is symbol:
+            self._triggers[slot] = None
+    
+    # Rect sorguları
+    def cells_touching(self, rect):
+        """
+        Rect'in değdiği hücreler (satır sırasıyla, level tarama sırası ile aynı)
+        
+        Args:
+            rect: pygame.Rect (dünya koordinatı)
+        
+        Returns:
+            list: (gx, gy) listesi
+        """
+        size = self.cell_size
+        gx0 = max(0, rect.left // size)
+        gx1 = min(self.width - 1, (rect.right - 1) // size)
+        gy0 = max(0, rect.top // size)
+        gy1 = min(self.height - 1, (rect.bottom - 1) // size)
+        return [(gx, gy) for gy in range(gy0, gy1 + 1) for gx in range(gx0, gx1 + 1)]
+    
+    def cell_range(self, rect):
+        """
+        Rect'in kapsadığı hücre aralığı (harita sınırlarına kırpılmış)
+
+        Returns:
+            tuple: (gx0, gy0, gx1, gy1), dahil; boşsa gx0 > gx1 veya gy0 > gy1
+        """
+        size = self.cell_size
+        return (max(0, rect.left // size), max(0, rect.top // size),
+                min(self.width - 1, (rect.right - 1) // size), min(self.height - 1, (rect.bottom - 1) // size))
+
+    def tiles_in(self, rect):
+        """Rect'in değdiği hücrelerdeki tile'lar (satır sırasıyla; görünür alan çizimi için)"""
+        gx0, gy0, gx1, gy1 = self.cell_range(rect)
+        tiles = self._tiles
+        found = []
+        for gy in range(gy0, gy1 + 1):
+            row = gy * self.width
+            found.extend(tile for tile in tiles[row + gx0:row + gx1 + 1] if tile is not None)
+        return found
+    
+    def collectibles_touching(self, rect):
+        """Rect'in değdiği hücrelerdeki aktif collectible'lar (görünür alan çizimi için)"""
+        found = []
+        for gx, gy in self.cells_touching(rect):
+            found.extend(self._collectibles[gy * self.width + gx])
+        return found
+    
+    def triggers_touching(self, rect):
+        """Rect'in değdiği hücrelerdeki aktif rotate sembolleri (tarama sırasıyla)"""
+        found = []
+        for gx, gy in self.cells_touching(rect):
+            symbol = self._triggers[gy * self.width + gx]
+            if symbol is not None:
+                found.append(symbol)
+        return found
+
+
+class BuiltLevel:
+    """
+    Bir kez oluşturulmuş level örneği: entity'ler + başlangıç (pristine) durumu.
+    LevelLoader level id'si ile önbellekte tutar; aynı level tekrar yüklendiğinde
+    objeler yeniden oluşturulmaz, restore() ile başlangıç haline döndürülür.
+    """
+
+    def __init__(self, level_data, loader):
+        """
+        Args:
+            level_data (dict): Level verisi (değişirse önbellek geçersiz)
+            loader (LevelLoader): Objeleri yeni oluşturmuş loader
+        """
+        self.level_data = level_data
+        self.tiles = loader.tiles
+        self.collectibles = list(loader.collectibles)  # Sonradan spawn olan anahtar hariç
+        self.rotation_symbols = loader.rotation_symbols
+        self.player = loader.player
+        self.door = loader.door
+        self.start_position = loader.start_position
+        self.grid_width = loader.grid_width
+        self.grid_height = loader.grid_height
+        self.key_spawn_point = loader.key_spawn_point
+        self.layout_id = loader.layout_id
+        # Rotasyonla değişebilen tile durumu (konum + ok yönü)
+        self._tile_state = [(tile, tile.x, tile.y, getattr(tile, 'direction', None)) for tile in self.tiles]
+
+    def restore(self):
+        """
+        Tüm objeleri level ilk yüklendiğindeki haline döndür (sprite yükleme yok)
+        
+        Returns:
+            list: Görünümü değişen tile hücreleri (gx, gy); statik katman parçaları geçersiz olur
+        """
+        changed = []
+        for tile, x, y, direction in self._tile_state:
+            if tile.x != x or tile.y != y:
+                changed.append((tile.x // tile.size, tile.y // tile.size))
+                tile.x, tile.y = x, y
+                tile.rect.topleft = (x, y)
+                changed.append((x // tile.size, y // tile.size))
+            if direction is not None and tile.direction != direction:
+                tile.direction = direction
+                tile.refresh_sprite()
+                changed.append((x // tile.size, y // tile.size))
+        for item in self.collectibles:
+            item.collected = False
+            if hasattr(item, 'is_open'):
+                item.is_open = False
+        for sym in self.rotation_symbols:
+            sym.consumed = False
+            sym.activated = False
+            sym.flip_lr = False
+            sym.rotation_angle = 0
+        self.player.reinit(*self.start_position)
+        self.player.required_stars = self.level_data.get("stars_required", STARS_TO_WIN)
+        return changed
+
+
 class LevelLoader:
     """
     Harita verilerini alıp oyun objelerini oluşturur
     Unity Scene Loader benzeri
+    Oluşturulan leveller id ile önbelleklenir (rotate geçişleri ve reset'ler objeleri yeniden kurmaz)
     """
     
-    def __init__(self, grid_size=GRID_SIZE):
+    def __init__(self, grid_size=GRID_SIZE, clock=None):
+        """
+        Args:
+            grid_size (int): Hücre boyutu (piksel)
+            clock: GameClock (collectible animasyonları bu saatle ilerler)
+        """
         self.grid_size = grid_size
+        self.clock = clock
+        # Statik katman (grid + tile'lar) versiyonu; tile düzeni değişince artar
+        self.static_version = 0
+        # Oluşturulmuş level örnekleri (level id -> BuiltLevel, LRU; aktif level atılmaz)
+        self._built = OrderedDict()
+        self.build_cache_size = LEVEL_BUILD_CACHE_SIZE
+        # Entity havuzu: spawn (anahtar) ve önbelleksiz yeniden yüklemeler constructor çağırmaz
+        self.pool = PrefabPool()
+        self._spawned = []  # Aktif levele sonradan eklenen objeler (havuza geri döner)
+        # Statik tile katmanı parçaları (layout_id: her oluşturulan level örneğinin kimliği)
+        self.chunks = ChunkCache(grid_size)
+        self._next_layout_id = 0
+        self.layout_id = None
         self.reset()
     
     def reset(self):
@@ -31,17 +222,55 @@ class LevelLoader:
         self.grid_height = 0
         # Anahtar doğrudan eklenmeyecek; yıldızlar tamamlanınca spawn edilecek
         self.key_spawn_point = None  # (x, y, size)
+        self._active_built = None  # Aktif level önbellekte değilse objeleri havuza döner
+        # Hücre indeksi (load_level sonunda kurulur)
+        self.cells = CellIndex(0, 0, self.grid_size)
+        self._updating_tiles = []  # update() metodu boş olmayan tile'lar
+        self._reported = []        # get_dynamic_rects'in son bildirdiği görünür objeler
+        self.layout_id = self._next_layout_id
+        self._next_layout_id += 1
+        self.invalidate_static()
     
-    def load_level(self, level_data):
+    def invalidate_static(self):
+        """
+        Tile düzeni değişti (level yükleme, rotasyon); önbelleklenmiş
+        statik katman bir sonraki çizimde yeniden oluşturulmalı
+        """
+        self.static_version += 1
+    
+    def invalidate_tiles(self, tiles):
+        """
+        Sadece verilen tile'ların (veya (gx, gy) hücrelerinin) parçalarını yeniden çizdir
+        
+        Args:
+            tiles (iterable): Tile objeleri veya (gx, gy) çiftleri
+        """
+        size = self.grid_size
+        cells = [tile if isinstance(tile, tuple) else (tile.x // size, tile.y // size) for tile in tiles]
+        self.chunks.invalidate_cells(self.layout_id, cells)
+        self.static_version += 1
+    
+    def load_level(self, level_data, level_id=None):
         """
         Level verilerini yükle ve objeleri oluştur
         
         Args:
             level_data (dict): LevelData.get_level() tarafından dönen veri
+            level_id: Önbellek anahtarı (None = önbelleksiz, her seferinde oluştur)
             
         Returns:
             dict: Oluşturulan tüm oyun objeleri
         """
+        self._release_active()
+        built = self._built.get(level_id) if level_id is not None else None
+        if built is not None and built.level_data == level_data:
+            self._built.move_to_end(level_id)
+            changed = built.restore()
+            self._activate(built)
+            self.invalidate_tiles(changed)
+            print(f"♻️ Level '{level_data['name']}' restored from cache")
+            return self.get_level_objects()
+        
         self.reset()
         
         grid = level_data["grid"]
@@ -61,13 +290,14 @@ class LevelLoader:
                 y = row_idx * self.grid_size
                 
                 # Tile oluştur
-                tile = TileFactory.create_tile(symbol, x, y, self.grid_size)
+                tile = TileFactory.create_tile(symbol, x, y, self.grid_size, self.pool)
                 if tile:
                     self.tiles.append(tile)
                 
                 # Collectible oluştur
-                collectible = CollectibleFactory.create_collectible(symbol, x, y, self.grid_size)
+                collectible = CollectibleFactory.create_collectible(symbol, x, y, self.grid_size, self.pool)
                 if collectible:
+                    collectible.clock = self.clock
                     if symbol == TILE_DOOR:
                         # Kapı bir collectible olarak kalır
                         self.door = collectible
@@ -76,8 +306,9 @@ class LevelLoader:
                         # RotateSymbol collectible değildir; ayrı listede tutulur
                         self.rotation_symbols.append(collectible)
                     elif symbol == TILE_KEY:
-                        # Anahtarı hemen eklemek yerine konumunu kaydet
+                        # Anahtarı hemen eklemek yerine konumunu kaydet; obje spawn için havuzda bekler
                         self.key_spawn_point = (x, y, self.grid_size)
+                        self.pool.release(collectible)
                     else:
                         # Yıldız ve Anahtar gibi toplanabilirler
                         self.collectibles.append(collectible)
@@ -89,6 +320,9 @@ class LevelLoader:
                     self.player = Player(x, y, self.grid_size)
                     self.player.required_stars = level_data.get("stars_required", STARS_TO_WIN)
         
+        # Hücre indeksini kur
+        self.rebuild_index()
+        
         # İstatistikler
         print(f"✅ Tiles: {len(self.tiles)}")
         print(f"✅ Collectibles: {len(self.collectibles)}")
@@ -103,8 +337,77 @@ class LevelLoader:
         if not self.door:
             raise ValueError("❌ Level must have a Door (D)!")
         
+        if level_id is not None:
+            stale = self._built.pop(level_id, None)  # Level verisi değişmiş eski örnek
+            if stale is not None:
+                self._discard_built(stale)
+            self._active_built = self._built[level_id] = BuiltLevel(level_data, self)
+            self._trim_built()
         return self.get_level_objects()
     
+    def warm_up(self, levels):
+        """
+        Levelleri önceden oluştur ve önbellekle (oyun ortasında ilk geçiş de objeleri kurmaz)
+        
+        Args:
+            levels (dict): level id -> level verisi
+        """
+        key_sizes = {}
+        for level_id, level_data in levels.items():
+            if level_id not in self._built:
+                self.load_level(level_data, level_id)
+            spawn_point = self._built[level_id].key_spawn_point
+            if spawn_point is not None:
+                key_sizes[spawn_point[2]] = key_sizes.get(spawn_point[2], 0) + 1
+        # Her level'ın spawn olacak anahtarı havuzda hazır beklesin
+        for size, count in key_sizes.items():
+            self.pool.warm(Key, size, count)
+        print(f"🔥 Warmed up {len(levels)} levels | {self.pool}")
+    
+    def _trim_built(self):
+        """Önbellek kapasiteyi aştıysa en eski level örneklerini at (aktif olan hariç)"""
+        for level_id in list(self._built):
+            if len(self._built) <= self.build_cache_size:
+                break
+            built = self._built[level_id]
+            if built is not self._active_built:
+                del self._built[level_id]
+                self._discard_built(built)
+    
+    def _discard_built(self, built):
+        """Önbellekten çıkan level örneğinin objelerini havuza, parçalarını bellekten bırak"""
+        self.chunks.invalidate_layout(built.layout_id)
+        self.pool.release_all(built.tiles)
+        self.pool.release_all(built.collectibles)
+        self.pool.release_all(built.rotation_symbols)
+    
+    def _release_active(self):
+        """Sonradan eklenenleri (ve önbellekte olmayan level'ın objelerini) havuza geri ver"""
+        spawned = self._spawned
+        self._spawned = []
+        self.pool.release_all(spawned)
+        if self._active_built is None:
+            self.chunks.invalidate_layout(self.layout_id)  # Bu tile düzeni bir daha çizilmeyecek
+            self.pool.release_all(self.tiles)
+            self.pool.release_all(item for item in self.collectibles if item not in spawned)
+            self.pool.release_all(self.rotation_symbols)
+    
+    def _activate(self, built):
+        """Önbellekteki level'ı aktif yap (liste kopyası: spawn olan anahtar önbelleğe girmez)"""
+        self._active_built = built
+        self.tiles = built.tiles
+        self.collectibles = list(built.collectibles)
+        self.rotation_symbols = built.rotation_symbols
+        self.player = built.player
+        self.door = built.door
+        self.start_position = built.start_position
+        self.grid_width = built.grid_width
+        self.grid_height = built.grid_height
+        self.key_spawn_point = built.key_spawn_point
+        self.layout_id = built.layout_id
+        self.rebuild_index()
+        self.invalidate_static()
+    
     def get_level_objects(self):
         """
         Yüklenmiş tüm objeleri döndür
@@ -123,6 +426,55 @@ class LevelLoader:
             "key_spawn_point": self.key_spawn_point
         }
     
+    def rebuild_index(self):
+        """Hücre indeksini mevcut objelerden yeniden kur (sadece aktif objeler)"""
+        self.cells = CellIndex(self.grid_width, self.grid_height, self.grid_size)
+        for tile in self.tiles:
+            self.cells.set_tile(tile)
+        for item in self.collectibles:
+            if not getattr(item, 'collected', False):
+                self.cells.add_collectible(item)
+        for sym in self.rotation_symbols:
+            if not getattr(sym, 'consumed', False):
+                self.cells.add_trigger(sym)
+        self._updating_tiles = [tile for tile in self.tiles if type(tile).update is not Tile.update]
+    
+    def add_collectible(self, item):
+        """
+        Sonradan sahneye eklenen collectible (ör. spawn olan anahtar)
+        
+        Args:
+            item: Collectible objesi
+        """
+        item.clock = self.clock
+        self.collectibles.append(item)
+        self.cells.add_collectible(item)
+        self._spawned.append(item)
+    
+    def spawn_key(self, spawn_point):
+        """
+        Anahtarı havuzdan al ve sahneye ekle (constructor / sprite yükleme yok)
+        
+        Args:
+            spawn_point (tuple): (x, y, size) - key_spawn_point
+        
+        Returns:
+            Key
+        """
+        x, y, size = spawn_point
+        key = self.pool.acquire(Key, x, y, size)
+        self.add_collectible(key)
+        return key
+    
+    def mark_collected(self, item):
+        """Collectible'ı toplanmış say ve indeksten çıkar"""
+        item.collected = True
+        self.cells.remove_collectible(item)
+    
+    def disable_trigger(self, symbol):
+        """Rotate sembolünü indeksten çıkar (tüketildi / bu levelde kullanılamaz)"""
+        self.cells.remove_trigger(symbol)
+    
     def get_pushable_tiles(self):
         """
         İtici üçgen tile'ları döndür (Rotation için)
@@ -133,20 +485,92 @@ class LevelLoader:
         from Scripts.Entities.Tile import PushTriangle
         return [tile for tile in self.tiles if isinstance(tile, PushTriangle)]
     
+    def view_rect(self, screen, camera_offset=(0, 0)):
+        """
+        Kameranın gördüğü dünya bölgesi (screen boyutunda, camera_offset'ten başlayan)
+        
+        Returns:
+            pygame.Rect: Dünya koordinatında görünür alan
+        """
+        width, height = screen.get_size()
+        return pygame.Rect(camera_offset[0], camera_offset[1], width, height)
+    
+    def visible_dynamic(self, screen, camera_offset=(0, 0)):
+        """
+        Kamera alanındaki aktif collectible ve rotate sembolleri (hücre indeksinden;
+        toplanmış / tüketilmiş objeler zaten çizilmez). Sprite taşmaları (zıplama,
+        padding) için alan bir hücre genişletilir.
+        
+        Returns:
+            tuple: (collectible listesi, rotate sembolü listesi)
+        """
+        view = self.view_rect(screen, camera_offset).inflate(self.grid_size * 2, self.grid_size * 2)
+        return self.cells.collectibles_touching(view), self.cells.triggers_touching(view)
+    
     def draw_all(self, screen, camera_offset=(0, 0)):
         """
-        Tüm objeleri çiz
+        Kamera alanındaki objeleri çiz (dışarıdakiler atlanır)
         
         Args:
             screen: Pygame surface
             camera_offset: Kamera kayması
         """
-        # Tile'ları çiz
-        for tile in self.tiles:
+        self.draw_tiles(screen, camera_offset)
+        self.draw_dynamic(screen, camera_offset)
+    
+    def draw_tiles(self, screen, camera_offset=(0, 0)):
+        """
+        Sadece statik tile'ları çiz (statik katman önbelleği için)
+        Görünür hücre aralığı indeksten alınır: maliyet level değil ekran boyutuyla orantılı
+        
+        Args:
+            screen: Pygame surface
+            camera_offset: Kamera kayması
+        """
+        for tile in self.cells.tiles_in(self.view_rect(screen, camera_offset)):
             tile.draw(screen, camera_offset)
+    
+    def draw_static(self, screen, camera_offset=(0, 0)):
+        """
+        Arka plan, grid çizgileri ve tile'lar: görünür parçalar önbellekten blit edilir,
+        eksik / geçersiz parçalar ilk göründüklerinde bir kez çizilir
+        
+        Args:
+            screen: Görüş alanı boyutunda surface
+            camera_offset: Kamera kayması
+        """
+        self.chunks.draw(screen, camera_offset, self.layout_id, self.get_level_bounds(), self._paint_chunk)
+    
+    def _paint_chunk(self, surface, world):
+        """
+        Tek parçayı çiz
+        
+        Args:
+            surface: Parça surface'i (world boyutunda)
+            world: Parçanın dünya koordinatındaki rect'i
+        """
+        surface.fill(BG_COLOR)
+        if SHOW_GRID:
+            width, height = surface.get_size()
+            size = self.grid_size
+            for x in range(-(world.x % size), width, size):
+                pygame.draw.line(surface, GRID_LINE_COLOR, (x, 0), (x, height), 1)
+            for y in range(-(world.y % size), height, size):
+                pygame.draw.line(surface, GRID_LINE_COLOR, (0, y), (width, y), 1)
+        self.draw_tiles(surface, world.topleft)
+    
+    def draw_dynamic(self, screen, camera_offset=(0, 0)):
+        """
+        Her frame değişebilen objeleri çiz (collectible, kapı, rotate, player)
+        
+        Args:
+            screen: Pygame surface
+            camera_offset: Kamera kayması
+        """
+        items, symbols = self.visible_dynamic(screen, camera_offset)
         
         # Collectible'ları çiz (Door için player bilgisi ver)
-        for item in self.collectibles:
+        for item in items:
             if hasattr(item, 'draw'):
                 # Door için player parametresi ekle
                 if item.__class__.__name__ == 'Door':
@@ -155,7 +579,7 @@ class LevelLoader:
                     item.draw(screen, camera_offset)
 
         # Rotation sembollerini çiz
-        for sym in self.rotation_symbols:
+        for sym in symbols:
             if hasattr(sym, 'draw'):
                 sym.draw(screen, camera_offset)
         
@@ -163,6 +587,37 @@ class LevelLoader:
         if self.player:
             self.player.draw(screen, camera_offset)
     
+    def get_dynamic_rects(self, camera_offset=(0, 0), screen=None):
+        """
+        Dinamik objelerin bu frame çizildiği bölgeler (dirty rect için)
+        
+        Args:
+            camera_offset: Kamera kayması
+            screen: Çizim yapılan surface (verilirse kamera dışındaki objeler None döner)
+        
+        Returns:
+            list: (obje, pygame.Rect veya None, içerik imzası) üçlüleri
+                  (imza: bölge aynı kalıp görünüm değişirse, ör. kapı açılınca)
+        """
+        if screen is None:
+            objects = self.collectibles + self.rotation_symbols
+        else:
+            items, symbols = self.visible_dynamic(screen, camera_offset)
+            objects = items + symbols
+        regions = []
+        for obj in objects:
+            if hasattr(obj, 'get_dirty_rect'):
+                token = obj.dirty_token(self.player) if hasattr(obj, 'dirty_token') else None
+                regions.append((obj, obj.get_dirty_rect(camera_offset), token))
+        if screen is not None:
+            # Önceki frame görünüp artık çizilmeyenler (kamera dışı, toplandı): eski bölgeleri temizlensin
+            current = set(map(id, objects))
+            regions.extend((obj, None, None) for obj in self._reported if id(obj) not in current)
+            self._reported = objects
+        if self.player:
+            regions.append((self.player, self.player.get_dirty_rect(camera_offset), None))
+        return regions
+    
     def update_all(self, dt):
         """
         Tüm objeleri güncelle
@@ -170,8 +625,8 @@ class LevelLoader:
         Args:
             dt: Delta time
         """
-        # Tile'ları güncelle
-        for tile in self.tiles:
+        # Tile'ları güncelle (sadece update'i boş olmayanlar; büyük levellerde binlerce no-op çağrı yok)
+        for tile in self._updating_tiles:
             tile.update(dt)
         
         # Collectible'ları güncelle (animasyon için)
@@ -184,26 +639,6 @@ class LevelLoader:
             if hasattr(sym, 'update'):
                 sym.update(dt)
     
-    def reset_level(self):
-        """Level'i baştan başlat"""
-        if self.player and self.start_position:
-            self.player.reset(*self.start_position)
-        
-        # Collectible'ları sıfırla
-        for item in self.collectibles:
-            if hasattr(item, 'collected'):
-                item.collected = False
-            if hasattr(item, 'is_open'):
-                item.is_open = False
-        # Rotate sembollerini sıfırla (tüketim/aktivasyon)
-        for sym in self.rotation_symbols:
-            if hasattr(sym, 'consumed'):
-                sym.consumed = False
-            if hasattr(sym, 'activated'):
-                sym.activated = False
-        
-        print("🔄 Level reset!")
-    
     def get_level_bounds(self):
         """
         Level sınırlarını döndür (kamera için)
@@ -242,6 +677,13 @@ if __name__ == "__main__":
         bounds = loader.get_level_bounds()
         print(f"\n📐 Level Bounds: {bounds[0]}x{bounds[1]} pixels")
         
+        # Önbellek: aynı id ile ikinci yükleme aynı objeleri başlangıç haline döndürür
+        first = loader.load_level(level_data, level_id=1)
+        first["collectibles"][0].collected = True
+        again = loader.load_level(level_data, level_id=1)
+        reused = again["player"] is first["player"] and not again["collectibles"][0].collected
+        print(f"♻️ Cached reload reuses pristine objects: {'✅' if reused else '❌'}")
+        
     except Exception as e:
         print(f"\n❌ Error: {e}")
     
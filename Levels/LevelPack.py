@@ -0,0 +1,251 @@
+"""
+ReVerse - Level Pack
+Binlerce level için tek dosyalık, mmap ile açılan paket formatı.
+Açılış sadece başlığı okur; level'lar istendikçe tek tek decode edilir ve
+küçük bir LRU'da tutulur, böylece bellek paket boyutundan bağımsız kalır.
+
+Dosya formatı (little-endian):
+    başlık  : MAGIC (4) | sürüm (1) | max cols (1) | max rows (1) | boş (1)
+              | level sayısı (u32) | index (u32) | gridler (u32) | metinler (u32)   -> 24 bayt
+    index   : level başına sabit 14 bayt: cols | rows | stars_required | boş
+              | time_limit (u16, 0xFFFF = yok) | arka plan RGB (3) | boş | metin konumu (u32)
+    gridler : level başına sabit max cols x max rows uint8 (satır satır, level'ın kendi cols'u ile)
+    metinler: name, description, hint (LevelFormat.encode_text_fields)
+"""
+import hashlib
+import mmap
+import struct
+from collections import OrderedDict
+from config import LEVEL_PACK_CACHE_SIZE
+from Levels.LevelFormat import (SYMBOLS, SYMBOL_CODES, NO_TIME_LIMIT,
+                                header_fields, encode_text_fields, decode_text_fields)
+
+MAGIC = b"RVPK"
+VERSION = 1
+PACK_EXTENSION = ".rvpk"
+
+_HEADER = struct.Struct("<4sBBBxIIII")
+_ENTRY = struct.Struct("<BBBxH3BxI")
+
+
+# ============================================
+# YAZMA (Writer)
+# ============================================
+
+def write_pack(levels, path):
+    """
+    Level listesini paket dosyasına yaz
+
+    Args:
+        levels (iterable): LevelData formatında level dict'leri (sırası = level numarası)
+        path (str): Çıktı dosyası (.rvpk)
+
+    Returns:
+        int: Yazılan level sayısı
+
+    Raises:
+        ValueError: Grid boş, 255 hücreden geniş, meta alanları başlığa sığmıyorsa
+            (LevelFormat.header_fields) veya bilinmeyen sembol içeriyorsa
+    """
+    levels = list(levels)
+    headers = [header_fields(level, f"Level {number}") for number, level in enumerate(levels, start=1)]
+    max_cols = max((header[0] for header in headers), default=0)
+    max_rows = max((header[1] for header in headers), default=0)
+    stride = max_cols * max_rows
+
+    index = bytearray()
+    grids = bytearray()
+    texts = bytearray()
+    for number, (level, header) in enumerate(zip(levels, headers), start=1):
+        cols, rows, stars_required, time_limit, background = header
+        index += _ENTRY.pack(cols, rows, stars_required, time_limit, *background, len(texts))
+        try:
+            cells = bytes(SYMBOL_CODES[cell] for row in level["grid"] for cell in row)
+        except KeyError as e:
+            raise ValueError(f"❌ Level {number}: Unknown tile symbol {e}") from None
+        grids += cells.ljust(stride, b"\0")
+        texts += encode_text_fields(level)
+
+    index_offset = _HEADER.size
+    grids_offset = index_offset + len(index)
+    texts_offset = grids_offset + len(grids)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, max_cols, max_rows, len(levels),
+                             index_offset, grids_offset, texts_offset))
+        f.write(index)
+        f.write(grids)
+        f.write(texts)
+    return len(levels)
+
+
+# ============================================
+# OKUMA (Reader)
+# ============================================
+
+class LevelPack:
+    """
+    mmap ile açılmış level paketi.
+    get_level(n) LevelData.get_level ile aynı formatta dict döndürür.
+    """
+
+    def __init__(self, path, cache_size=None):
+        """
+        Args:
+            path (str): Paket dosyası (.rvpk)
+            cache_size (int): Decode edilmiş level LRU kapasitesi (None = LEVEL_PACK_CACHE_SIZE)
+
+        Raises:
+            ValueError: Dosya paket formatında değilse
+        """
+        self.path = path
+        self.cache_size = LEVEL_PACK_CACHE_SIZE if cache_size is None else cache_size
+        self._cache = OrderedDict()  # Level numarası -> dict
+        self._digest = None
+        self.hits = 0
+        self.misses = 0
+
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"❌ Empty level pack: {path}") from None
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"❌ Not a ReVerse level pack: {path}")
+        (magic, version, max_cols, max_rows, self.count,
+         self._index, self._grids, self._texts) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"❌ Not a ReVerse level pack (or old version): {path}")
+        self.max_size = (max_cols, max_rows)
+        self._stride = max_cols * max_rows
+        if len(self._map) < self._texts:
+            self.close()
+            raise ValueError(f"❌ Truncated level pack: {path}")
+
+    def __len__(self):
+        return self.count
+
+    def get_level(self, level_number):
+        """
+        Level'ı decode et (veya LRU'dan döndür)
+
+        Args:
+            level_number (int): 1 tabanlı level numarası
+
+        Returns:
+            dict: Level verisi veya None (aralık dışı)
+        """
+        level = self._cache.get(level_number)
+        if level is not None:
+            self._cache.move_to_end(level_number)
+            self.hits += 1
+            return level
+        if not isinstance(level_number, int) or not 1 <= level_number <= self.count:
+            return None
+
+        self.misses += 1
+        level = self._decode(level_number - 1)
+        if self.cache_size > 0:
+            self._cache[level_number] = level
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return level
+
+    def _decode(self, i):
+        cols, rows, stars_required, time_limit, r, g, b, text_pos = \
+            _ENTRY.unpack_from(self._map, self._index + i * _ENTRY.size)
+        start = self._grids + i * self._stride
+        cells = self._map[start:start + cols * rows]
+        level = {
+            "grid": [[SYMBOLS[code] for code in cells[y * cols:(y + 1) * cols]] for y in range(rows)],
+            "stars_required": stars_required,
+            "time_limit": None if time_limit == NO_TIME_LIMIT else time_limit,
+            "background_color": (r, g, b)
+        }
+        decode_text_fields(self._map, self._texts + text_pos, level)
+        return level
+
+    def content_digest(self):
+        """
+        Başlık, index ve grid bölgesinin özeti (metinler hariç; mmap'ten kopyasız).
+        Paket açıkken değişmediği için bir kez hesaplanır.
+
+        Returns:
+            bytes: 16 baytlık özet
+        """
+        if self._digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            with memoryview(self._map) as view, view[:self._texts] as region:
+                digest.update(region)
+            self._digest = digest.digest()
+        return self._digest
+
+    def __iter__(self):
+        """Level'ları sırayla decode et (LRU kapasitesi kadar bellek)"""
+        for number in range(1, self.count + 1):
+            yield self.get_level(number)
+
+    def close(self):
+        if getattr(self, "_map", None) is not None and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return (f"LevelPack {self.path} | {self.count} levels | max {self.max_size[0]}x{self.max_size[1]} | "
+                f"LRU {len(self._cache)}/{self.cache_size} (hits {self.hits}, misses {self.misses})")
+
+
+def iter_pack(path, cache_size=None):
+    """
+    Paketteki level'ları sırayla ver, bitince dosyayı kapat
+
+    Args:
+        path (str): Paket dosyası
+        cache_size (int): LRU kapasitesi
+
+    Yields:
+        dict: Level verisi
+    """
+    with LevelPack(path, cache_size) as pack:
+        yield from pack
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from Levels.LevelData import LevelData
+
+    print("=== LevelPack Test ===\n")
+    base = [LevelData.get_level(number) for number in range(1, LevelData.get_total_levels() + 1)]
+    path = os.path.join(tempfile.mkdtemp(), "test" + PACK_EXTENSION)
+    count = 10_000
+    write_pack((dict(base[i % len(base)], name=f"Level {i + 1}") for i in range(count)), path)
+    print(f"Wrote {count} levels: {os.path.getsize(path) // 1024} KB")
+
+    started = time.perf_counter()
+    pack = LevelPack(path)
+    print(f"Open: {(time.perf_counter() - started) * 1000:.3f} ms")
+    level = pack.get_level(2)
+    same = {key: level[key] for key in base[1] if key != "name"} == {key: base[1][key] for key in base[1] if key != "name"}
+    print(f"Level 2 round trip: {'✅' if same and level['name'] == 'Level 2' else '❌'}")
+    print(f"Out of range: {pack.get_level(count + 1)}")
+
+    started = time.perf_counter()
+    names = sum(1 for _ in pack)
+    print(f"Iterated {names} levels in {(time.perf_counter() - started) * 1000:.1f} ms")
+    print(pack)
+    pack.close()
+    print("\n=== Test Complete ===")
@@ -0,0 +1,278 @@
+"""
+ReVerse - Level Solver
+GameState üzerinde BFS / A* ile en kısa kazanma hamle dizisi
+(veya çözüm olmadığının kanıtı: tüm erişilebilir durumlar tarandı)
+"""
+import heapq
+import time
+from collections import deque
+from config import STATE_WIN, MAX_MAIN_LIVES, JUMPS_PER_LIFE
+from Scripts.Core.GameState import World, new_game, step, play, ACTIONS
+
+SOLVE_SOLVED = "solved"          # En kısa çözüm bulundu
+SOLVE_UNSOLVABLE = "unsolvable"  # Tüm durum uzayı tarandı, kazanma yok
+SOLVE_LIMIT = "limit"            # max_states aşıldı, sonuç bilinmiyor
+
+METHOD_BFS = "bfs"
+METHOD_ASTAR = "astar"
+
+DEFAULT_MAX_STATES = 2_000_000
+
+
+class StateCodec:
+    """
+    GameState'i tek bir tamsayıya paketler (visited set belleği için).
+    Bit genişlikleri world'den hesaplanır: konum, can/token, yıldız sayısı,
+    bayraklar ve toplanan öğe / kullanılan rotate bitmask'ları.
+    """
+
+    def __init__(self, world):
+        levels = sorted(world.levels)
+        self._level_index = {number: i for i, number in enumerate(levels)}
+        cols = max(level.cols for level in world.levels.values())
+        rows = max(level.rows for level in world.levels.values())
+
+        # Tüm levellerdeki toplanabilir öğeler ve rotate hücreleri (koordinat bazlı, ortak)
+        items = set()
+        rotates = set()
+        for level in world.levels.values():
+            items.update(("star", gx, gy) for gx, gy in level.stars)
+            if level.key is not None:
+                items.add(("key",) + level.key)
+            rotates.update(level.rotates)
+        self._item_bits = {item: 1 << i for i, item in enumerate(sorted(items))}
+        self._rotate_bits = {cell: 1 << i for i, cell in enumerate(sorted(rotates))}
+        star_count = sum(1 for item in items if item[0] == "star")
+
+        # (alan adı, genişlik) - sırayla paketlenir
+        self._fields = (
+            ("level", _bits(len(levels))),
+            ("px", _bits(cols)),
+            ("py", _bits(rows)),
+            ("lives", _bits(MAX_MAIN_LIVES + 1)),
+            ("tokens", _bits(JUMPS_PER_LIFE + 1)),
+            ("stars", _bits(star_count + 1)),
+            ("flags", 6),
+            ("collected", len(self._item_bits)),
+        )
+        self.bits = sum(width for _, width in self._fields) + len(self._rotate_bits)
+
+    def encode(self, state):
+        """
+        Returns:
+            int: Durumun kompakt anahtarı (aynı oyun durumu -> aynı sayı)
+        """
+        flags = (state.has_key | (state.will_jump << 1) | (state.just_pushed << 2)
+                 | (state.on_rotate << 3) | (state.key_spawned << 4) | (state.key_taken << 5))
+        collected = 0
+        for item in state.collected:
+            collected |= self._item_bits[item]
+        used = 0
+        for cell in state.used_rotates:
+            used |= self._rotate_bits[cell]
+
+        code = used
+        for name, width in reversed(self._fields):
+            if name == "level":
+                value = self._level_index[state.level]
+            elif name == "flags":
+                value = flags
+            elif name == "collected":
+                value = collected
+            else:
+                value = getattr(state, name)
+            code = (code << width) | value
+        return code
+
+
+def _bits(count):
+    """count farklı değeri tutmak için gereken bit sayısı"""
+    return max(1, (count - 1).bit_length())
+
+
+class SolveResult:
+    """Solver çıktısı"""
+
+    def __init__(self, status, actions=None, explored=0, max_frontier=0, elapsed=0.0, method=METHOD_BFS):
+        self.status = status
+        self.actions = actions or []
+        self.explored = explored          # Genişletilen durum sayısı
+        self.max_frontier = max_frontier  # En büyük kuyruk boyutu
+        self.elapsed = elapsed
+        self.method = method
+
+    @property
+    def solved(self):
+        return self.status == SOLVE_SOLVED
+
+    def to_dict(self):
+        """JSON çıktısı için"""
+        return {
+            "status": self.status,
+            "method": self.method,
+            "moves": len(self.actions) if self.solved else None,
+            "actions": list(self.actions),
+            "explored": self.explored,
+            "max_frontier": self.max_frontier,
+            "elapsed": round(self.elapsed, 4)
+        }
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        moves = f"{len(self.actions)} moves" if self.solved else "-"
+        return (f"{self.status.upper()} | {moves} | Explored: {self.explored} | "
+                f"Frontier: {self.max_frontier} | {self.elapsed:.2f}s ({self.method})")
+
+
+def solve(level_number=1, world=None, method=METHOD_BFS, max_states=DEFAULT_MAX_STATES, start=None):
+    """
+    Level'ı en kısa hamle dizisiyle çöz
+
+    Args:
+        level_number (int): Başlangıç level'ı (start verilmediyse)
+        world: GameState World objesi (None ise LevelData seviyeleri)
+        method (str): "bfs" veya "astar" (ikisi de en kısa çözümü bulur)
+        max_states (int): Ziyaret edilen durum sınırı (bellek koruması)
+        start: Başlangıç GameState'i (opsiyonel)
+
+    Returns:
+        SolveResult
+    """
+    if world is None:
+        world = start.world if start is not None else World.from_level_data()
+    if start is None:
+        start = new_game(world, level_number)
+    if method not in (METHOD_BFS, METHOD_ASTAR):
+        raise ValueError(f"Unknown solver method: {method}")
+
+    codec = StateCodec(world)
+    started = time.perf_counter()
+    if method == METHOD_ASTAR:
+        status, actions, explored, max_frontier = _astar(start, codec, max_states)
+    else:
+        status, actions, explored, max_frontier = _bfs(start, codec, max_states)
+    return SolveResult(status, actions, explored, max_frontier, time.perf_counter() - started, method)
+
+
+def _path(parents, code, last_action):
+    """Parent zincirinden hamle dizisini oluştur"""
+    actions = [last_action]
+    while True:
+        parent, action = parents[code]
+        if parent is None:
+            break
+        actions.append(action)
+        code = parent
+    actions.reverse()
+    return actions
+
+
+def _bfs(start, codec, max_states):
+    root = codec.encode(start)
+    parents = {root: (None, None)}  # kod -> (parent kodu, hamle); aynı zamanda visited set
+    frontier = deque([(start, root)])
+    max_frontier = 1
+    explored = 0
+
+    while frontier:
+        state, code = frontier.popleft()
+        explored += 1
+        for action in ACTIONS:
+            child, _ = step(state, action)
+            if child.status == STATE_WIN:
+                return SOLVE_SOLVED, _path(parents, code, action), explored, max_frontier
+            if child.is_terminal():
+                continue
+            child_code = codec.encode(child)
+            if child_code in parents:
+                continue
+            if len(parents) >= max_states:
+                return SOLVE_LIMIT, [], explored, max_frontier
+            parents[child_code] = (code, action)
+            frontier.append((child, child_code))
+        if len(frontier) > max_frontier:
+            max_frontier = len(frontier)
+    return SOLVE_UNSOLVABLE, [], explored, max_frontier
+
+
+def _door_heuristic(world):
+    """
+    Kabul edilebilir (admissible) ve tutarlı sezgisel: kazanmak için bir kapıya
+    değmek gerekir ve tek hamle oyuncunun değdiği hücreyi en fazla 2 hücre
+    öteye taşır (1 adım + ok itmesi, ya da zıplama yayının üst satıra değmesi).
+    Bitmemiş her durum en az 1 hamle gerektirdiğinden alt sınır 1'dir.
+    """
+    doors = [level.door for level in world.levels.values()]
+
+    def heuristic(state):
+        best = min(abs(state.px - dx) + abs(state.py - dy) for dx, dy in doors)
+        return max(1, (best + 1) // 2)
+    return heuristic
+
+
+def _astar(start, codec, max_states):
+    heuristic = _door_heuristic(start.world)
+    root = codec.encode(start)
+    parents = {root: (None, None)}
+    cost = {root: 0}
+    counter = 0  # Eşit f değerlerinde FIFO sırası
+    frontier = [(heuristic(start), counter, 0, start, root)]
+    max_frontier = 1
+    explored = 0
+
+    while frontier:
+        _, _, g, state, code = heapq.heappop(frontier)
+        if g > cost[code]:
+            continue  # Daha kısa yoldan tekrar eklenmiş eski kayıt
+        explored += 1
+        for action in ACTIONS:
+            child, _ = step(state, action)
+            if child.status == STATE_WIN:
+                # Genişletilen düğümde f = g + h >= g + 1 ve kuyruktaki tüm f'ler daha büyük
+                # veya eşit; bu yüzden g + 1 maliyetli kazanma en kısa çözümdür
+                return SOLVE_SOLVED, _path(parents, code, action), explored, max_frontier
+            if child.is_terminal():
+                continue
+            child_code = codec.encode(child)
+            known = cost.get(child_code)
+            if known is not None and known <= g + 1:
+                continue
+            if known is None and len(cost) >= max_states:
+                return SOLVE_LIMIT, [], explored, max_frontier
+            cost[child_code] = g + 1
+            parents[child_code] = (code, action)
+            counter += 1
+            heapq.heappush(frontier, (g + 1 + heuristic(child), counter, g + 1, child, child_code))
+        if len(frontier) > max_frontier:
+            max_frontier = len(frontier)
+    return SOLVE_UNSOLVABLE, [], explored, max_frontier
+
+
+def verify(actions, level_number=1, world=None):
+    """
+    Hamle dizisinin gerçekten kazandığını GameState ile doğrula
+
+    Returns:
+        bool: Son durum kazanma mı
+    """
+    state = new_game(world or World.from_level_data(), level_number)
+    state, _ = play(state, actions)
+    return state.status == STATE_WIN
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    from Levels.LevelData import LevelData
+
+    print("=== LevelSolver Test ===\n")
+    world = World.from_level_data()
+    for number in range(1, LevelData.get_total_levels() + 1):
+        for method in (METHOD_BFS, METHOD_ASTAR):
+            result = solve(number, world, method=method)
+            print(f"Level {number}: {result}")
+            if result.solved:
+                print(f"  Actions: {' '.join(result.actions)}")
+                print(f"  Verified: {'✅' if verify(result.actions, number, world) else '❌'}")
+    print("\n=== Test Complete ===")
@@ -0,0 +1,299 @@
+"""
+ReVerse - Level Validator
+Level setlerini toplu doğrular: yapısal kontroller, güvenli erişim
+flood-fill'i ve LevelSolver ile tam çözülebilirlik araması (process pool)
+"""
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from config import STARS_TO_WIN
+from Scripts.Utils.Constants import *
+from Scripts.Core import Rules
+from Scripts.Core.GameState import World
+from Levels.LevelData import LevelData
+from Levels.LevelSolver import solve, METHOD_BFS, DEFAULT_MAX_STATES
+from Levels.LevelPack import PACK_EXTENSION, iter_pack
+
+# Arrow sembolü -> ters yöndeki arrow sembolü (Mirror World)
+_DIRECTION_SYMBOLS = {direction: symbol for symbol, direction in Rules.ARROW_DIRECTIONS.items()}
+MIRRORED_ARROWS = {
+    symbol: _DIRECTION_SYMBOLS[Rules.REVERSE_DIRECTION[direction]]
+    for symbol, direction in Rules.ARROW_DIRECTIONS.items()
+}
+
+
+def mirror_level(level_data):
+    """
+    Level'ın ayna karşılığı: aynı grid, tüm oklar ters yönde
+    (level_02 "Mirror World", level_01'in bu şekilde türetilmiş hali)
+
+    Args:
+        level_data (dict): LevelData formatında level
+
+    Returns:
+        dict: Yeni level verisi
+    """
+    mirrored = dict(level_data)
+    mirrored["grid"] = [[MIRRORED_ARROWS.get(cell, cell) for cell in row] for row in level_data["grid"]]
+    mirrored["name"] = f"{level_data.get('name', 'Level')} (Mirror)"
+    return mirrored
+
+
+# ============================================
+# YAPISAL KONTROLLER (Structural)
+# ============================================
+
+def check_structure(level_data, number):
+    """
+    LevelData.validate_grid + sayım kontrolleri
+
+    Args:
+        level_data (dict): Level verisi
+        number (int): World içindeki level numarası
+
+    Returns:
+        tuple: (errors, warnings) string listeleri
+    """
+    errors = []
+    warnings = []
+    grid = level_data.get("grid")
+    is_valid, message = LevelData.validate_grid(grid)
+    if not is_valid:
+        return [message], warnings
+
+    required = level_data.get("stars_required", STARS_TO_WIN)
+    stars = LevelData.count_collectibles(grid, TILE_STAR)
+    if stars < required:
+        errors.append(f"Only {stars} stars but {required} required")
+    if LevelData.count_collectibles(grid, TILE_KEY) == 0:
+        errors.append("Grid has no Key (K) - door cannot open")
+
+    # LevelLoader son S / D / K'yı kullanır; fazlası büyük ihtimalle hata
+    for symbol in (TILE_START, TILE_DOOR, TILE_KEY):
+        count = LevelData.count_collectibles(grid, symbol)
+        if count > 1:
+            warnings.append(f"{count}x '{symbol}' - only the last one is used")
+    if number == 1 and LevelData.count_collectibles(grid, TILE_ROTATE) == 0:
+        warnings.append("Level 1 has no Rotate (R) - key never spawns in level 1")
+    return errors, warnings
+
+
+# ============================================
+# ERİŞİM (Reachability)
+# ============================================
+
+def flood_fill(level_data, number):
+    """
+    Başlangıçtan hasar almadan (X'e basmadan, zıplamadan) erişilebilen hücreler.
+    Oklar oyuncuyu push_target'a taşır; hasarlı oklar duvar sayılır.
+
+    Returns:
+        set: Erişilebilen (gx, gy) hücreleri
+    """
+    grid = level_data["grid"]
+    cols, rows = LevelData.get_grid_size(grid)
+    start = None
+    for gy, row in enumerate(grid):
+        for gx, cell in enumerate(row):
+            if cell == TILE_START:
+                start = (gx, gy)
+
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        gx, gy = queue.popleft()
+        for dx, dy in Rules.DIRECTION_VECTORS.values():
+            nx, ny = gx + dx, gy + dy
+            if not Rules.in_bounds(nx, ny, cols, rows):
+                continue
+            cell = grid[ny][nx]
+            if cell == TILE_DAMAGE:
+                continue
+            if cell in Rules.ARROW_DIRECTIONS:
+                if not Rules.is_safe_arrow(number, nx, ny):
+                    continue
+                nx, ny = Rules.push_target(nx, ny, Rules.ARROW_DIRECTIONS[cell], cols, rows)
+                if grid[ny][nx] == TILE_DAMAGE:
+                    continue
+            if (nx, ny) not in seen:
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return seen
+
+
+def reachability(level_data, number):
+    """
+    Hedef sembollerin güvenli erişim özeti
+
+    Returns:
+        dict: Sembol grubu -> "erişilen/toplam"
+    """
+    reached = flood_fill(level_data, number)
+    targets = {"stars": TILE_STAR, "key": TILE_KEY, "door": TILE_DOOR, "rotates": TILE_ROTATE}
+    summary = {"cells": len(reached)}
+    for name, symbol in targets.items():
+        cells = [(gx, gy) for gy, row in enumerate(level_data["grid"])
+                 for gx, cell in enumerate(row) if cell == symbol]
+        summary[name] = f"{sum(1 for cell in cells if cell in reached)}/{len(cells)}"
+    return summary
+
+
+# ============================================
+# TEK LEVEL (worker)
+# ============================================
+
+def validate_level(job):
+    """
+    Bir level'ı yapısal kontrol, flood-fill ve solver'dan geçir
+    (ProcessPoolExecutor worker'ı; job picklable bir tuple)
+
+    Args:
+        job (tuple): (index, levels, number, method, max_states)
+            levels: World'ün level dict'i (numara -> level verisi)
+            number: Doğrulanan level'ın world içindeki numarası
+
+    Returns:
+        dict: JSON'a yazılabilir rapor
+    """
+    index, levels, number, method, max_states = job
+    level_data = levels[number]
+    report = {
+        "index": index,
+        "level": number,
+        "name": level_data.get("name", f"Level {index}"),
+        "ok": False,
+        "status": None,
+        "moves": None,
+        "solve_time": None,
+        "explored": 0,
+        "failures": [],
+        "warnings": [],
+        "reachable": None,
+        "actions": []
+    }
+
+    errors, warnings = check_structure(level_data, number)
+    report["failures"].extend(errors)
+    report["warnings"].extend(warnings)
+    for other_number, other in levels.items():
+        if other_number == number:
+            continue
+        # Ayna level aynı hataları tekrarlar; sadece level'ın kendisinde olmayanları ekle
+        for error in check_structure(other, other_number)[0]:
+            linked = f"Linked level {other_number}: {error}"
+            if error not in errors and linked not in report["failures"]:
+                report["failures"].append(linked)
+    if report["failures"]:
+        report["status"] = "invalid"
+        return report
+
+    report["reachable"] = reachability(level_data, number)
+    result = solve(number, World(levels), method=method, max_states=max_states)
+    report["status"] = result.status
+    report["solve_time"] = round(result.elapsed, 4)
+    report["explored"] = result.explored
+    if result.solved:
+        report["moves"] = len(result.actions)
+        report["actions"] = list(result.actions)
+        report["ok"] = True
+    else:
+        report["failures"].append(f"Solver: {result.status} after {result.explored} states")
+    return report
+
+
+# ============================================
+# TOPLU DOĞRULAMA (Batch)
+# ============================================
+
+def game_jobs(method=METHOD_BFS, max_states=DEFAULT_MAX_STATES):
+    """Oyundaki LevelData seviyeleri (hepsi aynı world'de) için job listesi"""
+    levels = {number: LevelData.get_level(number) for number in range(1, LevelData.get_total_levels() + 1)}
+    return [(number, levels, number, method, max_states) for number in levels]
+
+
+def pack_jobs(pack, method=METHOD_BFS, max_states=DEFAULT_MAX_STATES):
+    """
+    Level paketi için job listesi: her level, ayna karşılığıyla birlikte
+    (1: level, 2: mirror) bir world olarak Level 1'den doğrulanır
+
+    Args:
+        pack (list): LevelData formatında level dict'leri
+    """
+    return [(index, {1: level, 2: mirror_level(level)}, 1, method, max_states)
+            for index, level in enumerate(pack, start=1)]
+
+
+def load_pack(path):
+    """
+    Level paketi yükle: JSON (level listesi veya {"levels": [...]}) ya da .rvpk
+
+    Returns:
+        list: Level dict'leri
+    """
+    if path.endswith(PACK_EXTENSION):
+        return list(iter_pack(path, cache_size=0))
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("levels", [])
+    if not isinstance(data, list):
+        raise ValueError(f"❌ Level pack must be a list of levels: {path}")
+    return data
+
+
+def validate_all(jobs, workers=None):
+    """
+    Job'ları process pool'da çalıştır
+
+    Args:
+        jobs (list): game_jobs / pack_jobs çıktısı
+        workers (int): Process sayısı (None = CPU sayısı, 1 = aynı process)
+
+    Returns:
+        dict: {"summary": {...}, "levels": [rapor, ...]} (job sırasıyla)
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) or 1))
+    started = time.perf_counter()
+    if workers == 1:
+        reports = [validate_level(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(validate_level, jobs, chunksize=1))
+
+    solved = [r for r in reports if r["ok"]]
+    return {
+        "summary": {
+            "levels": len(reports),
+            "passed": len(solved),
+            "failed": len(reports) - len(solved),
+            "jobs": workers,
+            "elapsed": round(time.perf_counter() - started, 4),
+            "solve_time_total": round(sum(r["solve_time"] or 0.0 for r in reports), 4),
+            "max_moves": max((r["moves"] for r in solved), default=None)
+        },
+        "levels": reports
+    }
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    print("=== LevelValidator Test ===\n")
+    report = validate_all(game_jobs(), workers=2)
+    for level in report["levels"]:
+        mark = "✅" if level["ok"] else "❌"
+        print(f"{mark} Level {level['index']} ({level['name']}): {level['status']} | "
+              f"moves={level['moves']} | {level['solve_time']}s | reach={level['reachable']}")
+        for failure in level["failures"]:
+            print(f"   - {failure}")
+    print(f"\nSummary: {report['summary']}")
+
+    tutorial = LevelData.get_level(1)
+    broken = dict(tutorial, grid=[row[:] for row in tutorial["grid"]])
+    broken["grid"][0][0] = "."  # Anahtarı kaldır
+    print(f"\nBroken pack: {validate_all(pack_jobs([broken]), workers=1)['levels'][0]['failures']}")
+    print("\n=== Test Complete ===")
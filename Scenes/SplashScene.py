@@ -6,6 +6,7 @@ import pygame
 import os
 import math
 from config import *
+from Scripts.Systems.GameClock import GameClock
 
 class SplashScene:
     """
@@ -13,9 +14,15 @@ class SplashScene:
     Video splash veya statik logo gösterir
     """
     
-    def __init__(self, screen):
+    def __init__(self, screen, game_clock=None):
+        """
+        Args:
+            screen: Pygame surface
+            game_clock: GameClock (None = gerçek zamanlı yeni saat)
+        """
         self.screen = screen
         self.clock = pygame.time.Clock()
+        self.game_clock = game_clock or GameClock()
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
@@ -74,7 +81,7 @@ class SplashScene:
         Returns:
             bool: True = devam et, False = çıkış
         """
-        start_time = pygame.time.get_ticks()
+        start_time = self.game_clock.now()
         alpha = 0
         # Daha yumuşak geçiş için süreleri biraz uzat ve easing uygula
         fade_in_duration = 1200   # 1.2 saniye
@@ -83,7 +90,7 @@ class SplashScene:
         
         while True:
             dt = self.clock.tick(FPS) / 1000.0
-            current_time = pygame.time.get_ticks() - start_time
+            current_time = (self.game_clock.now() - start_time) * 1000.0  # ms
             
             # Event kontrolü (skip için)
             for event in pygame.event.get():
@@ -151,9 +158,10 @@ class CompanySplash:
     Yapımcı logosu splash (opsiyonel)
     """
     
-    def __init__(self, screen):
+    def __init__(self, screen, game_clock=None):
         self.screen = screen
         self.clock = pygame.time.Clock()
+        self.game_clock = game_clock or GameClock()
         self.font = pygame.font.Font(None, 48)
     
     def show(self, company_name="Your Studio", duration=2.0):
@@ -167,11 +175,11 @@ class CompanySplash:
         Returns:
             bool: True = devam et
         """
-        start_time = pygame.time.get_ticks()
+        start_time = self.game_clock.now()
         
         while True:
             dt = self.clock.tick(FPS) / 1000.0
-            current_time = pygame.time.get_ticks() - start_time
+            current_time = (self.game_clock.now() - start_time) * 1000.0  # ms
             
             # Event kontrolü
             for event in pygame.event.get():
@@ -0,0 +1,572 @@
+"""
+ReVerse - Batch Simulator
+GameState kurallarının NumPy ile N oyun üzerinde aynı anda çalışan hali
+(bot değerlendirme / denge testleri için; numpy opsiyonel bağımlılıktır)
+"""
+from config import MAX_MAIN_LIVES, JUMPS_PER_LIFE, STATE_PLAYING, STATE_WIN, STATE_GAME_OVER
+from Scripts.Utils.Constants import *
+from Scripts.Core import Rules
+from Scripts.Core.GameState import World, GameState, ACTIONS, ACTION_VECTORS, SIM_DT, _overlap
+
+try:
+    import numpy as np
+except ImportError:  # Oyunun kendisi numpy'sız çalışır
+    np = None
+
+# Durum kodları (status dizisi)
+STATUS_CODES = (STATE_PLAYING, STATE_WIN, STATE_GAME_OVER)
+PLAYING, WIN, GAME_OVER = 0, 1, 2
+
+# Hamle indeksleri: GameState.ACTIONS sırası (up, down, left, right, jump)
+ACTION_INDEX = {action: i for i, action in enumerate(ACTIONS)}
+JUMP = ACTION_INDEX["jump"]
+
+# Ödüller (step() dönüşü)
+REWARD_STAR = 0.1
+REWARD_KEY = 0.1
+REWARD_WIN = 1.0
+REWARD_GAME_OVER = -1.0
+
+# Zemin kodları (uint8 hücre tablosu)
+_TILE_NONE, _TILE_EMPTY, _TILE_DAMAGE, _TILE_ARROW = 0, 1, 2, 3
+_SLOTS = 4  # Oyuncu kutusu en fazla 4 hücreye değer
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("❌ BatchSim requires numpy (pip install numpy)")
+
+
+class BatchSim:
+    """
+    N bağımsız oyun; her alan bir vektör (GameState.__slots__ karşılıkları).
+    Geometri (hareket animasyonunun her frame'inde değilen yıldız / anahtar /
+    rotate / kapı hücreleri) world'den bir kez tabloya derlenir; step() sadece
+    frame'leri tablolar üzerinde maskeli vektör işlemleriyle oynatır.
+    GameState.step ile birebir aynı sonuçları üretir.
+    """
+
+    def __init__(self, n, world=None, level=1):
+        """
+        Args:
+            n (int): Paralel oyun sayısı
+            world: GameState World objesi (None ise LevelData seviyeleri)
+            level (int): Başlangıç level numarası
+        """
+        _require_numpy()
+        self.world = world or World.from_level_data()
+        self.n = n
+        self.god_mode = self.world.god_mode
+        self._compile()
+
+        self.level = np.zeros(n, np.int32)       # Level indeksi (self.numbers[level] = numara)
+        self.px = np.zeros(n, np.int32)
+        self.py = np.zeros(n, np.int32)
+        self.lives = np.zeros(n, np.int32)
+        self.tokens = np.zeros(n, np.int32)
+        self.total_jumps = np.zeros(n, np.int32)
+        self.stars = np.zeros(n, np.int32)
+        self.has_key = np.zeros(n, bool)
+        self.will_jump = np.zeros(n, bool)
+        self.just_pushed = np.zeros(n, bool)
+        self.on_rotate = np.zeros(n, bool)
+        self.key_spawned = np.zeros(n, bool)
+        self.key_taken = np.zeros(n, bool)
+        self.collected = np.zeros(n, np.uint64)  # Öğe bitmask'ı (self.items sırası)
+        self.used = np.zeros(n, np.uint64)       # Kullanılmış rotate bitmask'ı (self.rotates sırası)
+        self.status = np.zeros(n, np.int32)
+        self.frames = np.zeros(n, np.int32)
+
+        # Hamle içi animasyon durumu (_Motion karşılığı)
+        self._moving = np.zeros(n, bool)
+        self._progress = np.zeros(n, np.int32)  # Hareket başından beri geçen frame
+        self._tx = np.zeros(n, np.int32)
+        self._ty = np.zeros(n, np.int32)
+        self._dir = np.zeros(n, np.int32)
+        self._alive = np.ones(n, bool)
+        self._picked = np.zeros(n, np.int32)  # Bu step'te toplanan yıldız
+        self._keys = np.zeros(n, bool)         # Bu step'te anahtar alındı mı
+        self._spawn_pending = np.zeros(n, bool)  # Yıldız toplandı; sonraki frame spawn kontrolü
+
+        self.reset(level=level)
+
+    # ============================================
+    # DERLEME (World -> tablolar)
+    # ============================================
+
+    def _compile(self):
+        world = self.world
+        size = world.grid_size
+        self.numbers = sorted(world.levels)
+        index = {number: i for i, number in enumerate(self.numbers)}
+        levels = [world.level(number) for number in self.numbers]
+        count = len(levels)
+        cols = max(level.cols for level in levels)
+        rows = max(level.rows for level in levels)
+        self._cols, self._rows = cols, rows
+
+        # Öğe / rotate bitleri koordinat bazlı ve levellar arası ortak (GameState.collected gibi)
+        items = set()
+        rotates = set()
+        for level in levels:
+            items.update(("star", gx, gy) for gx, gy in level.stars)
+            if level.key is not None:
+                items.add(("key",) + level.key)
+            rotates.update(level.rotates)
+        self.items = sorted(items)
+        self.rotates = sorted(rotates)
+        if len(self.items) > 64 or len(self.rotates) > 64:
+            raise ValueError("❌ BatchSim supports at most 64 collectibles and 64 rotate symbols")
+        item_bit = {item: np.uint64(1 << i) for i, item in enumerate(self.items)}
+        rotate_bit = {cell: np.uint64(1 << i) for i, cell in enumerate(self.rotates)}
+
+        # Level başına skaler tablolar
+        self._level_cols = np.array([level.cols for level in levels])
+        self._level_rows = np.array([level.rows for level in levels])
+        self._start_x = np.array([level.start[0] for level in levels])
+        self._start_y = np.array([level.start[1] for level in levels])
+        self._required = np.array([level.required_stars for level in levels])
+        self._is_last = np.array([level.number >= world.total_levels for level in levels])
+        self._next = np.array([index.get(level.number + 1, i) for i, level in enumerate(levels)])
+        self._spawn_ok = np.array([level.key is not None and level.number != 1 for level in levels])
+        self._key_bit = np.array([item_bit[("key",) + level.key] if level.key else 0 for level in levels],
+                                 np.uint64)
+        rotate_target = []
+        for i, level in enumerate(levels):
+            target = Rules.other_level(level.number)
+            if level.rotates and target not in index:
+                raise ValueError(f"❌ Level {level.number} rotates to missing level {target}")
+            rotate_target.append(index.get(target, i))
+        self._rotate_target = np.array(rotate_target)
+
+        # Hücre tabloları: indeks = (level * rows + gy) * cols + gx
+        cells = count * rows * cols
+        self._tile = np.zeros(cells, np.uint8)
+        self._safe = np.zeros(cells, bool)
+        self._push_x = np.zeros(cells, np.int32)
+        self._push_y = np.zeros(cells, np.int32)
+        for li, level in enumerate(levels):
+            for (gx, gy), symbol in level.tiles.items():
+                c = (li * rows + gy) * cols + gx
+                if symbol == TILE_EMPTY:
+                    self._tile[c] = _TILE_EMPTY
+                elif symbol == TILE_DAMAGE:
+                    self._tile[c] = _TILE_DAMAGE
+                else:
+                    self._tile[c] = _TILE_ARROW
+                    self._safe[c] = Rules.is_safe_arrow(level.number, gx, gy)
+                    direction = Rules.ARROW_DIRECTIONS[symbol]
+                    self._push_x[c], self._push_y[c] = Rules.push_target(gx, gy, direction, level.cols, level.rows)
+
+        # Animasyon ilerlemesi: _frame ile aynı float birikimi
+        self._t = []
+        progress = 0.0
+        while True:
+            progress += Rules.MOVE_SPEED * SIM_DT
+            if progress >= 1.0:
+                break
+            self._t.append(progress)
+        self._land_frame = len(self._t) + 1
+
+        # Geometri tabloları: önce durağan (hücre başına), sonra hareket
+        # (hücre, yön, jump, frame) kombinasyonları
+        frames = len(self._t)
+        total = cells + cells * 4 * 2 * frames
+        self._star_bits = np.zeros((_SLOTS, total), np.uint64)
+        self._rotate_bits = np.zeros((_SLOTS, total), np.uint64)
+        self._key_hit = np.zeros(total, bool)
+        self._door_hit = np.zeros(total, bool)
+        self._hot = np.zeros(total, bool)  # Bu konumda herhangi bir nesneye değiliyor mu
+        for li, level in enumerate(levels):
+            for gy in range(rows):
+                for gx in range(cols):
+                    c = (li * rows + gy) * cols + gx
+                    self._store_geometry(c, level, gx * size, gy * size, item_bit, rotate_bit)
+                    for d, action in enumerate(ACTIONS[:4]):
+                        dx, dy = ACTION_VECTORS[action]
+                        for jump in (0, 1):
+                            for f, t in enumerate(self._t):
+                                g = cells + ((c * 4 + d) * 2 + jump) * frames + f
+                                rx, ry = self._interpolate(gx, gy, gx + dx, gy + dy, t, jump, size)
+                                self._store_geometry(g, level, rx, ry, item_bit, rotate_bit)
+        self._cells = cells
+        self._frames_per_move = frames
+
+    @staticmethod
+    def _interpolate(gx, gy, tx, ty, t, jump, size):
+        """_frame'deki hareket interpolasyonu (aynı float işlemleri)"""
+        start_x = gx * size
+        start_y = gy * size
+        x = start_x + (tx * size - start_x) * t
+        y = start_y + (ty * size - start_y) * t
+        if jump:
+            y += Rules.jump_arc(t)
+        return int(x), int(y)
+
+    def _store_geometry(self, g, level, rx, ry, item_bit, rotate_bit):
+        """Oyuncu kutusu (rx, ry) konumundayken değilen nesneler (_frame ile aynı testler)"""
+        size = self.world.grid_size
+        pad = size // 8
+        gx0 = max(0, rx // size)
+        gx1 = min(level.cols - 1, (rx + size - 1) // size)
+        gy0 = max(0, ry // size)
+        gy1 = min(level.rows - 1, (ry + size - 1) // size)
+        cells = [(gx, gy) for gy in range(gy0, gy1 + 1) for gx in range(gx0, gx1 + 1)]
+
+        stars = [cell for cell in cells if cell in level.star_cells
+                 and _overlap(rx, ry, cell[0] * size, cell[1] * size, size, pad)]
+        rotates = [cell for cell in cells if cell in level.rotate_cells
+                   and _overlap(rx, ry, cell[0] * size, cell[1] * size, size)]
+        for slot, cell in enumerate(stars):
+            self._star_bits[slot, g] = item_bit[("star",) + cell]
+        for slot, cell in enumerate(rotates):
+            self._rotate_bits[slot, g] = rotate_bit[cell]
+        if level.key is not None and level.key in cells:
+            kx, ky = level.key
+            self._key_hit[g] = _overlap(rx, ry, kx * size, ky * size, size, pad)
+        dx, dy = level.door
+        self._door_hit[g] = _overlap(rx, ry, dx * size, dy * size, size)
+        self._hot[g] = bool(stars or rotates or self._key_hit[g] or self._door_hit[g])
+
+    # ============================================
+    # PUBLIC API
+    # ============================================
+
+    def reset(self, mask=None, level=1):
+        """
+        Oyunları yeni oyun durumuna getir (new_game)
+
+        Args:
+            mask: Sıfırlanacak oyunlar (bool dizisi, None = hepsi)
+            level (int): Başlangıç level numarası
+        """
+        index = np.arange(self.n) if mask is None else np.flatnonzero(mask)
+        self.lives[index] = MAX_MAIN_LIVES
+        self.tokens[index] = JUMPS_PER_LIFE
+        self.total_jumps[index] = 0
+        self.collected[index] = 0
+        self.used[index] = 0
+        self.on_rotate[index] = False
+        self.status[index] = PLAYING
+        self.frames[index] = 0
+        self._spawn_pending[index] = False
+        self._load_level(index, self.numbers.index(level))
+
+    def step(self, actions):
+        """
+        Her oyuna bir hamle uygula (GameState.step'in vektör hali)
+
+        Args:
+            actions: N uzunluğunda hamle indeksleri (ACTION_INDEX)
+
+        Returns:
+            tuple: (rewards float32[N], done bool[N])
+        """
+        actions = np.asarray(actions, np.int32)
+        playing = self.status == PLAYING
+        self._picked[:] = 0
+        self._keys[:] = False
+        self._moving[:] = False
+        self._progress[:] = 0
+        self._alive[:] = True
+
+        # Jump modu aç/kapat
+        toggle = playing & (actions == JUMP)
+        self.will_jump ^= toggle
+
+        # GameState._try_move: önce jump token'ı, sonra sınır kontrolü
+        move = playing & ~toggle
+        jumping = move & self.will_jump
+        if not self.god_mode:
+            self.tokens -= jumping
+            self.total_jumps += jumping
+            out = jumping & (self.tokens <= 0)
+            self.lives -= out
+            self.tokens[out & (self.lives > 0)] = JUMPS_PER_LIFE
+            self._alive &= ~(out & (self.lives <= 0))
+        move &= self._alive
+        direction = np.where(move, actions, 0)
+        nx = self.px + _DX[direction]
+        ny = self.py + _DY[direction]
+        inside = ((nx >= 0) & (ny >= 0) & (nx < self._level_cols[self.level])
+                  & (ny < self._level_rows[self.level]))
+        start = move & inside
+        self._moving[start] = True
+        self._tx[start] = nx[start]
+        self._ty[start] = ny[start]
+        self._dir[start] = direction[start]
+
+        # Frame döngüsü: hareket bitene kadar, sonra bir yerleşme frame'i
+        phase = np.where(playing, 0, 2)
+        while True:
+            active = phase < 2
+            if not active.any():
+                break
+            self._frame(active)
+            ended = self.status != PLAYING
+            phase = np.where(active & (ended | (phase == 1)), 2,
+                             np.where(active & ~self._moving, 1, phase))
+
+        # Yıldız sayacı kazanma / ölüm sonrası sıfırlandığından toplama sayısı kullanılır
+        rewards = (self._picked * REWARD_STAR + self._keys * REWARD_KEY
+                   + (playing & (self.status == WIN)) * REWARD_WIN
+                   + (playing & (self.status == GAME_OVER)) * REWARD_GAME_OVER)
+        return rewards.astype(np.float32), self.status != PLAYING
+
+    def get_state(self, i):
+        """
+        i. oyunu GameState objesi olarak döndür (karşılaştırma / debug)
+
+        Returns:
+            GameState
+        """
+        state = GameState(self.world)
+        state.level = self.numbers[int(self.level[i])]
+        state.px, state.py = int(self.px[i]), int(self.py[i])
+        state.lives, state.tokens = int(self.lives[i]), int(self.tokens[i])
+        state.total_jumps = int(self.total_jumps[i])
+        state.stars = int(self.stars[i])
+        for name in ("has_key", "will_jump", "just_pushed", "on_rotate", "key_spawned", "key_taken"):
+            setattr(state, name, bool(getattr(self, name)[i]))
+        collected, used = int(self.collected[i]), int(self.used[i])
+        state.collected = frozenset(item for b, item in enumerate(self.items) if collected >> b & 1)
+        state.used_rotates = frozenset(cell for b, cell in enumerate(self.rotates) if used >> b & 1)
+        state.status = STATUS_CODES[int(self.status[i])]
+        state.frames = int(self.frames[i])
+        return state
+
+    # ============================================
+    # FRAME (GameState._frame karşılığı)
+    # ============================================
+
+    def _frame(self, active):
+        """Tek oyun frame'i (sadece active maskesindeki oyunlar ilerler)"""
+        self.frames += active
+        cell = (self.level * self._rows + self.py) * self._cols + self.px
+
+        # Oyuncu hareketi (GameState._frame)
+        update = active & self._alive
+        moving = update & self._moving
+        self._progress += moving
+        land = moving & (self._progress >= self._land_frame)
+        mid = moving & ~land
+        geometry = np.where(
+            mid,
+            self._cells + ((cell * 4 + self._dir) * 2 + self.will_jump) * self._frames_per_move
+            + self._progress - 1,
+            cell
+        )
+        if land.any():
+            self.px = np.where(land, self._tx, self.px)
+            self.py = np.where(land, self._ty, self.py)
+            self._check_landing(land)
+            self._moving &= ~land
+            self.will_jump &= ~land
+            landed = (self.level * self._rows + self.py) * self._cols + self.px
+            geometry = np.where(land, landed, geometry)
+        if not self.god_mode:
+            self._alive &= ~(update & (self.lives <= 0))
+
+        # Frame başı anahtar spawn'ı: sadece önceki frame'de yıldız toplayanlar
+        # için koşul değişmiş olabilir (level yüklemeleri spawn'ı kendisi yapar)
+        pending = self._spawn_pending & active
+        if pending.any():
+            self._maybe_spawn_key(np.flatnonzero(pending))
+            self._spawn_pending &= ~pending
+
+        # Toplama / rotate / kapı sadece bir şeye değen oyunlar için (sıkıştırılmış alt küme)
+        hot = np.flatnonzero(active & self._hot[geometry])
+        on_rotate = self.on_rotate
+        self.on_rotate = on_rotate & ~active
+        dead = active & ~self._alive
+        if hot.size:
+            self._touch(hot, geometry[hot], on_rotate[hot], dead)
+        if dead.any():
+            self.status[dead] = GAME_OVER
+            self._reset_progress(np.flatnonzero(dead))
+
+    def _touch(self, hot, geometry, on_rotate, dead):
+        """
+        Değilen yıldız, anahtar, rotate ve kapı (_frame'deki sırayla)
+
+        Args:
+            hot: Oyun indeksleri
+            geometry: Bu oyunların geometri satırları
+            on_rotate: Frame başındaki on_rotate (kenar algılama)
+            dead: Game over maskesi (rotate'e değen oyunlar bu frame ölmez)
+        """
+        zero = np.uint64(0)
+        collected = self.collected[hot]
+
+        # Yıldızlar (slotlar farklı hücreler; sıra önemsiz)
+        picked = np.zeros(hot.size, np.int32)
+        for bit in self._star_bits[:, geometry]:
+            new = (bit != 0) & ((collected & bit) == 0)
+            collected |= np.where(new, bit, zero)
+            picked += new
+        if picked.any():
+            lives = self.lives[hot]
+            self.lives[hot] = np.where(lives < MAX_MAIN_LIVES, np.minimum(lives + picked, MAX_MAIN_LIVES), lives)
+            self.stars[hot] += picked
+            self._picked[hot] += picked
+            self._spawn_pending[hot] |= picked > 0
+
+        # Anahtar
+        take = self.key_spawned[hot] & ~self.key_taken[hot] & self._key_hit[geometry]
+        if take.any():
+            taken = hot[take]
+            self.key_taken[taken] = True
+            self.has_key[taken] = True
+            self._keys[taken] = True
+            collected |= np.where(take, self._key_bit[self.level[hot]], zero)
+        self.collected[hot] = collected
+
+        # Rotate: satır sırasında ilk kullanılmamış rotate hücresi
+        used = self.used[hot]
+        collided_bit = np.zeros(hot.size, np.uint64)
+        for bit in self._rotate_bits[::-1, geometry]:
+            collided_bit = np.where((bit != 0) & ((used & bit) == 0), bit, collided_bit)
+        collided = collided_bit != 0
+        if collided.any():
+            trigger = collided & ~on_rotate
+            if trigger.any():
+                self.used[hot[trigger]] |= collided_bit[trigger]
+                self._switch_level(hot[trigger])
+            self.on_rotate[hot[collided]] = True
+            dead[hot[collided]] = False
+            hot, geometry = hot[~collided], geometry[~collided]
+
+        # Kapı
+        door = hot[self._door_hit[geometry]]
+        if door.size:
+            level = self.level[door]
+            door = door[self.has_key[door] & (self.stars[door] >= self._required[level])]
+            win = door[self._is_last[self.level[door]]]
+            advance = door[~self._is_last[self.level[door]]]
+            if win.size:
+                self.status[win] = WIN
+                self._reset_progress(win)
+            if advance.size:
+                self._load_level(advance, self._next[self.level[advance]])
+                self._reset_motion(advance)
+            dead[door] = False
+
+    def _check_landing(self, mask):
+        """GameState._check_landing (vektör)"""
+        pushed = mask & self.just_pushed
+        self.just_pushed &= ~pushed
+        cell = (self.level * self._rows + self.py) * self._cols + self.px
+        tile = self._tile[cell]
+        mask = mask & ~pushed & (tile != _TILE_NONE) & ~self.will_jump
+
+        self._take_hit(mask & (tile == _TILE_DAMAGE))
+        arrow = mask & (tile == _TILE_ARROW)
+        hurt = arrow & ~self._safe[cell]
+        self._take_hit(hurt)
+        push = arrow & ~(hurt & (self.lives <= 0)) if not self.god_mode else arrow
+        self.px = np.where(push, self._push_x[cell], self.px)
+        self.py = np.where(push, self._push_y[cell], self.py)
+        self.just_pushed |= push
+
+    def _take_hit(self, mask):
+        """Rules.take_hit (vektör)"""
+        if self.god_mode:
+            return
+        self.lives -= mask
+        self.tokens[mask & (self.lives > 0)] = JUMPS_PER_LIFE
+
+    # Aşağıdaki yardımcılar oyun indeksleri (np.flatnonzero) ile çalışır;
+    # level yükleme / rotate seyrek olduğundan sadece ilgili oyunlara dokunulur
+
+    def _maybe_spawn_key(self, index):
+        """Yeterli yıldız toplandıysa anahtarı spawn et"""
+        level = self.level[index]
+        spawn = (~self.key_spawned[index] & self._spawn_ok[level]
+                 & (self.stars[index] >= self._required[level]))
+        spawned = index[spawn]
+        self.key_spawned[spawned] = True
+        self.key_taken[spawned] = False
+
+    def _load_level(self, index, target):
+        """GameState._load_level: başlangıç konumu, envanter boş"""
+        self.level[index] = target
+        self.px[index] = self._start_x[target]
+        self.py[index] = self._start_y[target]
+        self.stars[index] = 0
+        for flags in (self.has_key, self.will_jump, self.just_pushed, self.key_spawned, self.key_taken):
+            flags[index] = False
+        self._maybe_spawn_key(index)
+
+    def _reset_motion(self, index):
+        """Yeni Player oluşturulmuş gibi (durağan, canlı)"""
+        self._moving[index] = False
+        self._alive[index] = True
+
+    def _reset_progress(self, index):
+        """Kazanma / game over: ilerleme sıfırlanır, level yeniden yüklenir (canlar korunur)"""
+        self.collected[index] = 0
+        self.used[index] = 0
+        self.on_rotate[index] = False
+        self._load_level(index, self.level[index])
+        self._reset_motion(index)
+
+    def _switch_level(self, index):
+        """Rotate geçişi: yıldız, anahtar ve grid konumu taşınır"""
+        stars, has_key = self.stars[index], self.has_key[index]
+        px, py = self.px[index], self.py[index]
+        target = self._rotate_target[self.level[index]]
+        self._load_level(index, target)
+        self.stars[index] = stars
+        self.has_key[index] = has_key
+        self.px[index] = np.minimum(px, self._level_cols[target] - 1)
+        self.py[index] = np.minimum(py, self._level_rows[target] - 1)
+        self._maybe_spawn_key(index)
+        self._reset_motion(index)
+
+if np is not None:
+    _DX = np.array([ACTION_VECTORS[action][0] for action in ACTIONS[:4]] + [0])
+    _DY = np.array([ACTION_VECTORS[action][1] for action in ACTIONS[:4]] + [0])
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import random
+    import time
+    from Scripts.Core.GameState import new_game, step
+
+    print("=== BatchSim Test ===\n")
+    world = World.from_level_data()
+
+    # Parite: her oyun skaler GameState ile yan yana oynatılır
+    n, steps = 64, 400
+    rng = random.Random(7)
+    sim = BatchSim(n, world)
+    states = [new_game(world) for _ in range(n)]
+    mismatches = 0
+    for _ in range(steps):
+        actions = [rng.randrange(len(ACTIONS)) for _ in range(n)]
+        _, done = sim.step(actions)
+        for i, action in enumerate(actions):
+            states[i], _ = step(states[i], ACTIONS[action])
+            if sim.get_state(i).key() != states[i].key() or sim.get_state(i).frames != states[i].frames:
+                mismatches += 1
+        if done.any():
+            sim.reset(done)
+            for i in range(n):
+                if done[i]:
+                    states[i] = new_game(world)
+    print(f"Parity ({n} games x {steps} steps): {'✅' if mismatches == 0 else '❌'} {mismatches} mismatches")
+
+    # Hız
+    n = 100_000
+    sim = BatchSim(n, world)
+    actions = np.random.default_rng(0).integers(0, len(ACTIONS), size=(50, n))
+    started = time.perf_counter()
+    for row in actions:
+        _, done = sim.step(row)
+        sim.reset(done)
+    elapsed = time.perf_counter() - started
+    print(f"Throughput: {actions.size / elapsed:,.0f} steps/s ({n} games)")
+    print("\n=== Test Complete ===")
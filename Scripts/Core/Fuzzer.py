@@ -0,0 +1,406 @@
+"""
+ReVerse - Gameplay Fuzzer
+Rastgele / yönlendirilmiş hamle dizilerini process pool'da oynatır, her
+hamleden sonra oyun invariant'larını kontrol eder ve hata bulunan dizileri
+minimal tekrar üretim örneğine küçültür (shrink)
+"""
+import contextlib
+import io
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config import MAX_MAIN_LIVES, JUMPS_PER_LIFE
+from Scripts.Core.GameState import (
+    World, new_game, step, ACTIONS, ACTION_JUMP,
+    EVENT_KEY_SPAWN, EVENT_ROTATE, EVENT_LEVEL, EVENT_WIN, EVENT_GAME_OVER
+)
+
+TARGET_SIM = "sim"    # Headless GameState (hızlı)
+TARGET_GAME = "game"  # Gerçek GameManager (SDL dummy sürücü) + GameState ile karşılaştırma
+TARGETS = (TARGET_SIM, TARGET_GAME)
+
+POLICY_UNIFORM = "uniform"    # Her hamle eşit olasılık
+POLICY_STICKY = "sticky"      # Önceki hamleyi tekrarlamaya meyilli (koridor / kenar)
+POLICY_WEIGHTED = "weighted"  # Bölüm başına rastgele hamle ağırlıkları
+POLICY_JUMPY = "jumpy"        # Sık jump modu (token / can tükenmesi)
+POLICIES = (POLICY_UNIFORM, POLICY_STICKY, POLICY_WEIGHTED, POLICY_JUMPY)
+
+DEFAULT_STEPS = 60
+
+# Level geçişi: anahtar spawn takibi yeniden başlar
+_LEVEL_EVENTS = (EVENT_ROTATE, EVENT_LEVEL, EVENT_WIN, EVENT_GAME_OVER)
+
+
+# ============================================
+# HAMLE DİZİLERİ (Policies)
+# ============================================
+
+def episode_actions(seed, max_steps=DEFAULT_STEPS):
+    """
+    Seed'den deterministik hamle dizisi üret
+
+    Args:
+        seed (int): Bölüm seed'i (policy de buradan seçilir)
+        max_steps (int): Dizi uzunluğu
+
+    Returns:
+        tuple: (policy adı, hamle listesi)
+    """
+    rng = random.Random(seed)
+    policy = POLICIES[seed % len(POLICIES)]
+    weights = [1.0] * len(ACTIONS)
+    if policy == POLICY_WEIGHTED:
+        weights = [rng.random() + 0.05 for _ in ACTIONS]
+    elif policy == POLICY_JUMPY:
+        weights[ACTIONS.index(ACTION_JUMP)] = len(ACTIONS)
+
+    actions = []
+    for _ in range(max_steps):
+        if policy == POLICY_STICKY and actions and rng.random() < 0.7:
+            actions.append(actions[-1])
+        else:
+            actions.append(rng.choices(ACTIONS, weights)[0])
+    return policy, actions
+
+
+# ============================================
+# INVARIANT'LAR
+# ============================================
+
+def check_state(state):
+    """
+    GameState invariant'ları
+
+    Returns:
+        tuple: (invariant adı, mesaj) veya None
+    """
+    if not 0 <= state.lives <= MAX_MAIN_LIVES:
+        return "lives", f"lives={state.lives} outside [0, {MAX_MAIN_LIVES}]"
+    if not 0 <= state.tokens <= JUMPS_PER_LIFE:
+        return "tokens", f"tokens={state.tokens} outside [0, {JUMPS_PER_LIFE}]"
+    level = state.world.level(state.level)
+    if not (0 <= state.px < level.cols and 0 <= state.py < level.rows):
+        return "bounds", f"player ({state.px},{state.py}) outside {level.cols}x{level.rows} grid"
+
+    # Taşınan yıldızlar toplanmış kayıtlardan fazla olamaz; anahtar varsa kaydı da olmalı
+    stars = sum(1 for item in state.collected if item[0] == "star")
+    if state.stars > stars:
+        return "collected", f"stars={state.stars} but only {stars} stars recorded as collected"
+    if state.has_key and not any(item[0] == "key" for item in state.collected):
+        return "collected", "has_key without a collected key record"
+    if state.key_taken and not state.key_spawned:
+        return "key_spawn", "key taken before it was spawned"
+    return None
+
+
+def check_key_spawns(events, spawned):
+    """
+    Aynı level ziyaretinde ikinci anahtar spawn'ı olmamalı
+
+    Args:
+        events (list): step() olayları
+        spawned (bool): Bu level ziyaretinde anahtar zaten spawn oldu mu
+
+    Returns:
+        tuple: (spawned, hata veya None)
+    """
+    for name, _ in events:
+        if name in _LEVEL_EVENTS:
+            spawned = False
+        elif name == EVENT_KEY_SPAWN:
+            if spawned:
+                return spawned, ("key_spawn", "key spawned twice in the same level visit")
+            spawned = True
+    return spawned, None
+
+
+def check_game(game):
+    """
+    GameManager sahnesi oyunun kendi GameState'iyle (game.sim) tutarlı mı
+    (oyuncu konumu, level, HUD kaynakları, toplananlar, sahnedeki anahtar)
+
+    Returns:
+        tuple: (invariant adı, mesaj) veya None
+    """
+    sim = game.sim
+    info = game.resource_manager.get_lives_info()
+    if (info['main_lives'], info['jump_tokens']) != (sim.lives, sim.tokens):
+        return "lives", (f"HUD lives/tokens {info['main_lives']}/{info['jump_tokens']} "
+                         f"!= state {sim.lives}/{sim.tokens}")
+    if game.current_level != sim.level:
+        return "level", f"scene shows level {game.current_level}, state is on level {sim.level}"
+    player = game.player
+    if (player.grid_x, player.grid_y) != (sim.px, sim.py) or player.turn_state == "moving":
+        return "bounds", f"player drawn at ({player.grid_x},{player.grid_y}), state has ({sim.px},{sim.py})"
+
+    keys = [item for item in game.collectibles if item.__class__.__name__ == 'Key']
+    if len(keys) > 1:
+        return "key_spawn", f"{len(keys)} Key objects in level"
+    visible = sum(1 for item in keys if not item.collected)
+    if visible != (sim.key_spawned and not sim.key_taken):
+        return "key_spawn", f"{visible} visible keys, state key_spawned={sim.key_spawned} key_taken={sim.key_taken}"
+    for item in game.collectibles:
+        if item.__class__.__name__ == 'Star':
+            taken = ('star', item.x // item.size, item.y // item.size) in sim.collected
+            if item.collected != taken:
+                return "collected", f"star at ({item.x // item.size},{item.y // item.size}) collected={item.collected}, state {taken}"
+    return None
+
+
+# ============================================
+# BÖLÜM OYNATMA (Runners)
+# ============================================
+
+def run_sim(world, actions):
+    """
+    Hamle dizisini GameState üzerinde oynat, ilk invariant ihlalinde dur
+
+    Returns:
+        tuple: (oynanan hamle, son GameState, hata veya None)
+    """
+    state = new_game(world)
+    spawned = state.key_spawned
+    for i, action in enumerate(actions):
+        state, events = step(state, action)
+        spawned, failure = check_key_spawns(events, spawned)
+        failure = failure or check_state(state)
+        if failure or state.is_terminal():
+            return i + 1, state, failure
+    return len(actions), state, None
+
+
+class HeadlessGame:
+    """
+    Gerçek GameManager'ı ekran olmadan (SDL dummy sürücü) hamle hamle sürer.
+    Hamle GameManager.start_turn'e verilir; tur bitene kadar frame'ler sabit
+    1/FPS dt ile GameManager.update üzerinden oynatılır (çizim yapılmaz).
+    """
+
+    def __init__(self, world):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        import config
+        from Scripts.Core.GameManager import GameManager
+        config.GOD_MODE = world.god_mode  # GameManager / ResourceManager config'i okur
+        self._dt = 1.0 / config.FPS
+        self.world = world
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game = GameManager(record=False)
+        self.game.best_times_path = os.devnull  # Fuzz kazanmaları en iyi süreyi yazmasın
+
+    def reset(self):
+        """Yeni oyun (Level 1, tam can)"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game.reset_level()
+
+    def step(self, action):
+        """Hamleyi başlat ve tur (animasyon + sahne eşitleme) bitene kadar frame oynat"""
+        game = self.game
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.start_turn(action)
+            while game.turn_ticks:
+                game.update(self._dt)
+
+
+def run_game(headless, actions):
+    """
+    Hamle dizisini GameManager ve GameState üzerinde yan yana oynat
+    (iki tarafın invariant'ları + durum eşitliği kontrol edilir)
+
+    Returns:
+        tuple: (oynanan hamle, son GameState, hata veya None)
+    """
+    headless.reset()
+    state = new_game(headless.world)
+    spawned = state.key_spawned
+    for i, action in enumerate(actions):
+        headless.step(action)
+        state, events = step(state, action)
+        spawned, failure = check_key_spawns(events, spawned)
+        failure = failure or check_state(state) or check_game(headless.game)
+        if failure is None:
+            snapshot = headless.game.snapshot_state(headless.world)
+            if snapshot.key() != state.key():
+                failure = ("parity", f"GameManager {snapshot} != GameState {state}")
+        if failure or state.is_terminal():
+            return i + 1, state, failure
+    return len(actions), state, None
+
+
+# ============================================
+# SHRINK
+# ============================================
+
+def shrink(actions, invariant, run):
+    """
+    Hata veren diziyi aynı invariant'ı bozmaya devam eden en kısa diziye indir
+    (önce hataya kadar olan kısım, sonra yarılanan parçaları silme)
+
+    Args:
+        actions (list): Hata veren hamle dizisi
+        invariant (str): Korunacak invariant adı
+        run: actions -> (oynanan, state, hata) fonksiyonu
+
+    Returns:
+        list: Minimal hamle dizisi
+    """
+    def fails(candidate):
+        played, _, failure = run(candidate)
+        return played if failure and failure[0] == invariant else 0
+
+    played = fails(actions)
+    if not played:
+        return list(actions)
+    actions = list(actions[:played])
+    chunk = max(1, len(actions) // 2)
+    while True:
+        changed = False
+        i = 0
+        while i < len(actions):
+            candidate = actions[:i] + actions[i + chunk:]
+            played = fails(candidate) if candidate else 0
+            if played:
+                actions = candidate[:played]
+                changed = True
+            else:
+                i += chunk
+        if not changed:
+            if chunk == 1:
+                return actions
+            chunk = max(1, chunk // 2)
+
+
+# ============================================
+# WORKER + POOL
+# ============================================
+
+_worker_cache = {}
+
+
+def _runner(target, god_mode):
+    """Process başına bir kez World / HeadlessGame oluştur"""
+    key = (target, god_mode)
+    if key not in _worker_cache:
+        world = World.from_level_data(god_mode=god_mode)
+        if target == TARGET_GAME:
+            headless = HeadlessGame(world)
+            _worker_cache[key] = lambda actions: run_game(headless, actions)
+        else:
+            _worker_cache[key] = lambda actions: run_sim(world, actions)
+    return _worker_cache[key]
+
+
+def fuzz_chunk(job):
+    """
+    Seed aralığını oyna (ProcessPoolExecutor worker'ı)
+
+    Args:
+        job (tuple): (ilk seed, bölüm sayısı, max_steps, target, god_mode)
+
+    Returns:
+        dict: Sayımlar ve invariant başına ilk (küçültülmüş) hata
+    """
+    first_seed, count, max_steps, target, god_mode = job
+    run = _runner(target, god_mode)
+    result = {"episodes": 0, "steps": 0, "outcomes": {}, "violations": {}, "failures": []}
+    seen = set()
+    for seed in range(first_seed, first_seed + count):
+        policy, actions = episode_actions(seed, max_steps)
+        played, state, failure = run(actions)
+        result["episodes"] += 1
+        result["steps"] += played
+        outcome = state.status if failure is None else "failed"
+        result["outcomes"][outcome] = result["outcomes"].get(outcome, 0) + 1
+        if failure is None:
+            continue
+        name, message = failure
+        result["violations"][name] = result["violations"].get(name, 0) + 1
+        if name in seen:
+            continue
+        seen.add(name)
+        minimal = shrink(actions[:played], name, run)
+        result["failures"].append({
+            "invariant": name,
+            "message": run(minimal)[2][1],
+            "seed": seed,
+            "policy": policy,
+            "original_length": played,
+            "actions": minimal
+        })
+    return result
+
+
+def fuzz(episodes, jobs=None, seed=0, max_steps=DEFAULT_STEPS, target=TARGET_SIM, god_mode=False):
+    """
+    Bölümleri process pool'da oynat
+
+    Args:
+        episodes (int): Toplam bölüm sayısı (seed, seed+1, ... )
+        jobs (int): Process sayısı (None = CPU sayısı, 1 = aynı process)
+        seed (int): İlk seed
+        max_steps (int): Bölüm başına en fazla hamle
+        target (str): "sim" veya "game"
+        god_mode (bool): Can kaybı yok
+
+    Returns:
+        dict: {"summary": {...}, "failures": [...]}
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown fuzz target: {target}")
+    workers = max(1, jobs or os.cpu_count() or 1)
+    chunk = max(1, min(2000, episodes // (workers * 4) or 1))
+    tasks = [(start, min(chunk, seed + episodes - start), max_steps, target, god_mode)
+             for start in range(seed, seed + episodes, chunk)]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [fuzz_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fuzz_chunk, tasks))
+    elapsed = time.perf_counter() - started
+
+    summary = {"episodes": 0, "steps": 0, "outcomes": {}, "violations": {}}
+    failures = {}
+    for result in results:
+        summary["episodes"] += result["episodes"]
+        summary["steps"] += result["steps"]
+        for field in ("outcomes", "violations"):
+            for name, count in result[field].items():
+                summary[field][name] = summary[field].get(name, 0) + count
+        for failure in result["failures"]:
+            known = failures.get(failure["invariant"])
+            if known is None or len(failure["actions"]) < len(known["actions"]):
+                failures[failure["invariant"]] = failure
+
+    summary.update({
+        "target": target,
+        "jobs": workers,
+        "seed": seed,
+        "max_steps": max_steps,
+        "elapsed": round(elapsed, 3),
+        "episodes_per_min": round(summary["episodes"] / elapsed * 60) if elapsed > 0 else None
+    })
+    return {"summary": summary, "failures": sorted(failures.values(), key=lambda f: f["invariant"])}
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    print("=== Fuzzer Test ===\n")
+    report = fuzz(4000, jobs=1)
+    print(f"Sim: {report['summary']}")
+    for failure in report["failures"]:
+        print(f"  ❌ {failure['invariant']}: {failure['message']} <- {failure['actions']}")
+
+    report = fuzz(40, jobs=1, target=TARGET_GAME)
+    print(f"\nGame: {report['summary']}")
+    for failure in report["failures"]:
+        print(f"  ❌ {failure['invariant']}: {failure['message']} <- {failure['actions']}")
+
+    # Shrink: yapay invariant ile küçültme kontrolü
+    fake = lambda actions: (len(actions), None, ("demo", "") if actions.count("left") >= 2 else None)
+    print(f"\nShrink demo: {shrink(['up', 'left', 'jump', 'down', 'left', 'right'], 'demo', fake)}")
+    print("\n=== Test Complete ===")
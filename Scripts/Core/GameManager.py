@@ -1,6 +1,8 @@
 """
 ReVerse - Game Manager
 Ana oyun döngüsü ve state yönetimi (Unity GameManager benzeri)
+Oynanış kuralları GameState.step'te; GameManager hamleyi oraya verir,
+dönen durum ve olaylara göre sahneyi canlandırır ve çizer
 """
 import pygame
 import sys
@@ -11,8 +13,28 @@ from config import *
 from Scripts.Utils.Constants import *
 from Levels.LevelData import LevelData
 from Levels.LevelLoader import LevelLoader
-from Scripts.Systems.RotationManager import RotationManager
+from Scripts.Core import Rules
+from Scripts.Core.GameState import (
+    World, new_game, step,
+    EVENT_MOVE, EVENT_BLOCKED, EVENT_JUMP_MODE, EVENT_JUMP, EVENT_JUMPED_OVER, EVENT_DAMAGE, EVENT_PUSH,
+    EVENT_STAR, EVENT_KEY_SPAWN, EVENT_KEY, EVENT_ROTATE, EVENT_DOOR_LOCKED,
+    EVENT_LEVEL, EVENT_WIN, EVENT_GAME_OVER
+)
+from Scripts.Entities.Collectible import Star, Key
 from Scripts.Systems.ResourceManager import ResourceManager
+from Scripts.Systems.SpriteCache import sprite_cache
+from Scripts.Systems.DirtyRectRenderer import DirtyRectRenderer
+from Scripts.Systems.TextCache import TextCache
+from Scripts.Systems.GlyphAtlas import GlyphAtlas
+from Scripts.Systems.Presenter import Presenter
+from Scripts.Systems.PanelCache import RetainedPanel
+from Scripts.Systems.GameClock import GameClock
+from Scripts.Systems.Replay import ReplayWriter, ReplayKeys, ACTION_RESTART, ACTION_GOD
+
+# Level'e özel oyuncu sprite'ları (diğer levellerde varsayılan Avatar)
+PLAYER_SPRITES = {
+    2: "Assets/Sprites/Avatar_Level2.png"
+}
 
 class GameManager:
     """
@@ -20,7 +42,19 @@ class GameManager:
     Unity MonoBehaviour.Singleton benzeri
     """
     
-    def __init__(self):
+    def __init__(self, replay=None, record=None, speed=None, headless=False):
+        """
+        Args:
+            replay: ReplayReader (verilirse klavye yerine kayıttaki hamleler oynatılır)
+            record (bool): Oturumu replays/ altına kaydet (None = config.REPLAY_RECORD)
+            speed (float): Simülasyon hız çarpanı (None = config.SIM_SPEED; 2-100x replay/demo)
+            headless (bool): Pencere ve çizim yok, simülasyon CPU'nun izin verdiği hızda
+        """
+        # Headless: gerçek pencere açma (sprite yükleme için dummy video sürücüsü yeterli)
+        self.headless = headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         # Pygame başlatma
         pygame.init()
         
@@ -41,51 +75,85 @@ class GameManager:
         # Ortak kaynak yöneticisi (can + jump token) — level geçişinde korunur
         self.resource_manager = ResourceManager()
         
-        # Render surface (gerçek oyun grid boyutunda)
-        self.render_surface = pygame.Surface((GRID_SIZE * GRID_COLS, GRID_SIZE * GRID_ROWS))
+        # Render surface (kamera görüş alanı; level yüklenince level boyutuna göre ayarlanır)
+        # Statik katman (arka plan + grid + tile'lar) level_loader'ın parça önbelleğinden çizilir
+        self.render_surface = pygame.Surface((GRID_SIZE * VIEW_COLS, GRID_SIZE * VIEW_ROWS))
+        
+        # Kamera (dünya koordinatında görüş alanının sol üstü)
+        self.camera_x = 0
+        self.camera_y = 0
         
         # Saat (FPS kontrolü)
         self.clock = pygame.time.Clock()
+        # Frame saati: gerçek zaman x hız çarpanı (duraklatılınca simülasyon durur)
+        self.frame_clock = GameClock(scale=SIM_SPEED if speed is None else speed)
+        self._last_frame_time = self.frame_clock.now()
+        # Oyun saati: sadece simülasyon tick'leriyle ilerler (input cooldown, animasyon, toplam süre)
+        self.game_clock = GameClock(manual=True)
+        
+        # Kirli bölge sunumu (sadece değişen bölgeler pencereye gönderilir)
+        self.dirty = DirtyRectRenderer()
+        self._last_frame_signature = None
+        self._last_camera_offset = None
+        
+        # Sunum katmanı (kalıcı ölçek buffer'ı); yerleşim sadece resize/F10/F11'de hesaplanır
+        self.presenter = Presenter(PRESENT_MODE)
+        self._layout_dirty = True
+        self._screen_size = self.screen.get_size()
         
         # Oyun durumu
         self.state = STATE_PLAYING
         self.current_level = 1
         self.running = True
         
-        # Toplanan öğeleri level bazında kaydet: ('star'|'key', gx, gy)
-        self.collected_by_level = {}
-        # Tüm seviyeler arası global toplanan seti (tip, gx, gy)
-        self.collected_global = set()
-        # Rotate sembollerini tek seferlik yapmak için kullanılan set (level-> {(gx,gy)})
-        self.used_rotation_symbols = {}
+        # Oyun kuralları: headless simülasyon (level'lar istendikçe okunur)
+        # sim hamleler arasındaki gerçek durum; sahne her tur sonunda ona eşitlenir
+        self.world = World.from_level_data(god_mode=config.GOD_MODE, lazy=True)
+        self.sim = new_game(self.world, self.current_level)
+        # Sürmekte olan turun kalan tick'i (animasyon sim'in hamle süresini izler)
+        self.turn_ticks = 0
+        self._turn_events = None
 
         # Level sistemi
-        self.level_loader = LevelLoader(GRID_SIZE)
+        self.level_loader = LevelLoader(GRID_SIZE, clock=self.game_clock)
+        # Başlangıç level'ını, rotate karşılığını ve entity havuzunu önceden kur
+        # (rotate / reset / spawn sırasında oluşturma yok; paketin geri kalanı istendikçe kurulur)
+        self.warm_up_levels(self.current_level)
+        for path in PLAYER_SPRITES.values():
+            try:
+                sprite_cache.get(path, (GRID_SIZE, GRID_SIZE))
+            except (FileNotFoundError, pygame.error) as e:
+                print(f"⚠️ Sprite warm-up failed ({path}): {e}")
         self.load_level(self.current_level)
         
-        # Kamera
-        self.camera_x = 0
-        self.camera_y = 0
-        
         # Font (scale'e göre ayarlanmış)
         self.font_small = pygame.font.Font(None, int(20 * SCALE))
         self.font_medium = pygame.font.Font(None, int(28 * SCALE))
         self.font_large = pygame.font.Font(None, int(48 * SCALE))
         
-        # Font cache (HUD metinleri için)
-        self._font_cache = {}
+        # Font + render önbelleği (HUD metinleri için, LRU)
+        self.text_cache = TextCache(max_entries=HUD_TEXT_CACHE_SIZE)
         self._init_font_cache()
+        # Timer rakamları için font boyutu başına glyph atlası
+        self._glyph_atlases = {}
+        # HUD yerleşim önbelleği (pencere boyutu / metin değişince yenilenir)
+        self._hud_layout_key = None
+        self._hud_layout = None
+
+        # Overlay panelleri bir kez oluşturulur; içerik veya pencere boyutu değişince yenilenir
+        self._panels = {
+            "debug": RetainedPanel(self._build_debug_panel),
+            "help": RetainedPanel(self._build_help_panel),
+            "win": RetainedPanel(self._build_end_screen),
+            "game_over": RetainedPanel(self._build_end_screen)
+        }
+        self._debug_lines = None
+        self._debug_sampled_at = 0.0
 
         # Debug overlay
         self.debug_enabled = False
         # Help overlay (TAB to toggle)
         self.help_enabled = True
-        # Rotation Manager
-        self.rotation_manager = RotationManager()
-        # Rotate tetikleme cooldown (seviye geçişinde çifte tetiklemeyi önler)
-        self.rotate_cooldown = 0.0
-        # Rotate tetikleme kenar algılama (üzerinden ayrılmadan tekrar tetiklenmesin)
-        self.on_rotate = False
         
         # Zamanlayıcı ve en iyi süreler (TOTAL game time, not per level)
         self.total_start_time = 0.0  # Oyun başlangıç zamanı (Level 1 ilk frame)
@@ -93,29 +161,37 @@ class GameManager:
         self.best_time = None        # En iyi TOTAL süre (tek bir değer)
         self.best_times_path = os.path.join(os.getcwd(), "best_times.json")
         self._load_best_times()
-        
-        # Anahtar spawn kontrolü
-        self.key_spawn_point = None
-        self.key_spawned = False
+
+        # Sabit adımlı simülasyon: her tick SIM_TICK_DT; render frame'leri tick'lerden bağımsız
+        self.ticks = 0
+        self._accumulator = 0.0
+
+        # Replay: kayıt / oynatma (tick numaraları sabit adım sayesinde tekrarlanabilir)
+        self.replay = replay
+        self.recorder = None
+        self._replay_action = None
+        if replay is not None:
+            config.GOD_MODE = replay.god_mode
+            self.world.god_mode = replay.god_mode
+            if replay.level != self.current_level:
+                self.warm_up_levels(replay.level)
+                self.sim = new_game(self.world, replay.level)
+                self._apply_state(reload=True)
+            if not replay.matches_config:
+                print("⚠️ Replay was recorded with different settings/levels - playback may diverge")
+            print(f"▶️ {replay}")
+        elif config.REPLAY_RECORD if record is None else record:
+            try:
+                self.recorder = ReplayWriter.new_session(level=self.current_level, god_mode=config.GOD_MODE)
+                print(f"⏺️ Recording replay: {self.recorder.path}")
+            except OSError as e:
+                print(f"⚠️ Replay recording disabled: {e}")
     
     def _init_font_cache(self):
         """HUD için sık kullanılan font boyutlarını önbellek"""
         base_sizes = [12, 14, 16, 18, 20]
         for size in base_sizes:
-            scaled_size = int(size * SCALE)
-            try:
-                self._font_cache[scaled_size] = pygame.font.SysFont('consolas', scaled_size, bold=False)
-            except:
-                self._font_cache[scaled_size] = pygame.font.Font(None, scaled_size)
-    
-    def _get_cached_font(self, size):
-        """Cache'den font al, yoksa oluştur"""
-        if size not in self._font_cache:
-            try:
-                self._font_cache[size] = pygame.font.SysFont('consolas', size, bold=False)
-            except:
-                self._font_cache[size] = pygame.font.Font(None, size)
-        return self._font_cache[size]
+            self.text_cache.font(int(size * SCALE))
     
     def toggle_fullscreen(self):
         """Tam ekran modunu aç/kapat"""
@@ -135,6 +211,8 @@ class GameManager:
             print("🖥️ Windowed mode (F11 for fullscreen)")
         # Tam ekran değişiminde maximize bayrağını sıfırla
         self.is_maximized = False
+        self._layout_dirty = True
+        self.dirty.mark_full()
 
     def toggle_maximize(self):
         """Pencereyi ekran boyutuna büyüt/küçült (windowed maximize)."""
@@ -151,7 +229,23 @@ class GameManager:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
             self.is_maximized = False
             print("🗗 Window restored (F10 to maximize)")
+        self._layout_dirty = True
+        self.dirty.mark_full()
     
+    def warm_up_levels(self, level_number):
+        """
+        Level'ı ve rotate ile geçilen karşı level'ı önbellekte hazırla
+
+        Args:
+            level_number (int): Oynanacak level
+        """
+        levels = {}
+        for number in (level_number, Rules.other_level(level_number)):
+            level_data = LevelData.get_level(number)
+            if level_data:
+                levels[number] = level_data
+        self.level_loader.warm_up(levels)
+
     def load_level(self, level_number):
         """
         Belirli bir level'i yükle
@@ -166,7 +260,7 @@ class GameManager:
             return False
         
         try:
-            self.level_objects = self.level_loader.load_level(level_data)
+            self.level_objects = self.level_loader.load_level(level_data, level_id=level_number)
             self.player = self.level_objects["player"]
             self.tiles = self.level_objects["tiles"]
             self.collectibles = self.level_objects["collectibles"]
@@ -179,67 +273,22 @@ class GameManager:
                 pass
             # Level'e özel oyuncu sprite'ı uygula
             try:
-                if level_number == 2:
-                    self.player.set_sprite("Assets/Sprites/Avatar_Level2.png")
+                if level_number in PLAYER_SPRITES:
+                    self.player.set_sprite(PLAYER_SPRITES[level_number])
                 else:
                     self.player.restore_default_sprite()
             except Exception as e:
                 print(f"⚠️ Level sprite switch failed: {e}")
-            # Anahtar spawn noktası (anahtar başlangıçta gizli)
+            # Anahtar spawn noktası (anahtar sim spawn edene kadar gizli)
             self.key_spawn_point = self.level_objects.get("key_spawn_point")
             self.key_spawned = False
-            # Her level'de kapı için anahtar gereksinimi varsayılan: True
-            try:
-                self.player.require_key = True
-            except Exception:
-                pass
+            self.current_level = level_number
 
-            # Tek seferlik kullanılan rotate sembollerini filtrele
-            used_set = self.used_rotation_symbols.get(level_number, set())
-            if used_set:
-                kept = []
-                for sym in self.rotation_symbols:
-                    gx = sym.x // GRID_SIZE
-                    gy = sym.y // GRID_SIZE
-                    if (gx, gy) not in used_set:
-                        kept.append(sym)
-                self.rotation_symbols = kept
-            
-            # Daha önce toplananları gizle (hem bu level'a ait kayıtlar hem global kayıtlar)
-            hidden = 0
-            collected_set = self.collected_by_level.get(level_number, set())
-            for item in self.collectibles:
-                gx = item.x // GRID_SIZE if hasattr(item, 'x') else 0
-                gy = item.y // GRID_SIZE if hasattr(item, 'y') else 0
-                if item.__class__.__name__ == 'Star':
-                    key = ('star', gx, gy)
-                elif item.__class__.__name__ == 'Key':
-                    key = ('key', gx, gy)
-                else:
-                    key = None
-                if key and (key in collected_set or key in self.collected_global):
-                    item.collected = True
-                    hidden += 1
-            if hidden:
-                print(f"🙈 Hidden previously collected items: {hidden}")
-
-            # Timer sadece Level 1 yüklendiğinde sıfırlanır (ilk draw frame'inde başlayacak)
-            # Level 2+ geçişlerinde timer devam eder
-            if level_number == 1:
-                self.total_start_time = 0.0
-            # Yıldız şartı zaten sağlanmışsa anahtarı hemen göster
-            self._maybe_spawn_key_if_ready()
-
-            # Level bilgisini player'a aktarılabilir yap
-            try:
-                self.player.current_level = level_number
-            except Exception:
-                pass
-            # Level 1'de push ok hasarı kapalı (eski davranış, artık koordinat kontrolü kullanılıyor)
-            try:
-                self.player.push_damage_enabled = True  # Varsayılan aktif; sadece (2,1) hariç
-            except Exception:
-                pass
+            # Toplananlar, tüketilen rotate'ler, oyuncu konumu ve envanter sim'den
+            self._sync_scene()
+            # Görüş alanını level boyutuna uydur ve kamerayı oyuncuya oturt (kayarak gelmesin)
+            self._fit_view()
+            self.update_camera(snap=True)
             print(f"✅ Level {level_number} loaded successfully!")
             return True
         
@@ -248,26 +297,120 @@ class GameManager:
             return False
     
     def run(self):
-        """Ana oyun döngüsü (Unity Update loop benzeri)"""
+        """
+        Ana oyun döngüsü (Unity Update loop benzeri)
+        Gerçek zaman (x speed) accumulator'a eklenir, simülasyon sabit SIM_TICK_DT
+        adımlarla ilerler; frame başına bir kez çizilir
+        """
+        if self.headless:
+            self.run_headless()
+            self.quit()
+            return
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time (saniye)
+            wait_ms = self._idle_wait_ms() if LOOP_MODE == "adaptive" else 0
+            if wait_ms > 0:
+                # Boşta: event gelene veya bir sonraki düşük kadanslı frame'e kadar bekle
+                event = pygame.event.wait(wait_ms)
+                events = pygame.event.get()
+                if event.type != pygame.NOEVENT:
+                    events.insert(0, event)
+                self.clock.tick()
+            else:
+                events = None
+                self.clock.tick(FPS)  # Sadece kadans; süre frame_clock'tan (perf_counter)
+            now = self.frame_clock.now()
+            dt = now - self._last_frame_time
+            self._last_frame_time = now
+            # Uzun beklemeden sonra simülasyon sıçramasın (en fazla MAX_FRAME_DT x speed yetişir)
+            self._accumulator += min(dt, MAX_FRAME_DT * self.frame_clock.scale)
             
-            self.handle_events()
-            self.update(dt)
+            self.handle_events(events)
+            while self._accumulator >= SIM_TICK_DT and self.running:
+                self.update(SIM_TICK_DT)
+                self._accumulator -= SIM_TICK_DT
             self.draw()
             
-            pygame.display.flip()
+            # Sadece kirli bölgeleri gönder (resize/state değişiminde tam flip)
+            self.dirty.present(self.screen)
         
         self.quit()
     
-    def handle_events(self):
+    def run_headless(self, max_ticks=None):
+        """
+        Çizimsiz, beklemesiz simülasyon (replay doğrulama, demo, benchmark).
+        Replay bitince (veya max_ticks sonra) durur.
+
+        Args:
+            max_ticks (int): Tick sınırı (None = replay sonu; replay yoksa sınırsız)
+
+        Returns:
+            int: Simüle edilen tick sayısı
+        """
+        import time
+        started = time.perf_counter()
+        first_tick = self.ticks
+        while self.running:
+            if max_ticks is not None and self.ticks - first_tick >= max_ticks:
+                break
+            if self.replay is not None and self.ticks > self.replay.end_tick:
+                break
+            pygame.event.pump()
+            self.update(SIM_TICK_DT)
+        ticks = self.ticks - first_tick
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        print(f"⏩ Headless: {ticks} ticks in {elapsed:.3f}s ({ticks / elapsed:,.0f} ticks/s, "
+              f"{ticks * SIM_TICK_DT / elapsed:,.0f}x real time)")
+        print(f"🏁 Final state: {self.snapshot_state()}")
+        return ticks
+    
+    def _idle_wait_ms(self):
+        """
+        Boşta bekleme süresini hesapla (adaptive loop)
+        
+        Returns:
+            int: event.wait zaman aşımı (ms), 0 ise tam FPS ile çalış
+        """
+        if self._layout_dirty:
+            return 0
+        if self.frame_clock.paused:
+            return max(1, 1000 // IDLE_FPS)
+        if self.replay is not None:
+            return 0
+        if self.state in (STATE_WIN, STATE_GAME_OVER):
+            return IDLE_MENU_WAIT_MS
+        if self.state != STATE_PLAYING:
+            return 0
+        # Tur (hareket animasyonu) veya rotate sembolü animasyonu sürüyor
+        if self.turn_ticks:
+            return 0
+        if any(getattr(symbol, 'activated', False) for symbol in self.rotation_symbols):
+            return 0
+        # Basılı tutulan tuş -> handle_input her frame polling yapıyor
+        if any(pygame.key.get_pressed()):
+            return 0
+        return max(1, 1000 // IDLE_FPS)
+    
+    def handle_events(self, events=None):
         """
         Pygame event'lerini işle
+        
+        Args:
+            events: Önceden alınmış event listesi (None ise kuyruktan okunur)
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            # Pencere boyutu değişti -> yerleşimi yeniden hesapla (tam flip dahil)
+            elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self._layout_dirty = True
+            
+            # Pencere yeniden açığa çıktı -> tam flip
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.dirty.mark_full()
+            
             elif event.type == pygame.KEYDOWN:
                 # ESC - Çıkış
                 if event.key == pygame.K_ESCAPE:
@@ -275,7 +418,7 @@ class GameManager:
                 
                 # R - Level reset
                 elif event.key == pygame.K_r:
-                    self.reset_level()
+                    self._command(ACTION_RESTART)
                 
                 # N - Debug panel toggle (level switch disabled)
                 elif event.key == pygame.K_n:
@@ -284,9 +427,7 @@ class GameManager:
                 
                 # G - God mode toggle (debug)
                 elif event.key == pygame.K_g:
-                    import config
-                    config.GOD_MODE = not config.GOD_MODE
-                    print(f"🛡️ God Mode: {'ON' if config.GOD_MODE else 'OFF'}")
+                    self._command(ACTION_GOD)
 
                 # F11 - Fullscreen toggle
                 elif event.key == pygame.K_F11:
@@ -294,6 +435,18 @@ class GameManager:
                 # F10 - Maximize toggle (windowed)
                 elif event.key == pygame.K_F10:
                     self.toggle_maximize()
+                # F9 - Ölçekleme modu (stretch / integer / letterbox)
+                elif event.key == pygame.K_F9:
+                    mode = self.presenter.cycle_mode()
+                    self._layout_dirty = True
+                    print(f"🖼️ Present mode: {mode}")
+                # P - Simülasyonu duraklat / devam ettir
+                elif event.key == pygame.K_p:
+                    paused = self.frame_clock.toggle_pause()
+                    print(f"⏸️ Paused (. = step one tick)" if paused else "▶️ Resumed")
+                # . - Duraklatılmışken tek tick ilerle
+                elif event.key == pygame.K_PERIOD and self.frame_clock.paused:
+                    self.update(SIM_TICK_DT)
                 # TAB - Controls help overlay toggle
                 elif event.key == pygame.K_TAB:
                     self.help_enabled = not self.help_enabled
@@ -302,22 +455,55 @@ class GameManager:
 
                 # B - Reset best time and restart (only on win/game over screens)
                 elif event.key == pygame.K_b:
-                    if self.state in (STATE_WIN, STATE_GAME_OVER):
+                    if self.state in (STATE_WIN, STATE_GAME_OVER) and self.replay is None:
                         self._reset_best_time()
-                        self.reset_level()
+                        self._command(ACTION_RESTART)
+    
+    def _command(self, action):
+        """
+        Oynanışı etkileyen tuş komutu (R / B / G): kaydet ve uygula.
+        Replay oynatılırken klavye komutları yok sayılır (kayıt bozulmasın).
+        """
+        if self.replay is not None:
+            return
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, action)
+        self._apply_command(action)
+    
+    def _apply_command(self, action):
+        """Komutu uygula (canlı oyun ve replay ortak)"""
+        if action == ACTION_RESTART:
+            self.reset_level()
+        elif action == ACTION_GOD:
+            config.GOD_MODE = not config.GOD_MODE
+            self.world.god_mode = config.GOD_MODE
+            print(f"🛡️ God Mode: {'ON' if config.GOD_MODE else 'OFF'}")
     
     def update(self, dt):
         """
-        Frame güncellemesi
+        Frame güncellemesi (bir oyun tick'i)
         
         Args:
             dt: Delta time
         """
+        # Replay: bu tick'in komutlarını uygula, hamleyi update_turn'e bırak
+        self._replay_action = None
+        if self.replay is not None:
+            for action in self.replay.pop(self.ticks):
+                if action in (ACTION_RESTART, ACTION_GOD):
+                    self._apply_command(action)
+                else:
+                    self._replay_action = action
+            if self.replay.finished and self.ticks == self.replay.end_tick:
+                print(f"🏁 Replay finished at tick {self.ticks} (state: {self.state})")
+        self._update_state(dt)
+        self.game_clock.step(dt)
+        self.ticks += 1
+    
+    def _update_state(self, dt):
+        """State'e göre güncelleme"""
         if self.state == STATE_PLAYING:
-            # Cooldown azalt
-            if self.rotate_cooldown > 0:
-                self.rotate_cooldown = max(0.0, self.rotate_cooldown - dt)
-            self.update_gameplay(dt)
+            self.update_turn(dt)
         elif self.state == STATE_PAUSED:
             pass  # Pause menüsü (ileride)
         elif self.state == STATE_WIN:
@@ -325,137 +511,231 @@ class GameManager:
         elif self.state == STATE_GAME_OVER:
             pass  # Game Over ekranı (ileride)
     
-    def update_gameplay(self, dt):
+    def update_turn(self, dt):
         """
-        Oyun içi güncellemeler
+        Oyun içi güncellemeler: tur yoksa input al ve turu başlat,
+        varsa animasyonu ilerlet ve tur bitince sahneyi sim'e eşitle
         
         Args:
             dt: Delta time
         """
-        # Klavye girişleri
-        keys = pygame.key.get_pressed()
-        current_time = pygame.time.get_ticks() / 1000.0
-        self.player.handle_input(keys, current_time)
-        
-        # Player güncelle
-        self.player.update(dt, self.tiles)
-
-        # Yıldızlar tamamlandıysa anahtarı spawn et
-        self._maybe_spawn_key_if_ready()
-        
-        # Collectible'ları kontrol et
-        collected = self.player.check_collectibles(self.collectibles)
-        # Toplananları level bazında kaydet
-        if collected:
-            level_set = self.collected_by_level.setdefault(self.current_level, set())
-            for item in collected:
-                gx = item.x // GRID_SIZE if hasattr(item, 'x') else 0
-                gy = item.y // GRID_SIZE if hasattr(item, 'y') else 0
-                if item.__class__.__name__ == 'Star':
-                    key = ('star', gx, gy)
-                    level_set.add(key)
-                    self.collected_global.add(key)
-                elif item.__class__.__name__ == 'Key':
-                    key = ('key', gx, gy)
-                    level_set.add(key)
-                    self.collected_global.add(key)
-        
-        # Rotation symbol kontrolü: Level 1 ↔ 2 toggle + konumu/stats'ı koru
-        # Yalnızca simgenin üzerine YENİDEN basıldığında (kenar) tetikle
-        collided_symbol = None
-        for symbol in self.rotation_symbols:
-            if self.player.rect.colliderect(symbol.rect):
-                collided_symbol = symbol
-                break
-
-        if collided_symbol is not None:
-            if not self.on_rotate and self.rotate_cooldown == 0.0:
-                collided_symbol.activate(self)
-                # Bu sembolü kullanılmış olarak işaretle (tek seferlik)
-                gx = collided_symbol.x // GRID_SIZE
-                gy = collided_symbol.y // GRID_SIZE
-                self.used_rotation_symbols.setdefault(self.current_level, set()).add((gx, gy))
-                # Karşı levelde aynı koordinattaki rotate de devre dışı olsun
-                other_level = 2 if self.current_level == 1 else 1
-                self.used_rotation_symbols.setdefault(other_level, set()).add((gx, gy))
-                collided_symbol.consumed = True
-                target_level = 2 if self.current_level == 1 else 1
-                print(f"🔁 Switching to Level {target_level} (carry stars+key, keep pos)")
-                self.switch_to_level(target_level, carry_stars=True, preserve_pos=True)
-                # Rotate sonrası ekstra snap davranışı kaldırıldı (artık '>' '<' tile'larında uygulanıyor)
-                self.on_rotate = True
-            return  # Bu frame'i bitir (çifte tetiklemeyi kesin önle)
+        if self.turn_ticks == 0:
+            # Klavye girişleri (replay'de kayıttaki hamle; saat = simülasyon tick'i)
+            if self.replay is not None:
+                keys = ReplayKeys(self._replay_action)
+            else:
+                keys = pygame.key.get_pressed()
+            action = self.player.handle_input(keys, self.game_clock.now())
+            if action:
+                self.start_turn(action)
         else:
-            # Üzerinden ayrıldı
-            self.on_rotate = False
-        
-        # Kapı kontrolü
-        # Kapı her levelde anahtar gerektirir (anahtar taşınmıyorsa tekrar alınmalı)
-        if hasattr(self.player, 'require_key'):
-            self.player.require_key = True
-        if self.door and self.player.rect.colliderect(self.door.rect):
-            if self.door.try_enter(self.player, current_time):
-                self.level_complete()
-        
-        # Tile'ları güncelle
+            self.player.update(dt)
+            self.turn_ticks -= 1
+            if self.turn_ticks == 0:
+                self._finish_turn(self._turn_events)
+        
+        # Tile / collectible animasyonları
         self.level_loader.update_all(dt)
         
         # Kamera güncelle
         self.update_camera()
+    
+    def start_turn(self, action):
+        """
+        Hamleyi kaydet, GameState.step ile uygula ve animasyonu başlat.
+        Tur, sim'in hamle için saydığı frame kadar tick sürer; sonuç
+        (toplama, hasar, level geçişi) tur bitince sahneye yansır.
         
-        # Game Over kontrolü
-        if not self.player.is_alive:
+        Args:
+            action (str): DIR_* veya "jump"
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, action)
+        before = self.sim
+        self.sim, events = step(before, action)
+        self.turn_ticks = self.sim.frames - before.frames
+        self._turn_events = events
+        for name, data in events:
+            if name == EVENT_JUMP_MODE:
+                self.player.will_jump = data
+                self.player.turn_state = "jump_selected" if data else "waiting"
+                print(f"⚡ JUMP mode {'ON' if data else 'OFF'}")
+            elif name == EVENT_MOVE:
+                self.player.start_move(data[0], data[1], before.will_jump)
+    
+    def _finish_turn(self, events):
+        """
+        Tur sonu: olayları bildir, sahneyi sim'e eşitle, oyun sonunu uygula
+        
+        Args:
+            events (list): step() olayları
+        """
+        self._turn_events = None
+        reload = False
+        for name, data in events:
+            if name == EVENT_STAR:
+                print(f"⭐ Star collected! ({self.sim.stars})")
+            elif name == EVENT_KEY_SPAWN:
+                print("🗝️ Anahtar ortaya çıktı!")
+            elif name == EVENT_KEY:
+                print("🔑 Key collected!")
+            elif name == EVENT_JUMP:
+                print(f"⚡ Jump used! Tokens left: {data}")
+            elif name == EVENT_JUMPED_OVER:
+                print(f"🦘 Jumped over obstacle at {data}")
+            elif name == EVENT_DAMAGE:
+                print(f"💔 Hit: -1 life (reason: {data})")
+            elif name == EVENT_PUSH:
+                print(f"🔺 Pushed by arrow to {data}")
+            elif name == EVENT_BLOCKED:
+                print(f"🚫 Can't move outside the map {data}")
+            elif name == EVENT_DOOR_LOCKED:
+                level = self.world.level(self.sim.level)
+                print(f"🚪 Door locked! Stars: {self.sim.stars}/{level.required_stars}, "
+                      f"Key: {'Yes' if self.sim.has_key else 'No'}")
+            elif name == EVENT_ROTATE:
+                print(f"🔁 Switching to Level {data} (carry stars+key, keep pos)")
+                reload = True
+            elif name == EVENT_LEVEL:
+                print(f"✅ Level complete! Moving to Level {data}...")
+                reload = True
+            elif name in (EVENT_WIN, EVENT_GAME_OVER):
+                reload = True
+        self._apply_state(reload)
+        if any(name == EVENT_WIN for name, _ in events):
+            self.game_won()
+        elif any(name == EVENT_GAME_OVER for name, _ in events):
             self.game_over()
     
-    def update_camera(self):
+    def _apply_state(self, reload=False):
         """
-        Kamerayı player'a göre ayarla
+        Sahneyi sim'e eşitle
+        
+        Args:
+            reload (bool): Level'ı yeniden kur (rotate, kapı, oyun sonu)
         """
-        # Basit kamera takibi (grid boyutuna göre)
-        grid_width = GRID_SIZE * GRID_COLS
-        grid_height = GRID_SIZE * GRID_ROWS
-        target_x = self.player.x - grid_width // 2 + self.player.size // 2
-        target_y = self.player.y - grid_height // 2 + self.player.size // 2
+        if reload or self.sim.level != self.current_level:
+            self.load_level(self.sim.level)
+        else:
+            self._sync_scene()
+    
+    def _sync_scene(self):
+        """Oyuncu, envanter, anahtar, yıldızlar ve rotate sembollerini sim'den kopyala"""
+        sim = self.sim
+        if sim.key_spawned and not self.key_spawned and self.key_spawn_point:
+            # Havuzdaki hazır anahtar: listeye ve hücre indeksine birlikte eklenir
+            key = self.level_loader.spawn_key(self.key_spawn_point)
+            self.key_spawned = True
+            if sim.key_taken:
+                self.level_loader.mark_collected(key)
+        for item in self.collectibles:
+            if item.collected:
+                continue
+            if isinstance(item, Key):
+                taken = sim.key_taken
+            elif isinstance(item, Star):
+                taken = ('star', item.x // GRID_SIZE, item.y // GRID_SIZE) in sim.collected
+            else:
+                continue
+            if taken:
+                self.level_loader.mark_collected(item)
+        for sym in self.rotation_symbols:
+            if not sym.consumed and (sym.x // GRID_SIZE, sym.y // GRID_SIZE) in sim.used_rotates:
+                sym.consumed = True
+                self.level_loader.disable_trigger(sym)
+
+        player = self.player
+        player.will_jump = sim.will_jump
+        if (player.grid_x, player.grid_y) != (sim.px, sim.py) or player.turn_state == "moving":
+            player.place(sim.px, sim.py)
+        player.turn_state = "jump_selected" if sim.will_jump else "waiting"
+        player.stars_collected = sim.stars
+        player.has_key = sim.has_key
+        self.resource_manager.load_state(sim.lives, sim.tokens, sim.total_jumps)
+    
+    def _fit_view(self):
+        """
+        Render surface'i aktif level'a göre boyutlandır: görüş alanından küçük
+        leveller tam gösterilir, büyükler VIEW_COLS x VIEW_ROWS pencereden kaydırılır
+        """
+        level_w, level_h = self.level_loader.get_level_bounds()
+        size = (min(level_w, GRID_SIZE * VIEW_COLS) or GRID_SIZE, min(level_h, GRID_SIZE * VIEW_ROWS) or GRID_SIZE)
+        if self.render_surface.get_size() != size:
+            self.render_surface = pygame.Surface(size)
+            self._layout_dirty = True
+    
+    def update_camera(self, snap=False):
+        """
+        Kamerayı player'a göre ayarla (level görüş alanından büyükse kaydırır)
         
-        # Kamera yumuşatma
-        self.camera_x += (target_x - self.camera_x) * 0.1
-        self.camera_y += (target_y - self.camera_y) * 0.1
+        Args:
+            snap (bool): Yumuşatmadan doğrudan hedefe git (level yükleme)
+        """
+        view_w, view_h = self.render_surface.get_size()
+        target_x = self.player.x - view_w // 2 + self.player.size // 2
+        target_y = self.player.y - view_h // 2 + self.player.size // 2
+        
+        # Kamera yumuşatma (yarım pikselden yakınsa otur: statik katman boşuna yeniden çizilmesin)
+        if snap or abs(target_x - self.camera_x) < 0.5:
+            self.camera_x = target_x
+        else:
+            self.camera_x += (target_x - self.camera_x) * CAMERA_SMOOTHING
+        if snap or abs(target_y - self.camera_y) < 0.5:
+            self.camera_y = target_y
+        else:
+            self.camera_y += (target_y - self.camera_y) * CAMERA_SMOOTHING
         
         # Level sınırları içinde tut
         level_width, level_height = self.level_loader.get_level_bounds()
         
-        self.camera_x = max(0, min(self.camera_x, level_width - grid_width))
-        self.camera_y = max(0, min(self.camera_y, level_height - grid_height))
+        self.camera_x = max(0, min(self.camera_x, level_width - view_w))
+        self.camera_y = max(0, min(self.camera_y, level_height - view_h))
     
     def draw(self):
         """Ekrana çizim"""
         # Timer'ı ilk frame'de başlat (ekran göründüğünde)
         if self.total_start_time == 0.0:
-            self.total_start_time = pygame.time.get_ticks() / 1000.0
+            self.total_start_time = self.game_clock.now()
             self.total_end_time = 0.0
         
-        # Arka plan (render surface'e çiz)
-        self.render_surface.fill(BG_COLOR)
+        # Statik katman: görünür parçalar önbellekten (parça sadece ilk göründüğünde / tile değişince çizilir)
+        camera_offset = (int(self.camera_x), int(self.camera_y))
+        self.level_loader.draw_static(self.render_surface, camera_offset)
         
-        # Grid çizgileri (render surface'e)
-        if SHOW_GRID:
-            self.draw_grid()
+        # Durum değiştiyse (state, level, pencere, overlay) bu frame tam flip;
+        # oyuncu, tur animasyonu ve HUD değerleri kendi bölgelerini bildirir
+        signature = self._frame_signature()
+        if signature != self._last_frame_signature:
+            self.dirty.mark_full()
+            self._last_frame_signature = signature
         
-        # Tüm objeleri çiz (render surface'e)
-        camera_offset = (int(self.camera_x), int(self.camera_y))
-        self.level_loader.draw_all(self.render_surface, camera_offset)
+        # Sadece dinamik objeleri çiz (collectible, kapı, rotate, player)
+        self.level_loader.draw_dynamic(self.render_surface, camera_offset)
+        
+        # Yerleşim sadece resize/F10/F11/mod değişiminde yeniden hesaplanır
+        if self._layout_dirty or self.presenter.source_size != self.render_surface.get_size():
+            self._relayout()
         
         # Önce üst HUD’ı ekrana çiz (haritanın üzerinde bağımsız)
+        sw, sh = self._screen_size
+        bar_h = self._hud_bar_height()
+        # HUD bandını temizle (yarı saydam şerit frame'ler boyunca birikmesin)
+        self.screen.fill((0, 0, 0), (0, 0, sw, bar_h))
         self.player.draw_ui(self.screen)
         # HUD meta: hedef metni ve zamanlayıcılar
         self._draw_hud_meta()
+        # Can / token / hedef metni değiştiyse sadece HUD bandını gönder
+        info = self.resource_manager.get_lives_info()
+        self.dirty.track("hud_bar", (0, 0, sw, bar_h + 1),
+                         (info['main_lives'], info['jump_tokens'], info['god_mode'], self._status_text(), self.best_time))
         
-        # Haritayı HUD’ın altında çizecek şekilde ölçekle ve konumlandır (dinamik boyut)
-        sw, sh = self.screen.get_size()
-        bar_h = self._hud_bar_height()
-        map_height = max(0, sh - bar_h)
-        scaled_surface = pygame.transform.scale(self.render_surface, (sw, map_height))
-        self.screen.blit(scaled_surface, (0, bar_h))
+        # Haritayı HUD’ın altına kalıcı buffer üzerinden ölçekle (frame başına tahsis yok)
+        self.presenter.present(self.screen, self.render_surface)
+        self._track_map_regions(camera_offset)
+        # Kamera kaydığı frame'lerde harita alanının tamamı değişir (HUD ve kenar bantları hariç)
+        if camera_offset != self._last_camera_offset:
+            self.dirty.mark(self.presenter.dest_rect)
+            self._last_camera_offset = camera_offset
         
         # State'e göre overlay
         if self.state == STATE_WIN:
@@ -470,65 +750,65 @@ class GameManager:
         if self.help_enabled:
             self._draw_help_overlay()
     
-    def draw_grid(self):
-        """Grid çizgilerini çiz"""
-        camera_offset = (int(self.camera_x), int(self.camera_y))
-        grid_width = GRID_SIZE * GRID_COLS
-        grid_height = GRID_SIZE * GRID_ROWS
-        
-        # Dikey çizgiler
-        for x in range(0, grid_width + GRID_SIZE, GRID_SIZE):
-            world_x = x + camera_offset[0]
-            screen_x = world_x - camera_offset[0]
-            pygame.draw.line(self.render_surface, GRID_LINE_COLOR, 
-                           (screen_x, 0), (screen_x, grid_height), 1)
-        
-        # Yatay çizgiler
-        for y in range(0, grid_height + GRID_SIZE, GRID_SIZE):
-            world_y = y + camera_offset[1]
-            screen_y = world_y - camera_offset[1]
-            pygame.draw.line(self.render_surface, GRID_LINE_COLOR, 
-                           (0, screen_y), (grid_width, screen_y), 1)
-    
-    def draw_ui(self):
-        """UI elementlerini çiz"""
-        # Player bilgileri (metin içeren gri yazılar varsa devre dışı bırak)
-        # Oyuncu kalp/jump gibi görselleri çiziyor olabilir; yalnızca metinleri gizleyelim.
-        try:
-            if hasattr(self.player, 'draw_ui_texts'):
-                # Eğer oyuncu metinleri ayrı çiziyorsa, kapat
-                pass  # metinleri çizme
-            else:
-                # Varsayılan: oyuncu UI'sini yine de çiz, fakat metinler oyunda kaldırılacak
-                self.player.draw_ui(self.screen)
-        except (AttributeError, TypeError) as e:
-            print(f"⚠️ Player UI draw failed: {e}")
-            self.player.draw_ui(self.screen)
+    def _frame_signature(self):
+        """
+        Tam ekran yeniden gönderim gerektiren durumların özeti (state, level /
+        statik katman, pencere, overlay). Bu değerlerden biri değişirse dirty
+        rect yerine tam flip yapılır. Oyuncu hareketi ve zıplama parlaması
+        (get_dynamic_rects), HUD değerleri ve kamera kayması kendi bölgelerini bildirir.
+        """
+        return (
+            self.state, self.current_level, self.screen.get_size(), id(self.player),
+            self.level_loader.static_version, self.debug_enabled, self.help_enabled
+        )
+    
+    def _relayout(self):
+        """Pencere boyutuna göre HUD altı harita alanını ve ölçeği yeniden hesapla"""
+        self._screen_size = self.screen.get_size()
+        sw, sh = self._screen_size
+        bar_h = self._hud_bar_height()
+        self.presenter.relayout((0, bar_h, sw, max(0, sh - bar_h)), self.render_surface.get_size())
+        self._layout_dirty = False
+        self.dirty.mark_full()
+    
+    def _track_map_regions(self, camera_offset):
+        """
+        Dinamik objelerin render surface bölgelerini ekran koordinatına
+        çevirip dirty rect renderer'a bildir
         
-        # Oyun içi Level/FPS yazılarını gizle (sadece debug panelde gösterilecek)
-        # Level yazısı ve FPS artık çizilmiyor
-        pass
+        Args:
+            camera_offset: Kamera kayması
+        """
+        for obj, rect, token in self.level_loader.get_dynamic_rects(camera_offset, self.render_surface):
+            screen_rect = self.presenter.map_rect(rect) if rect is not None else None
+            self.dirty.track(id(obj), screen_rect, token)
     
     def draw_win_screen(self):
-        """Kazanma ekranı"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Yazı
-        win_text = self.font_large.render("LEVEL COMPLETE!", True, (50, 255, 50))
-        text_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(win_text, text_rect)
-
-        # İpucu: Yeni strateji denemek için R'ye basın
-        hint_text = self.font_medium.render("Press R to try a new strategy", True, UI_TEXT_COLOR)
-        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(hint_text, hint_rect)
-
-        reset_text = self.font_medium.render("Press B to reset best time & restart", True, UI_TEXT_COLOR)
-        reset_rect = reset_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
-        self.screen.blit(reset_text, reset_rect)
+        """Kazanma ekranı (önceden oluşturulmuş tam pencere overlay)"""
+        lines = (
+            ("LEVEL COMPLETE!", "large", (50, 255, 50), -50),
+            # İpucu: Yeni strateji denemek için R'ye basın
+            ("Press R to try a new strategy", "medium", UI_TEXT_COLOR, 50),
+            ("Press B to reset best time & restart", "medium", UI_TEXT_COLOR, 90)
+        )
+        self.screen.blit(self._panels["win"].get(self._screen_size, lines), (0, 0))
+
+    def _build_end_screen(self, size, lines):
+        """
+        Win / Game Over overlay'ini gerçek pencere boyutunda bir kez oluştur
+        
+        Args:
+            size (tuple): Pencere boyutu
+            lines (tuple): (metin, font adı, renk, merkezden dikey kayma)
+        """
+        sw, sh = size
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 200))
+        fonts = {"large": self.font_large, "medium": self.font_medium}
+        for text, font_name, color, dy in lines:
+            surf = fonts[font_name].render(text, True, color)
+            overlay.blit(surf, surf.get_rect(center=(sw // 2, sh // 2 + dy)))
+        return overlay
 
     def _format_time(self, seconds: float) -> str:
         seconds = max(0.0, float(seconds))
@@ -578,80 +858,129 @@ class GameManager:
         sw, sh = self.screen.get_size()
         bar_h = self._hud_bar_height()
         # Merkez zamanlayıcı (TOTAL time)
-        now = self.total_end_time if self.total_end_time else pygame.time.get_ticks() / 1000.0
+        now = self.total_end_time if self.total_end_time else self.game_clock.now()
         elapsed = now - self.total_start_time if self.total_start_time else 0.0
         best_text = self._format_time(self.best_time) if self.best_time is not None else "--:--.--"
         now_text = self._format_time(elapsed)
-        center_text = f"Best: {best_text} | Now: {now_text}"
-        # Daha okunaklı açık renk
+        body = self._status_text()
+        
+        # Yerleşim sadece pencere boyutu / best / durum metni değişince yeniden hesaplanır
+        layout = self._get_hud_layout(sw, bar_h, best_text, now_text, body)
+        
+        # Sabit metinler (önbellekten; steady-state'te render yok)
+        for text, size, pos in layout["static"]:
+            self._blit_shadowed(text, size, pos)
+        # Timer rakamları glyph atlasından (gölge atlasa önceden işlenmiş; render/tahsis yok)
+        size, pos = layout["timer"]
+        atlas = self._get_glyph_atlas(size)
+        if atlas.supports(now_text):
+            atlas.draw(self.screen, now_text, pos)
+        else:
+            self._blit_shadowed(now_text, size, pos)
+        
+        # Timer metni değiştiyse sadece onun bölgesini gönder
+        self.dirty.track("hud_timer", layout["timer_rect"], (best_text, now_text))
+    
+    def _blit_shadowed(self, text, size, pos, color=(235, 235, 235)):
+        """Metni 1 piksel gölgeyle çiz (her iki surface de TextCache'ten)"""
+        self.screen.blit(self.text_cache.render(text, size, (0, 0, 0)), (pos[0] + 1, pos[1] + 1))
+        self.screen.blit(self.text_cache.render(text, size, color), pos)
+    
+    def _get_glyph_atlas(self, size):
+        """Font boyutu için timer glyph atlasını döndür (ilk istekte oluşturulur)"""
+        atlas = self._glyph_atlases.get(size)
+        if atlas is None:
+            atlas = GlyphAtlas(self.text_cache.font(size), (235, 235, 235))
+            self._glyph_atlases[size] = atlas
+        return atlas
+    
+    def _status_text(self):
+        """Sağ taraftaki durum metnini oyun durumuna göre üret"""
+        stars = self.player.stars_collected if hasattr(self.player, 'stars_collected') else 0
+        required = self.player.required_stars if hasattr(self.player, 'required_stars') else STARS_TO_WIN
+        has_key = self.player.has_key if hasattr(self.player, 'has_key') else False
+        
+        key_status = "Yes" if has_key else "No"
+        if stars < required:
+            return f"Stars: {stars}/{required}  Key: {key_status}  Collect all stars"
+        elif not has_key:
+            return f"Stars: {stars}/{required}  Key: {key_status}  Obtain the key"
+        return f"Stars: {stars}/{required}  Key: {key_status}  Go to exit"
+    
+    def _get_hud_layout(self, sw, bar_h, best_text, now_text, body):
+        """
+        HUD yerleşimini hesapla veya önbellekten döndür
+        
+        Timer genişliği sabit genişlikli glyph atlası ile, rakamları '0' ile
+        değiştirilmiş şablon üzerinden ölçülür; böylece saniye ilerledikçe
+        yerleşim (ve önbellek) değişmez.
+        
+        Returns:
+            dict: static [(metin, boyut, konum)], timer (boyut, konum), timer_rect
+        """
+        now_template = ''.join('0' if ch.isdigit() else ch for ch in now_text)
+        key = (sw, bar_h, best_text, now_template, body)
+        if key == self._hud_layout_key:
+            return self._hud_layout
+        
+        measure = self.text_cache.measure
+        static = []
+
+        def timer_size(size):
+            return self._get_glyph_atlas(size).text_size(now_template)
+        
         # Responsive center timer: shrink or split into 2 lines if needed
         margin = int(10 * SCALE)
         max_center_width = int(sw * 0.3) - margin  # center area: max 30% width
         font_size = int(16 * SCALE)
-        center_font = self._get_cached_font(font_size)
-        center_surf = center_font.render(center_text, True, (235, 235, 235))
-        # Reduce font size until it fits, but keep legible
-        while center_surf.get_width() > max_center_width and font_size > int(12 * SCALE):
+        prefix = f"Best: {best_text} | Now: "
+        center_w = measure(prefix, font_size)[0] + timer_size(font_size)[0]
+        # Reduce font size until it fits, but keep legible (ölçüm font.size() ile)
+        while center_w > max_center_width and font_size > int(12 * SCALE):
             font_size -= 1
-            center_font = self._get_cached_font(font_size)
-            center_surf = center_font.render(center_text, True, (235, 235, 235))
-        # If still too wide, split into two lines: Best / Now
-        if center_surf.get_width() > max_center_width:
+            center_w = measure(prefix, font_size)[0] + timer_size(font_size)[0]
+        if center_w > max_center_width:
+            # If still too wide, split into two lines: Best / Now
             best_line = f"Best: {best_text}"
-            now_line = f"Now:  {now_text}"
-            best_surf = center_font.render(best_line, True, (235, 235, 235))
-            now_surf = center_font.render(now_line, True, (235, 235, 235))
-            total_h = best_surf.get_height() + 2 + now_surf.get_height()
-            bx = (sw - best_surf.get_width()) // 2
+            now_prefix = "Now:  "
+            best_w, best_h = measure(best_line, font_size)
+            prefix_w, now_h = measure(now_prefix, font_size)
+            now_w = prefix_w + timer_size(font_size)[0]
+            total_h = best_h + 2 + now_h
+            bx = (sw - best_w) // 2
             by = (bar_h - total_h) // 2
-            # Shadows
-            best_shadow = center_font.render(best_line, True, (0, 0, 0))
-            now_shadow = center_font.render(now_line, True, (0, 0, 0))
-            self.screen.blit(best_shadow, (bx + 1, by + 1))
-            self.screen.blit(best_surf, (bx, by))
-            ny = by + best_surf.get_height() + 2
-            nx = (sw - now_surf.get_width()) // 2
-            self.screen.blit(now_shadow, (nx + 1, ny + 1))
-            self.screen.blit(now_surf, (nx, ny))
+            static.append((best_line, font_size, (bx, by)))
+            ny = by + best_h + 2
+            nx = (sw - now_w) // 2
+            static.append((now_prefix, font_size, (nx, ny)))
+            timer_pos = (nx + prefix_w, ny)
         else:
-            center_rect = center_surf.get_rect(center=(sw // 2, bar_h // 2))
-            shadow = center_font.render(center_text, True, (0, 0, 0))
-            self.screen.blit(shadow, (center_rect.x + 1, center_rect.y + 1))
-            self.screen.blit(center_surf, center_rect.topleft)
+            center_h = measure(prefix, font_size)[1]
+            cx = sw // 2 - center_w // 2
+            cy = bar_h // 2 - center_h // 2
+            static.append((prefix, font_size, (cx, cy)))
+            timer_pos = (cx + measure(prefix, font_size)[0], cy)
+        # Timer bölgesi: atlas hücreleri (gölge dahil)
+        timer_rect = pygame.Rect(timer_pos, timer_size(font_size))
 
         # Sağ tarafta hedef başlık + metin
         # Right margin for objective (separate from timer)
         right_margin = int(15 * SCALE)
-        title_font = self._get_cached_font(int(14 * SCALE))
-        body_font = self._get_cached_font(int(12 * SCALE))
-        
-        # Dynamically generate objective based on game state
+        title_size = int(14 * SCALE)
+        body_size = int(12 * SCALE)
         title = "STATUS"
-        stars = self.player.stars_collected if hasattr(self.player, 'stars_collected') else 0
-        required = self.player.required_stars if hasattr(self.player, 'required_stars') else STARS_TO_WIN
-        has_key = self.player.has_key if hasattr(self.player, 'has_key') else False
-        
-        key_status = "Yes" if has_key else "No"
-        if stars < required:
-            body = f"Stars: {stars}/{required}  Key: {key_status}  Collect all stars"
-        elif not has_key:
-            body = f"Stars: {stars}/{required}  Key: {key_status}  Obtain the key"
-        else:
-            body = f"Stars: {stars}/{required}  Key: {key_status}  Go to exit"
-        
-        title_surf = title_font.render(title, True, (235, 235, 235))
+        title_w, title_h = measure(title, title_size)
 
         # Right-side max width for wrapping (about 25% of screen width on far right)
         max_width = int(sw * 0.25) - right_margin
 
-        # Wrap body into lines
+        # Wrap body into lines (kelime başına render yerine font.size() ölçümü)
         words = body.split(' ')
         lines = []
         current = ''
         for w in words:
             test = (current + ' ' + w).strip()
-            test_surf = body_font.render(test, True, (235, 235, 235))
-            if test_surf.get_width() <= max_width:
+            if measure(test, body_size)[0] <= max_width:
                 current = test
             else:
                 if current:
@@ -659,34 +988,31 @@ class GameManager:
                 current = w
         if current:
             lines.append(current)
-        # Allow up to 5 lines; no ellipsis needed (show full text wrapped)
-        # No truncation—let it wrap naturally
 
         # Compute total body height (tighter line spacing)
         line_spacing = 1  # pixels between lines
-        body_surfs = [body_font.render(line, True, (235, 235, 235)) for line in lines]
-        total_body_h = sum(s.get_height() for s in body_surfs) + (len(body_surfs) - 1) * line_spacing
+        line_sizes = [measure(line, body_size) for line in lines]
+        total_body_h = sum(h for _, h in line_sizes) + (len(line_sizes) - 1) * line_spacing
 
         # Right alignment positions within HUD band
-        tx = sw - right_margin - title_surf.get_width()
+        tx = sw - right_margin - title_w
         # Center vertically: title + body block inside bar_h
-        ty = max(2, (bar_h - (title_surf.get_height() + 2 + total_body_h)) // 2)
-
-        # Draw title with shadow
-        title_shadow = title_font.render(title, True, (0, 0, 0))
-        self.screen.blit(title_shadow, (tx + 1, ty + 1))
-        self.screen.blit(title_surf, (tx, ty))
-
-        # Draw wrapped body lines right-aligned with shadow
-        by = ty + title_surf.get_height() + 2
-        line_spacing = 1
-        for idx, s in enumerate(body_surfs):
-            bx = sw - right_margin - s.get_width()
-            shadow_line = lines[idx]
-            body_shadow = body_font.render(shadow_line, True, (0, 0, 0))
-            self.screen.blit(body_shadow, (bx + 1, by + 1))
-            self.screen.blit(s, (bx, by))
-            by += s.get_height() + line_spacing
+        ty = max(2, (bar_h - (title_h + 2 + total_body_h)) // 2)
+        static.append((title, title_size, (tx, ty)))
+
+        # Wrapped body lines right-aligned
+        by = ty + title_h + 2
+        for line, (lw, lh) in zip(lines, line_sizes):
+            static.append((line, body_size, (sw - right_margin - lw, by)))
+            by += lh + line_spacing
+
+        self._hud_layout_key = key
+        self._hud_layout = {
+            "static": static,
+            "timer": (font_size, timer_pos),
+            "timer_rect": timer_rect
+        }
+        return self._hud_layout
 
     def _hud_bar_height(self):
         """Player UI ile aynı üst bar yüksekliğini hesapla."""
@@ -699,44 +1025,39 @@ class GameManager:
         # Panel config
         panel_width = 280
         panel_margin = 12
-        panel_padding = 10
-        sw, sh = self.screen.get_size()
+        sw, sh = self._screen_size
         panel_rect = pygame.Rect(sw - panel_width - panel_margin, panel_margin, panel_width, sh - panel_margin*2)
 
-        # Semi-transparent background (stronger alpha) + border
-        overlay = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA).convert_alpha()
-        overlay.fill((0, 0, 0, 200))  # darker for readability
-        self.screen.blit(overlay, panel_rect.topleft)
-        pygame.draw.rect(self.screen, (80, 80, 80), panel_rect, 1)
+        # İçerik DEBUG_PANEL_REFRESH aralığıyla örneklenir; panel sadece içerik değişince yeniden çizilir
+        now = self.frame_clock.now()
+        if self._debug_lines is None or now - self._debug_sampled_at >= DEBUG_PANEL_REFRESH:
+            self._debug_lines = self._collect_debug_lines()
+            self._debug_sampled_at = now
 
-        # Text config
-        try:
-            font = pygame.font.SysFont('consolas', 18, bold=False)
-        except Exception:
-            font = pygame.font.SysFont(None, 18)
-        color = (220, 220, 220)  # lighter gray
-        line_h = 20
-        x = panel_rect.x + panel_padding
-        y = panel_rect.y + panel_padding
+        panel = self._panels["debug"].get(panel_rect.size, self._debug_lines)
+        self.screen.blit(panel, panel_rect.topleft)
+        self.dirty.track("debug_panel", panel_rect, self._debug_lines)
+
+    def _collect_debug_lines(self):
+        """
+        Debug panel satırlarını topla
+        
+        Returns:
+            tuple: Panelde gösterilecek metin satırları
+        """
+        lines = []
 
         def draw_line(label, value=None):
-            nonlocal y
-            text = f"{label}: {value}" if value is not None else str(label)
-            # shadow for readability
-            shadow = font.render(text, True, (0, 0, 0))
-            self.screen.blit(shadow, (x+1, y+1))
-            surf = font.render(text, True, color)
-            self.screen.blit(surf, (x, y))
-            y += line_h
+            lines.append(f"{label}: {value}" if value is not None else str(label))
 
-        # Collect state info
-        lvl = getattr(self, 'current_level', 1)
-        px, py = self.player.grid_x, self.player.grid_y
-        stars = getattr(self.player, 'stars', 0)
-        has_key = getattr(self.player, 'has_key', False)
-        lives = getattr(self.player, 'lives', None)
-        jumps = getattr(self.player, 'jump_tokens', None)
-        rot_cd = round(self.rotate_cooldown, 2)
+        # Collect state info (kural durumu sim'den)
+        sim = self.sim
+        lvl = sim.level
+        px, py = sim.px, sim.py
+        stars = sim.stars
+        has_key = sim.has_key
+        lives = sim.lives
+        jumps = sim.tokens
         fps = int(self.clock.get_fps())
         import config
         god = "ON" if config.GOD_MODE else "OFF"
@@ -748,11 +1069,8 @@ class GameManager:
         draw_line("Player", f"({px},{py})")
         draw_line("Stars", stars)
         draw_line("Key", "Yes" if has_key else "No")
-        if lives is not None:
-            draw_line("Lives", lives)
-        if jumps is not None:
-            draw_line("JumpTokens", jumps)
-        draw_line("RotateCD", rot_cd)
+        draw_line("Lives", lives)
+        draw_line("JumpTokens", jumps)
         draw_line("GodMode", god)
         draw_line("FPS", fps)
 
@@ -764,42 +1082,68 @@ class GameManager:
         draw_line("Tiles", tile_cnt)
         draw_line("Collectibles", coll_cnt)
         draw_line("RotSymbols", rot_cnt)
+        sprite_stats = sprite_cache.stats()
+        draw_line("SpriteHit", f"{sprite_stats['hits']}/{sprite_stats['misses']}")
+        draw_line("SpriteDisk", sprite_stats['disk_loads'])
+        frame_stats = self.dirty.stats
+        draw_line("PxPush", frame_stats.last_pixels)
+        draw_line("TextHit", f"{self.text_cache.hits}/{self.text_cache.misses}")
+        chunks = self.level_loader.chunks
+        draw_line("Chunks", f"{len(chunks)} ({chunks.bytes // 1024}KB) {chunks.hits}/{chunks.misses}")
+        draw_line("FullFlips", f"{frame_stats.full_frames}/{frame_stats.frames}")
 
         # Hints
         draw_line("──────────────")
         draw_line("Hint", "N: Toggle debug panel")
+        return tuple(lines)
+
+    def _build_debug_panel(self, size, lines):
+        """Debug panelini (arka plan + kenarlık + satırlar) tek surface'e çiz"""
+        # Semi-transparent background (stronger alpha) + border
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 200))  # darker for readability
+        pygame.draw.rect(panel, (80, 80, 80), panel.get_rect(), 1)
+
+        font = self.text_cache.font(18)
+        color = (220, 220, 220)  # lighter gray
+        line_h = 20
+        panel_padding = 10
+        y = panel_padding
+        for text in lines:
+            # shadow for readability
+            panel.blit(font.render(text, True, (0, 0, 0)), (panel_padding + 1, y + 1))
+            panel.blit(font.render(text, True, color), (panel_padding, y))
+            y += line_h
+        return panel
 
     def _draw_help_overlay(self):
         # Right-side panel similar to debug, but dedicated to controls
         panel_width = 340
         panel_margin = 12
-        panel_padding = 10
-        sw, sh = self.screen.get_size()
+        sw, sh = self._screen_size
         panel_rect = pygame.Rect(sw - panel_width - panel_margin, panel_margin, panel_width, sh - panel_margin*2)
+        # İçerik sabit; panel sadece pencere boyutu değişince yeniden oluşturulur
+        self.screen.blit(self._panels["help"].get(panel_rect.size), panel_rect.topleft)
 
-        overlay = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA).convert_alpha()
-        overlay.fill((0, 0, 0, 210))
-        self.screen.blit(overlay, panel_rect.topleft)
-        pygame.draw.rect(self.screen, (100, 100, 100), panel_rect, 1)
+    def _build_help_panel(self, size, content=None):
+        """Kontroller panelini tek surface'e çiz"""
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 210))
+        pygame.draw.rect(panel, (100, 100, 100), panel.get_rect(), 1)
 
-        try:
-            title_font = pygame.font.SysFont('consolas', 20, bold=True)
-            font = pygame.font.SysFont('consolas', 18)
-        except Exception:
-            title_font = pygame.font.SysFont(None, 20)
-            font = pygame.font.SysFont(None, 18)
+        title_font = self.text_cache.font(20, bold=True)
+        font = self.text_cache.font(18)
         color = (230, 230, 230)
         line_h = 22
-        x = panel_rect.x + panel_padding
-        y = panel_rect.y + panel_padding
+        panel_padding = 10
+        x = panel_padding
+        y = panel_padding
 
         def draw(text, bold=False):
             nonlocal y
             f = title_font if bold else font
-            shadow = f.render(text, True, (0, 0, 0))
-            self.screen.blit(shadow, (x+1, y+1))
-            surf = f.render(text, True, color)
-            self.screen.blit(surf, (x, y))
+            panel.blit(f.render(text, True, (0, 0, 0)), (x+1, y+1))
+            panel.blit(f.render(text, True, color), (x, y))
             y += line_h
 
         draw("CONTROLS", bold=True)
@@ -810,203 +1154,81 @@ class GameManager:
         draw("SPACE: Select jump / cancel")
         draw("WASD: Move after jump select")
         draw("R: Restart level")
+        draw("P / .: Pause / step one tick")
         draw("N: Toggle debug panel")
         draw("G: Toggle God mode")
+        draw("F9: Scale mode")
         draw("F10: Maximize window")
         draw("F11: Toggle fullscreen")
         draw("ESC: Quit game")
+        return panel
     
     def draw_game_over_screen(self):
-        """Game Over ekranı"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Yazı
-        go_text = self.font_large.render("GAME OVER", True, (255, 50, 50))
-        text_rect = go_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(go_text, text_rect)
-        
-        hint_text = self.font_medium.render("Press R to restart (keep best time)", True, UI_TEXT_COLOR)
-        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(hint_text, hint_rect)
-
-        reset_text = self.font_medium.render("Press B to reset best time & restart", True, UI_TEXT_COLOR)
-        reset_rect = reset_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
-        self.screen.blit(reset_text, reset_rect)
-    
-    def rotate_world(self):
-        """
-        Dünyayı 90 derece döndür (RotationManager kullanarak)
-        Üçgen yönlerini saat yönünde döndür
-        """
-        self.rotation_manager.rotate_world_90(self.level_loader)
-    
-    def level_complete(self):
-        """Level tamamlandı"""
-        # Son level mi kontrol et
-        if self.current_level >= LevelData.get_total_levels():
-            # Oyun tamamlandı
-            self.state = STATE_WIN
-            print(f"🎉 All levels completed!")
-            # Toplam süreyi kaydet
-            self.total_end_time = pygame.time.get_ticks() / 1000.0
-            elapsed = self.total_end_time - self.total_start_time if self.total_start_time else 0.0
+        """Game Over ekranı (önceden oluşturulmuş tam pencere overlay)"""
+        lines = (
+            ("GAME OVER", "large", (255, 50, 50), -50),
+            ("Press R to restart (keep best time)", "medium", UI_TEXT_COLOR, 50),
+            ("Press B to reset best time & restart", "medium", UI_TEXT_COLOR, 90)
+        )
+        self.screen.blit(self._panels["game_over"].get(self._screen_size, lines), (0, 0))
+    
+    def game_won(self):
+        """Son level'ın kapısından geçildi"""
+        self.state = STATE_WIN
+        print(f"🎉 All levels completed!")
+        # Toplam süreyi kaydet
+        self.total_end_time = self.game_clock.now()
+        elapsed = self.total_end_time - self.total_start_time if self.total_start_time else 0.0
+        if self.replay is None:
             self._update_best_time_if_better(elapsed)
-            self.reset_player_progress()
-        else:
-            # Sonraki level'e geç (timer devam eder)
-            print(f"✅ Level {self.current_level} complete! Moving to next level...")
-            self.next_level()
+        if self.recorder is not None:
+            self.recorder.flush()
     
     def game_over(self):
         """Game Over"""
         self.state = STATE_GAME_OVER
         print("💀 Game Over!")
-        self.total_end_time = pygame.time.get_ticks() / 1000.0
-        self.reset_player_progress()
+        self.total_end_time = self.game_clock.now()
+        if self.recorder is not None:
+            self.recorder.flush()
     
     def reset_level(self):
-        """Level'i resetle"""
-        # Her zaman Level 1'den yeniden başlat
-        try:
-            self.current_level = 1
-        except Exception:
-            pass
-        # Sistemleri sıfırla
-        self.level_loader.reset_level()
-        self.rotation_manager.reset()
-        # Oyuncu ilerlemesini ve kaynaklarını sıfırla
-        try:
-            self.reset_player_progress()
-            if hasattr(self, 'player') and self.player and self.player.resource_manager:
-                self.player.resource_manager.reset()
-            if hasattr(self, 'player') and self.player:
-                self.player.restore_default_sprite()
-        except Exception:
-            pass
-        # Level 1'i yükle
-        self.load_level(1)
+        """Oyunu Level 1'den yeniden başlat (canlar, toplananlar, rotate'ler sıfır)"""
+        self.sim = new_game(self.world, 1)
         self.state = STATE_PLAYING
-        # Seviye yüklenince kısa bir cooldown ver (spawn'da anında tetiklemeyi engelle)
-        self.rotate_cooldown = 0.5
-        # Yeni levele geçerken oyuncu hâlâ bir rotate üzerinde olabilir; tekrar tetiklenmeyi engelle
-        self.on_rotate = True
+        self.turn_ticks = 0
+        self._turn_events = None
+        self._apply_state(reload=True)
         # Timer'i sıfırla (ilk draw frame'inde yeniden başlayacak)
         self.total_start_time = 0.0
         self.total_end_time = 0.0
-        # Anahtarı şart sağlanmadıysa gizle
-        self.key_spawned = False
         print("🔄 Level restarted!")
     
-    def next_level(self):
-        """Sonraki level'e geç"""
-        next_level = self.current_level + 1
-        
-        if next_level > LevelData.get_total_levels():
-            print("🎊 All levels completed!")
-            self.current_level = 1  # Başa dön
-        else:
-            self.current_level = next_level
-        
-        self.load_level(self.current_level)
-        self.state = STATE_PLAYING
-
-    def switch_to_level(self, target_level, carry_stars=False, preserve_pos=False):
-        """
-        Belirli bir level'e geç ve istenirse yıldız sayısını taşı, konumu koru
-        """
-        carried_stars = self.player.stars_collected if (carry_stars and hasattr(self, 'player')) else None
-        carried_key = self.player.has_key if hasattr(self, 'player') else None
-        saved_grid = (self.player.grid_x, self.player.grid_y) if (preserve_pos and hasattr(self, 'player')) else None
-        self.current_level = target_level
-        self.load_level(self.current_level)
-        # Level'a göre anahtar gereksinimini yeniden uygula (taşıma senaryolarında garanti et)
-        try:
-            self.player.require_key = True
-            # Level 2+ geçişlerinde (veya genel) anahtarı sıfırla; yeni levelde anahtar toplanmalı
-            if self.current_level != 1:
-                self.player.has_key = False
-        except Exception:
-            pass
-        if carried_stars is not None:
-            self.player.stars_collected = carried_stars
-        if carried_key is not None:
-            self.player.has_key = carried_key
-        # Konumu koru (grid bazlı), sınırlar içinde tut
-        if saved_grid is not None:
-            gx, gy = saved_grid
-            # Yeni level boyutları
-            grid_w = self.level_loader.grid_width
-            grid_h = self.level_loader.grid_height
-            gx = max(0, min(gx, grid_w - 1))
-            gy = max(0, min(gy, grid_h - 1))
-            self.player.grid_x = gx
-            self.player.grid_y = gy
-            self.player.x = gx * GRID_SIZE
-            self.player.y = gy * GRID_SIZE
-            self.player.rect.x = self.player.x
-            self.player.rect.y = self.player.y
-        # Yıldız/anahtar durumu güncellendikten sonra anahtarı gerekirse spawn et
-        self._maybe_spawn_key_if_ready()
-        self.state = STATE_PLAYING
-    
     def quit(self):
         """Oyunu kapat"""
-        # Oyuncu ilerlemesini ve toplananları sıfırla
-        try:
-            self.reset_player_progress()
-        except Exception:
-            pass
+        # Replay kaydını son tick ile kapat
+        if self.recorder is not None:
+            self.recorder.close(self.ticks)
+            print(f"💾 Replay saved: {self.recorder.path} ({self.recorder.records} records)")
         print("\n👋 Thanks for playing ReVerse!")
         pygame.quit()
         sys.exit()
 
-    def snap_player_in_front_of_nearest_arrow(self):
-        pass  # Artık kullanılmıyor
-
-    def reset_player_progress(self):
-        """Oyuncunun topladığı verileri sıfırla (yıldız, anahtar, görünmezlik kayıtları)"""
-        # Global ve level-bazlı toplanan kayıtlarını temizle
-        self.collected_by_level.clear()
-        self.collected_global.clear()
-        # Rotate haklarını tamamen sıfırla
-        self.used_rotation_symbols.clear()
-        # Oyuncu envanterini temizle
-        if hasattr(self, 'player') and self.player:
-            self.player.stars_collected = 0
-            self.player.has_key = False
-        # Rotate tetikleme durumlarını temizle
-        self.rotate_cooldown = 0.0
-        self.on_rotate = False
-        # Level'i yeniden yükle ki filtrelenen rotate'ler geri gelsin
-        try:
-            self.load_level(self.current_level)
-        except Exception:
-            pass
-        print("🧹 Player progress reset (stars, key, collections)")
-
-    def _maybe_spawn_key_if_ready(self):
-        """Yeterli yıldız toplandıysa anahtarı sahneye ekle."""
-        if self.key_spawned:
-            return
-        if not self.key_spawn_point:
-            return
-        # Level 1'de anahtar hiç görünmesin
-        if self.current_level == 1:
-            return
-        # Gerekli yıldızlar toplandı mı?
-        if hasattr(self.player, 'required_stars') and self.player.stars_collected >= self.player.required_stars:
-            x, y, size = self.key_spawn_point
-            try:
-                from Scripts.Entities.Collectible import Key
-                key_obj = Key(x, y, size)
-                self.collectibles.append(key_obj)
-                self.key_spawned = True
-                print("🗝️ Anahtar ortaya çıktı!")
-            except Exception as e:
-                print(f"⚠️ Anahtar spawn hatası: {e}")
+    def snapshot_state(self, world=None):
+        """
+        Oyunun mevcut durumunu headless GameState olarak döndür
+        (simülasyon ile karşılaştırma ve doğrulama için)
+        
+        Args:
+            world: GameState World objesi (None ise oyunun kendi World'ü)
+        
+        Returns:
+            GameState
+        """
+        state = self.sim.copy()
+        if world is not None:
+            state.world = world
+        return state
 
 
 # ============================================
@@ -0,0 +1,567 @@
+"""
+ReVerse - Game State
+pygame'siz, deterministik oyun simülasyonu
+step(state, action) -> (state, events): oyunun tek kural kaynağı
+(GameManager oynanışı bununla sürer, sadece çizer ve canlandırır; solver / fuzzer / bot da aynı kodu kullanır)
+"""
+from config import GRID_SIZE, FPS, STARS_TO_WIN, MAX_MAIN_LIVES, JUMPS_PER_LIFE
+from config import STATE_PLAYING, STATE_WIN, STATE_GAME_OVER
+from Scripts.Utils.Constants import *
+from Scripts.Core import Rules
+
+# ============================================
+# ACTIONS (Oyuncu hamleleri)
+# ============================================
+ACTION_UP = "up"
+ACTION_DOWN = "down"
+ACTION_LEFT = "left"
+ACTION_RIGHT = "right"
+ACTION_JUMP = "jump"  # Jump modunu aç/kapat (SPACE)
+
+ACTIONS = (ACTION_UP, ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT, ACTION_JUMP)
+
+ACTION_VECTORS = {
+    ACTION_UP: (0, -1),
+    ACTION_DOWN: (0, 1),
+    ACTION_LEFT: (-1, 0),
+    ACTION_RIGHT: (1, 0)
+}
+
+# ============================================
+# EVENTS (step() çıktısı: (isim, veri) çiftleri)
+# ============================================
+EVENT_JUMP_MODE = "jump_mode"      # veri: will_jump
+EVENT_MOVE = "move"                # veri: hedef (gx, gy)
+EVENT_BLOCKED = "blocked"          # veri: hedef (gx, gy) - harita dışı
+EVENT_JUMP = "jump"                # veri: kalan token
+EVENT_JUMPED_OVER = "jumped_over"  # veri: (gx, gy)
+EVENT_DAMAGE = "damage"            # veri: sebep ("tile", "arrow", "jump")
+EVENT_PUSH = "push"                # veri: hedef (gx, gy)
+EVENT_STAR = "star"                # veri: (gx, gy)
+EVENT_KEY_SPAWN = "key_spawn"      # veri: (gx, gy)
+EVENT_KEY = "key"                  # veri: (gx, gy)
+EVENT_ROTATE = "rotate"            # veri: hedef level
+EVENT_DOOR_LOCKED = "door_locked"  # veri: None
+EVENT_LEVEL = "level"              # veri: yeni level (kapıdan geçiş)
+EVENT_WIN = "win"                  # veri: None
+EVENT_GAME_OVER = "game_over"      # veri: None
+
+# Simülasyon frame süresi (GameManager FPS ile aynı)
+SIM_DT = 1.0 / FPS
+
+
+# ============================================
+# LEVEL / WORLD
+# ============================================
+
+class SimLevel:
+    """
+    Level verisinin simülasyon için derlenmiş hali (pygame objesi yok)
+    LevelLoader ile aynı tarama sırası: son S / D / K geçerlidir
+    """
+
+    def __init__(self, number, level_data):
+        grid = level_data["grid"]
+        self.number = number
+        self.name = level_data.get("name", f"Level {number}")
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.required_stars = level_data.get("stars_required", STARS_TO_WIN)
+
+        self.tiles = {}      # (gx, gy) -> zemin sembolü (., X, oklar)
+        self.stars = []      # Tarama sırasıyla yıldızlar
+        self.rotates = []    # Tarama sırasıyla rotate sembolleri
+        self.key = None      # Anahtar spawn noktası
+        self.door = None
+        self.start = None
+
+        for gy, row in enumerate(grid):
+            for gx, symbol in enumerate(row):
+                if symbol in (TILE_EMPTY, TILE_DAMAGE) or symbol in Rules.ARROW_DIRECTIONS:
+                    self.tiles[(gx, gy)] = symbol
+                elif symbol == TILE_STAR:
+                    self.stars.append((gx, gy))
+                elif symbol == TILE_ROTATE:
+                    self.rotates.append((gx, gy))
+                elif symbol == TILE_KEY:
+                    self.key = (gx, gy)
+                elif symbol == TILE_DOOR:
+                    self.door = (gx, gy)
+                elif symbol == TILE_START:
+                    self.start = (gx, gy)
+
+        # Hücre bazlı O(1) iniş / toplama / rotate sorguları için kümeler
+        self.star_cells = frozenset(self.stars)
+        self.rotate_cells = frozenset(self.rotates)
+
+        if self.start is None:
+            raise ValueError("❌ Level must have a Start position (S)!")
+        if self.door is None:
+            raise ValueError("❌ Level must have a Door (D)!")
+
+
+class World:
+    """
+    Simülasyonun oynadığı level seti (numara -> SimLevel)
+    Rotate sembolleri 1 <-> 2 arasında geçiş yaptığından her iki level de bulunmalı
+    """
+
+    def __init__(self, levels, grid_size=GRID_SIZE, god_mode=False, source=None, total_levels=None):
+        """
+        Args:
+            levels (dict): Level numarası -> LevelData formatında level verisi
+            grid_size (int): Piksel cinsinden hücre boyutu (çarpışma hesapları için)
+            god_mode (bool): Can kaybı yok (test için)
+            source: source(numara) -> level verisi; levels'ta olmayanlar ilk istekte derlenir
+            total_levels (int): source kullanılıyorsa toplam level sayısı
+        """
+        self.levels = {number: SimLevel(number, data) for number, data in levels.items()}
+        if total_levels is None:
+            total_levels = max(self.levels) if self.levels else 0
+        self.total_levels = total_levels
+        self.grid_size = grid_size
+        self.god_mode = god_mode
+        self._source = source
+
+    @classmethod
+    def from_level_data(cls, god_mode=False, lazy=False):
+        """
+        Oyundaki LevelData seviyelerinden world oluştur
+
+        Args:
+            god_mode (bool): Can kaybı yok
+            lazy (bool): Level'ları oynandıkça derle (büyük paketlerde oyun başlangıcı için;
+                         tüm level'ları dolaşan solver / BatchSim için False kalmalı)
+        """
+        from Levels.LevelData import LevelData
+        if lazy:
+            return cls({}, god_mode=god_mode, source=LevelData.get_level,
+                       total_levels=LevelData.get_total_levels())
+        levels = {}
+        for number in range(1, LevelData.get_total_levels() + 1):
+            levels[number] = LevelData.get_level(number)
+        return cls(levels, god_mode=god_mode)
+
+    def level(self, number):
+        """Numaraya göre SimLevel döndür"""
+        level = self.levels.get(number)
+        if level is None:
+            data = self._source(number) if self._source is not None else None
+            if data is None:
+                raise KeyError(number)
+            level = self.levels[number] = SimLevel(number, data)
+        return level
+
+
+# ============================================
+# STATE
+# ============================================
+
+class GameState:
+    """
+    Bir oyunun hareketler arasındaki (oyuncu beklerken) tam durumu.
+    Animasyon ara durumları step() içinde simüle edilir; state sadece
+    hareketler arasında gözlemlenir.
+    """
+
+    __slots__ = (
+        "world", "level", "px", "py", "lives", "tokens", "total_jumps",
+        "stars", "has_key", "will_jump", "just_pushed", "on_rotate",
+        "key_spawned", "key_taken", "collected", "used_rotates", "status", "frames"
+    )
+
+    def __init__(self, world):
+        self.world = world
+        self.level = 1
+        self.px = 0
+        self.py = 0
+        self.lives = MAX_MAIN_LIVES
+        self.tokens = JUMPS_PER_LIFE
+        self.total_jumps = 0
+        self.stars = 0
+        self.has_key = False
+        self.will_jump = False
+        self.just_pushed = False      # Ok tarafından itildi (sonraki inişte hasar yok)
+        self.on_rotate = False        # Rotate kenar algılama
+        self.key_spawned = False
+        self.key_taken = False
+        self.collected = frozenset()     # ('star'|'key', gx, gy) - tüm leveller için ortak
+        self.used_rotates = frozenset()  # (gx, gy) - iki levelde de tüketilmiş rotate'ler
+        self.status = STATE_PLAYING
+        self.frames = 0                  # Simüle edilen toplam frame
+
+    def copy(self):
+        """Yüzeysel kopya (frozenset alanları paylaşılır)"""
+        other = GameState.__new__(GameState)
+        for name in GameState.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def key(self):
+        """
+        Hashlenebilir durum anahtarı (solver / tekrar tespiti için)
+        İstatistik alanları (total_jumps, frames) dahil değildir.
+        """
+        return (
+            self.level, self.px, self.py, self.lives, self.tokens,
+            self.stars, self.has_key, self.will_jump, self.just_pushed,
+            self.on_rotate, self.key_spawned, self.key_taken,
+            self.collected, self.used_rotates, self.status
+        )
+
+    def is_terminal(self):
+        """Oyun bitti mi (kazanma veya game over)"""
+        return self.status != STATE_PLAYING
+
+    def __eq__(self, other):
+        return isinstance(other, GameState) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return (f"L{self.level} ({self.px},{self.py}) | Lives: {self.lives} | Tokens: {self.tokens} | "
+                f"Stars: {self.stars} | Key: {'Yes' if self.has_key else 'No'} | {self.status}")
+
+
+def new_game(world=None, level=1):
+    """
+    Yeni oyun durumu oluştur (GameManager başlangıcı ile aynı)
+
+    Args:
+        world: World objesi (None ise LevelData seviyeleri)
+        level (int): Başlangıç level'ı
+
+    Returns:
+        GameState
+    """
+    if world is None:
+        world = World.from_level_data()
+    state = GameState(world)
+    _load_level(state, level)
+    return state
+
+
+def step(state, action):
+    """
+    Bir oyuncu hamlesini uygula ve oyuncu tekrar bekleme durumuna gelene kadar simüle et
+
+    Args:
+        state (GameState): Mevcut durum (değiştirilmez)
+        action (str): ACTIONS içinden bir hamle
+
+    Returns:
+        tuple: (yeni GameState, events listesi)
+    """
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action}")
+    if state.status != STATE_PLAYING:
+        return state, []
+
+    s = state.copy()
+    events = []
+    motion = _Motion(s)
+
+    if action == ACTION_JUMP:
+        s.will_jump = not s.will_jump
+        events.append((EVENT_JUMP_MODE, s.will_jump))
+    else:
+        dx, dy = ACTION_VECTORS[action]
+        _try_move(s, motion, dx, dy, events)
+
+    # Hareket bitene kadar frame simülasyonu
+    while True:
+        _frame(s, motion, events)
+        if s.status != STATE_PLAYING or not motion.moving:
+            break
+    # Yerleşme frame'i: anahtar spawn'ı ve oyuncunun altındaki anahtarın alınması
+    if s.status == STATE_PLAYING:
+        _frame(s, motion, events)
+    return s, events
+
+
+def play(state, actions):
+    """
+    Hamle dizisini sırayla uygula (oyun biterse durur)
+
+    Returns:
+        tuple: (son GameState, tüm events)
+    """
+    all_events = []
+    for action in actions:
+        if state.is_terminal():
+            break
+        state, events = step(state, action)
+        all_events.extend(events)
+    return state, all_events
+
+
+# ============================================
+# FRAME SIMULATION (60 FPS frame adımları; GameManager animasyonu bu süreyi izler)
+# ============================================
+
+class _Motion:
+    """Tek step boyunca oyuncunun piksel/animasyon durumu"""
+
+    __slots__ = ("moving", "progress", "tx", "ty", "rx", "ry", "alive")
+
+    def __init__(self, state):
+        self.reset(state)
+
+    def reset(self, state):
+        """Yeni Player oluşturulmuş gibi (level yükleme sonrası)"""
+        size = state.world.grid_size
+        self.moving = False
+        self.progress = 0.0
+        self.tx = state.px
+        self.ty = state.py
+        self.rx = state.px * size
+        self.ry = state.py * size
+        self.alive = True
+
+
+def _overlap(ax, ay, bx, by, size, pad=0):
+    """Oyuncu rect'i (ax, ay, size) ile hücre rect'i (padding'li) çakışıyor mu (pygame colliderect)"""
+    bx += pad
+    by += pad
+    bw = size - 2 * pad
+    return ax < bx + bw and bx < ax + size and ay < by + bw and by < ay + size
+
+
+def _load_level(s, number, motion=None):
+    """Level yükle: yeni oyuncu başlangıçta, envanter boş"""
+    level = s.world.level(number)
+    s.level = number
+    s.px, s.py = level.start
+    s.stars = 0
+    s.has_key = False
+    s.will_jump = False
+    s.just_pushed = False
+    s.key_spawned = False
+    s.key_taken = False
+    _maybe_spawn_key(s, level, None)
+    if motion is not None:
+        motion.reset(s)
+
+
+def _maybe_spawn_key(s, level, events):
+    """Yeterli yıldız toplandıysa anahtarı spawn et (Level 1'de anahtar hiç görünmez)"""
+    if s.key_spawned or level.key is None or s.level == 1:
+        return
+    if s.stars >= level.required_stars:
+        s.key_spawned = True
+        s.key_taken = False
+        if events is not None:
+            events.append((EVENT_KEY_SPAWN, level.key))
+
+
+def _reset_progress(s, motion):
+    """Kazanma / game over sonrası ilerlemeyi sıfırla ve level'ı yeniden yükle (canlar korunur)"""
+    s.collected = frozenset()
+    s.used_rotates = frozenset()
+    s.on_rotate = False
+    _load_level(s, s.level, motion)
+
+
+def _switch_level(s, motion, target, events):
+    """Rotate geçişi: yıldız ve anahtar taşınır, grid konumu korunur"""
+    carried = (s.stars, s.has_key, s.px, s.py)
+    _load_level(s, target)
+    level = s.world.level(target)
+    s.stars, s.has_key, gx, gy = carried
+    s.px = max(0, min(gx, level.cols - 1))
+    s.py = max(0, min(gy, level.rows - 1))
+    _maybe_spawn_key(s, level, events)
+    motion.reset(s)
+
+
+def _try_move(s, motion, dx, dy, events):
+    """Hamle: jump modundaysa önce token tüketilir, sonra sınır kontrolü"""
+    world = s.world
+    if s.will_jump:
+        lives_before = s.lives
+        s.lives, s.tokens, s.total_jumps, alive = Rules.use_jump(s.lives, s.tokens, s.total_jumps, world.god_mode)
+        events.append((EVENT_JUMP, s.tokens))
+        if s.lives != lives_before:
+            events.append((EVENT_DAMAGE, "jump"))
+        if not alive:
+            motion.alive = False
+            return
+    level = world.level(s.level)
+    nx, ny = s.px + dx, s.py + dy
+    if not Rules.in_bounds(nx, ny, level.cols, level.rows):
+        events.append((EVENT_BLOCKED, (nx, ny)))
+        return
+    motion.moving = True
+    motion.progress = 0.0
+    motion.tx, motion.ty = nx, ny
+    events.append((EVENT_MOVE, (nx, ny)))
+
+
+def _check_landing(s, motion, level, events):
+    """İniş: hasar tile'ı ve itme okları (itilen oyuncu sonraki inişte hasar almaz)"""
+    if s.just_pushed:
+        s.just_pushed = False
+        return
+    symbol = level.tiles.get((s.px, s.py))
+    if symbol is None:
+        return
+    if s.will_jump:
+        events.append((EVENT_JUMPED_OVER, (s.px, s.py)))
+        return
+
+    god_mode = s.world.god_mode
+    if symbol == TILE_DAMAGE:
+        s.lives, s.tokens, _ = Rules.take_hit(s.lives, s.tokens, god_mode)
+        events.append((EVENT_DAMAGE, "tile"))
+    elif symbol in Rules.ARROW_DIRECTIONS:
+        if not Rules.is_safe_arrow(s.level, s.px, s.py):
+            s.lives, s.tokens, alive = Rules.take_hit(s.lives, s.tokens, god_mode)
+            events.append((EVENT_DAMAGE, "arrow"))
+            if not alive:
+                return
+        direction = Rules.ARROW_DIRECTIONS[symbol]
+        s.px, s.py = Rules.push_target(s.px, s.py, direction, level.cols, level.rows)
+        size = s.world.grid_size
+        motion.rx = s.px * size
+        motion.ry = s.py * size
+        s.just_pushed = True
+        events.append((EVENT_PUSH, (s.px, s.py)))
+
+
+def _frame(s, motion, events):
+    """Tek oyun frame'i (input sonrası): oyuncu, anahtar, toplama, rotate, kapı, game over"""
+    world = s.world
+    size = world.grid_size
+    level = world.level(s.level)
+    s.frames += 1
+
+    # Oyuncu hareketi
+    if motion.alive:
+        if motion.moving:
+            motion.progress += Rules.MOVE_SPEED * SIM_DT
+            if motion.progress >= 1.0:
+                s.px, s.py = motion.tx, motion.ty
+                motion.rx = s.px * size
+                motion.ry = s.py * size
+                _check_landing(s, motion, level, events)
+                motion.moving = False
+                s.will_jump = False
+            else:
+                t = motion.progress
+                start_x = s.px * size
+                start_y = s.py * size
+                x = start_x + (motion.tx * size - start_x) * t
+                y = start_y + (motion.ty * size - start_y) * t
+                if s.will_jump:
+                    y += Rules.jump_arc(t)
+                motion.rx = int(x)
+                motion.ry = int(y)
+        if s.lives <= 0 and not world.god_mode:
+            motion.alive = False
+
+    _maybe_spawn_key(s, level, events)
+
+    # Oyuncunun değdiği hücreler (satır sırasıyla = level tarama sırası)
+    rx, ry = motion.rx, motion.ry
+    gx0 = max(0, rx // size)
+    gx1 = min(level.cols - 1, (rx + size - 1) // size)
+    gy0 = max(0, ry // size)
+    gy1 = min(level.rows - 1, (ry + size - 1) // size)
+    cells = [(gx, gy) for gy in range(gy0, gy1 + 1) for gx in range(gx0, gx1 + 1)]
+
+    # Toplanabilirler (yıldız padding'li collision kutusu kullanır)
+    pad = size // 8
+    for cell in cells:
+        if cell not in level.star_cells:
+            continue
+        gx, gy = cell
+        item = ("star", gx, gy)
+        if item not in s.collected and _overlap(rx, ry, gx * size, gy * size, size, pad):
+            s.collected = s.collected | {item}
+            s.stars += 1
+            s.lives = Rules.add_life(s.lives)
+            events.append((EVENT_STAR, cell))
+    if s.key_spawned and not s.key_taken and level.key in cells:
+        gx, gy = level.key
+        if _overlap(rx, ry, gx * size, gy * size, size, pad):
+            s.key_taken = True
+            s.has_key = True
+            s.collected = s.collected | {("key", gx, gy)}
+            events.append((EVENT_KEY, (gx, gy)))
+
+    # Rotate sembolü: üzerine yeniden basıldığında (kenar) karşı level'a geç
+    collided = None
+    for cell in cells:
+        if cell in level.rotate_cells and cell not in s.used_rotates:
+            gx, gy = cell
+            if _overlap(rx, ry, gx * size, gy * size, size):
+                collided = cell
+                break
+    if collided is not None:
+        if not s.on_rotate:
+            s.used_rotates = s.used_rotates | {collided}
+            target = Rules.other_level(s.level)
+            events.append((EVENT_ROTATE, target))
+            _switch_level(s, motion, target, events)
+            s.on_rotate = True
+        return
+    s.on_rotate = False
+
+    # Kapı
+    gx, gy = level.door
+    if _overlap(rx, ry, gx * size, gy * size, size):
+        if Rules.can_enter_door(s.stars, level.required_stars, s.has_key):
+            if s.level >= world.total_levels:
+                s.status = STATE_WIN
+                events.append((EVENT_WIN, None))
+                _reset_progress(s, motion)
+            else:
+                _load_level(s, s.level + 1, motion)
+                events.append((EVENT_LEVEL, s.level))
+        elif (EVENT_DOOR_LOCKED, None) not in events:
+            events.append((EVENT_DOOR_LOCKED, None))
+
+    # Game Over
+    if not motion.alive:
+        s.status = STATE_GAME_OVER
+        events.append((EVENT_GAME_OVER, None))
+        _reset_progress(s, motion)
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=== GameState Test ===\n")
+
+    state = new_game()
+    print(f"Start: {state}")
+    for action in (ACTION_RIGHT, ACTION_UP, ACTION_JUMP, ACTION_LEFT):
+        state, events = step(state, action)
+        print(f"{action:>5} -> {state}")
+        for name, data in events:
+            print(f"        {name}: {data}")
+
+    # Rastgele oyun hızı
+    rng = random.Random(0)
+    world = World.from_level_data()
+    games = 0
+    moves = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < 1.0:
+        state = new_game(world)
+        for _ in range(40):
+            state, _ = step(state, rng.choice(ACTIONS))
+            moves += 1
+            if state.is_terminal():
+                break
+        games += 1
+    elapsed = time.perf_counter() - started
+    print(f"\n⚡ {games / elapsed:.0f} games/s | {moves / elapsed:.0f} steps/s")
+
+    print("\n=== Test Complete ===")
@@ -1,12 +1,14 @@
 """
 ReVerse - Player
 Yeşil amorf taş karakter - Grid tabanlı turn-based hareket
+Sadece görünüm ve input: hareket kuralları GameState.step'te, Player onun sonucunu canlandırır
 """
 import pygame
-from Scripts.Utils.Path import asset_path
 from config import *
 from Scripts.Systems.ResourceManager import ResourceManager
 from Scripts.Utils.Constants import *
+from Scripts.Systems.SpriteCache import get_sprite
+from Scripts.Core import Rules
 
 class Player:
     """
@@ -24,8 +26,7 @@ class Player:
         # Sprite yükle
         try:
             self._default_sprite_path = "Assets/Sprites/Avatar.png"
-            self.sprite = pygame.image.load(asset_path(self._default_sprite_path))
-            self.sprite = pygame.transform.scale(self.sprite, (size, size))
+            self.sprite = get_sprite(self._default_sprite_path, (size, size))
         except (FileNotFoundError, pygame.error) as e:
             self.sprite = None
             print(f"⚠️ Avatar.png yüklenemedi: {e}")
@@ -33,15 +34,43 @@ class Player:
         # Kalp sprite yükle (UI için)
         try:
             heart_size = int(32 * SCALE)  # Kalp boyutu
-            self.heart_sprite = pygame.image.load(asset_path("Assets/Sprites/Kalp.png"))
-            self.heart_sprite = pygame.transform.smoothscale(self.heart_sprite, (heart_size, heart_size))
+            self.heart_sprite = get_sprite("Assets/Sprites/Kalp.png", (heart_size, heart_size), smooth=True)
         except (FileNotFoundError, pygame.error) as e:
             self.heart_sprite = None
             print(f"⚠️ Kalp.png yüklenemedi: {e}")
         
+        # UI şeridi parçaları premultiplied alpha ile bir kez hazırlanır
+        # (boş kalp: piksel alfası 50/255 ile çarpılmış soluk kopya)
+        self._heart_full = None
+        self._heart_faded = None
+        if self.heart_sprite:
+            self._heart_full = self.heart_sprite.premul_alpha()
+            faded = self.heart_sprite.copy()
+            faded.fill((255, 255, 255, 50), special_flags=pygame.BLEND_RGBA_MULT)
+            self._heart_faded = faded.premul_alpha()
+        self._top_bars = {}         # (genişlik, yükseklik) -> yarı saydam bar
+        self._ui_strip = None
+        self._ui_strip_key = None
+        
+        # Görünüm durumu (grid, animasyon, envanter, input)
+        self.reinit(x, y)
+
+    def reinit(self, x, y):
+        """
+        Oyuncuyu yeni oluşturulmuş haline döndür (sprite'lar yeniden yüklenmez).
+        LevelLoader önbellekteki level'ı tekrar kullanırken çağırır.
+        
+        Args:
+            x, y: Başlangıç pozisyonu (piksel)
+        """
+        self.x = x
+        self.y = y
+        self.rect.x = x
+        self.rect.y = y
+        
         # Grid pozisyon
-        self.grid_x = x // size
-        self.grid_y = y // size
+        self.grid_x = x // self.size
+        self.grid_y = y // self.size
         
         # Turn-based hareket durumu
         self.turn_state = "waiting"  # "waiting", "jump_selected", "moving"
@@ -49,19 +78,14 @@ class Player:
         self.target_grid_x = self.grid_x
         self.target_grid_y = self.grid_y
         self.move_progress = 0.0  # 0.0 - 1.0 arası animasyon
-        self.move_speed = 8.0  # Hız çarpanı (daha yüksek = daha hızlı)
-        self.just_pushed = False  # Ok tarafından itildi mi (çift hasar önleme)
+        self.move_speed = Rules.MOVE_SPEED  # Hız çarpanı (GameState ile aynı süre)
         
-        # Oyun durumu
+        # Envanter (HUD ve kapı görseli için; GameManager GameState'ten kopyalar)
         self.resource_manager = None  # GameManager tarafından set edilecek
         self.stars_collected = 0
         self.required_stars = STARS_TO_WIN
         self.has_key = False
-        self.require_key = True
         self.is_alive = True
-        # Seviye bazlı ayarlar
-        self.push_damage_enabled = True  # İtme okuna basmak can götürsün mü?
-        self.current_level = 1  # Mevcut level numarası (sprite ve ok kontrolleri için)
         
         # Input throttle (tuş basılı tutmayı engelle)
         self.last_input_time = 0
@@ -71,75 +95,75 @@ class Player:
     def set_sprite(self, relative_path: str):
         """Oyuncu sprite'ını değiştir (Assets/Sprites altındaki dosya)."""
         try:
-            img = pygame.image.load(asset_path(relative_path))
-            self.sprite = pygame.transform.scale(img, (self.size, self.size))
+            self.sprite = get_sprite(relative_path, (self.size, self.size))
         except (FileNotFoundError, pygame.error) as e:
             print(f"⚠️ Sprite yüklenemedi ({relative_path}): {e}")
 
     def restore_default_sprite(self):
         """Varsayılan Avatar sprite'ına geri dön."""
         try:
-            img = pygame.image.load(asset_path(self._default_sprite_path))
-            self.sprite = pygame.transform.scale(img, (self.size, self.size))
+            self.sprite = get_sprite(self._default_sprite_path, (self.size, self.size))
         except (FileNotFoundError, pygame.error) as e:
             print(f"⚠️ Varsayılan Avatar yüklenemedi: {e}")
         
-    def update(self, dt, tiles):
+    def update(self, dt):
         """
-        Frame güncellemesi
+        Frame güncellemesi (hareket animasyonu)
         
         Args:
             dt: Delta time
-            tiles: Tile listesi (çarpışma için)
         """
-        if not self.is_alive:
+        if self.turn_state != "moving":
             return
         
-        # Hareket animasyonu
-        if self.turn_state == "moving":
-            self.move_progress += self.move_speed * dt
-            
-            if self.move_progress >= 1.0:
-                # Hareket tamamlandı
-                self.move_progress = 1.0
-                self.grid_x = self.target_grid_x
-                self.grid_y = self.target_grid_y
-                self.x = self.grid_x * self.size
-                self.y = self.grid_y * self.size
-                self.rect.x = int(self.x)
-                self.rect.y = int(self.y)
-                
-                # Hedefe ulaştıktan sonra tile kontrolü
-                self._check_landing(tiles)
-                
-                # Tur bitti, yeni tur başlat
-                self.turn_state = "waiting"
-                self.will_jump = False
-            else:
-                # Animasyon devam ediyor
-                start_x = (self.grid_x * self.size)
-                start_y = (self.grid_y * self.size)
-                target_x = (self.target_grid_x * self.size)
-                target_y = (self.target_grid_y * self.size)
-                
-                # Eğri interpolasyon (zıplarken yukarı çık)
-                t = self.move_progress
-                if self.will_jump:
-                    # Parabol eğrisi (zıplama) - negatif yukarı yönde hareket
-                    arc = JUMP_ARC_HEIGHT * (1 - (2*t - 1)**2)
-                    self.x = start_x + (target_x - start_x) * t
-                    self.y = start_y + (target_y - start_y) * t + arc
-                else:
-                    # Düz hareket
-                    self.x = start_x + (target_x - start_x) * t
-                    self.y = start_y + (target_y - start_y) * t
-                
-                self.rect.x = int(self.x)
-                self.rect.y = int(self.y)
-        
-        # Oyun sonu kontrolü
-        if self.resource_manager and self.resource_manager.is_game_over():
-            self.is_alive = False
+        self.move_progress += self.move_speed * dt
+        if self.move_progress >= 1.0:
+            # Hareket tamamlandı (iniş sonucu GameManager tur sonunda uygular)
+            self.move_progress = 1.0
+            self.will_jump = False
+            self.place(self.target_grid_x, self.target_grid_y)
+            return
+        
+        start_x = (self.grid_x * self.size)
+        start_y = (self.grid_y * self.size)
+        target_x = (self.target_grid_x * self.size)
+        target_y = (self.target_grid_y * self.size)
+        
+        # Eğri interpolasyon (zıplarken yukarı çık)
+        t = self.move_progress
+        self.x = start_x + (target_x - start_x) * t
+        self.y = start_y + (target_y - start_y) * t
+        if self.will_jump:
+            # Parabol eğrisi (zıplama) - negatif yukarı yönde hareket
+            self.y += Rules.jump_arc(t)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
+    
+    def start_move(self, grid_x, grid_y, jump):
+        """
+        Hareket animasyonunu başlat
+        
+        Args:
+            grid_x, grid_y: Hedef hücre (GameState'in kabul ettiği hamle)
+            jump (bool): Zıplama eğrisi çizilsin mi
+        """
+        self.target_grid_x = grid_x
+        self.target_grid_y = grid_y
+        self.will_jump = jump
+        self.move_progress = 0.0
+        self.turn_state = "moving"
+    
+    def place(self, grid_x, grid_y):
+        """Oyuncuyu hücreye yerleştir (animasyon biter)"""
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        self.target_grid_x = grid_x
+        self.target_grid_y = grid_y
+        self.x = grid_x * self.size
+        self.y = grid_y * self.size
+        self.rect.x = self.x
+        self.rect.y = self.y
+        self.turn_state = "jump_selected" if self.will_jump else "waiting"
     
     def handle_input(self, keys, current_time):
         """
@@ -147,154 +171,45 @@ class Player:
         
         Args:
             keys: pygame.key.get_pressed()
-            current_time: pygame.time.get_ticks() / 1000.0
+            current_time: Oyun zamanı (GameClock.now(), saniye)
+        
+        Returns:
+            str: Basılan hamle (DIR_* veya "jump"), yoksa None; GameManager GameState.step'e verir
         """
         if not self.is_alive:
-            return
+            return None
         
         # Hareket animasyonu devam ediyorsa input alma
         if self.turn_state == "moving":
-            return
+            return None
         
         # Input cooldown
         if current_time - self.last_input_time < self.input_cooldown:
-            return
+            return None
         
         # SPACE tuşu -> Zıplama seçimi (toggle) - edge detection
         if keys[pygame.K_SPACE] and not self.space_held:
             self.space_held = True
-            self.will_jump = not self.will_jump
-            self.turn_state = "jump_selected" if self.will_jump else "waiting"
             self.last_input_time = current_time
-            status = "JUMP mode ON" if self.will_jump else "JUMP mode OFF"
-            print(f"⚡ {status}")
-            return
+            return "jump"
         elif not keys[pygame.K_SPACE]:
             # Tuş bırakıldığında tekrar toggle'a izin ver
             self.space_held = False
         
-        # Yön tuşları -> Hareket yönü seç ve hareketi başlat
-        dx, dy = 0, 0
-        direction_pressed = False
-        
+        # Yön tuşları
+        direction = None
         if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -1
-            direction_pressed = True
+            direction = DIR_UP
         elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = 1
-            direction_pressed = True
+            direction = DIR_DOWN
         elif keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -1
-            direction_pressed = True
+            direction = DIR_LEFT
         elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = 1
-            direction_pressed = True
+            direction = DIR_RIGHT
         
-        if direction_pressed:
+        if direction:
             self.last_input_time = current_time
-            self._try_move(dx, dy)
-    
-    def _try_move(self, dx, dy):
-        """
-        Belirtilen yöne hareket etmeyi dene
-        
-        Args:
-            dx, dy: Grid yönü (-1, 0, 1)
-        """
-        # Eğer jump modundaysa önceden token tüket; bitmişse hareket etme
-        if self.will_jump:
-            if self.resource_manager:
-                can_continue = self.resource_manager.use_jump()
-                if not can_continue:
-                    self.is_alive = False
-                    return
-        # Hedef grid pozisyonunu hesapla
-        new_grid_x = self.grid_x + dx
-        new_grid_y = self.grid_y + dy
-        
-        # Grid sınırlarını kontrol et
-        if new_grid_x < 0 or new_grid_x >= GRID_COLS:
-            print("🚫 Out of bounds (X)")
-            return
-        if new_grid_y < 0 or new_grid_y >= GRID_ROWS:
-            print("🚫 Out of bounds (Y)")
-            return
-        
-        # Hedefi ayarla ve hareketi başlat
-        self.target_grid_x = new_grid_x
-        self.target_grid_y = new_grid_y
-        self.move_progress = 0.0
-        self.turn_state = "moving"
-        
-        jump_str = " + JUMP" if self.will_jump else ""
-        print(f"➡️  Moving to ({new_grid_x}, {new_grid_y}){jump_str}")
-    
-    def _check_landing(self, tiles):
-        """
-        Hedefe ulaştıktan sonra tile kontrolü yap
-        
-        Args:
-            tiles: Tile listesi
-        """
-        # Ok tarafından itildiyse, hedef tile'ın hasarını alma (çift hasar önleme)
-        if self.just_pushed:
-            self.just_pushed = False
-            return
-            
-        for tile in tiles:
-            if not tile.is_solid:
-                continue
-            
-            # Oyuncu ile aynı grid pozisyonunda mı?
-            tile_grid_x = tile.x // self.size
-            tile_grid_y = tile.y // self.size
-            
-            if tile_grid_x == self.grid_x and tile_grid_y == self.grid_y:
-                # Zıplamadıysa ve siyah tile ise can götür
-                if not self.will_jump and hasattr(tile, 'on_player_land'):
-                    tile.on_player_land(self)
-                elif self.will_jump:
-                    print("🦘 Jumped over tile!")
-                break
-    
-    def check_collectibles(self, collectibles):
-        """
-        Toplanabilir objelerle çarpışma kontrolü
-        
-        Args:
-            collectibles: Collectible objesi listesi
-            
-        Returns:
-            list: Toplanan objeler
-        """
-        collected = []
-        
-        for item in collectibles:
-            # Güvenlik: Beklenen arayüz yoksa atla
-            if not hasattr(item, 'rect'):
-                continue
-            if hasattr(item, 'is_collected') and item.is_collected():
-                continue
-            
-            if self.rect.colliderect(item.rect):
-                if hasattr(item, 'collect'):
-                    item.collect(self)
-                    collected.append(item)
-        
-        return collected
-    
-    def push(self, dx, dy):
-        """
-        Oyuncuyu belirli yöne it (Triangle tarafından)
-        İleride: İtme animasyonu eklenebilir
-        
-        Args:
-            dx: X yönünde grid sayısı
-            dy: Y yönünde grid sayısı
-        """
-        print(f"🔺 Pushed by triangle!")
-        # Şimdilik itmeyi devre dışı bırak
-        # self._try_move(dx, dy)
+        return direction
     
     def draw(self, screen, camera_offset=(0, 0)):
         """
@@ -328,96 +243,98 @@ class Player:
             pygame.draw.circle(screen, self.color, center, radius)
             pygame.draw.circle(screen, (0, 0, 0), center, radius, 2)
     
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        """
+        Bu frame çizilen bölge (sprite + zıplama parlaması)
+        
+        Returns:
+            pygame.Rect: Render surface koordinatında bölge veya None
+        """
+        if not self.is_alive:
+            return None
+        draw_x = int(self.x) - camera_offset[0]
+        draw_y = int(self.y) - camera_offset[1]
+        rect = pygame.Rect(draw_x, draw_y, self.size, self.size)
+        if self.will_jump and self.turn_state == "jump_selected":
+            # Parlama efekti sprite'tan 5 piksel taşar
+            rect.inflate_ip(12, 12)
+        return rect
+    
     def draw_ui(self, screen):
         """
         Oyuncu UI (kalpler ve jump token'lar) — haritanın üstünde görünür.
+        Şerit önceden oluşturulmuş parçalardan birleştirilir ve sadece
+        pencere genişliği veya can/token sayısı değişince yeniden çizilir.
         """
-        font = pygame.font.Font(None, int(18 * SCALE))
-        
         # Can bilgisi
         if not self.resource_manager:
             return
         info = self.resource_manager.get_lives_info()
         
+        sw = screen.get_width()
+        key = (sw, info['main_lives'], info['jump_tokens'])
+        if key != self._ui_strip_key or self._ui_strip is None:
+            self._ui_strip = self._build_ui_strip(sw, info['main_lives'], info['jump_tokens'])
+            self._ui_strip_key = key
+        screen.blit(self._ui_strip, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def _build_ui_strip(self, width, main_lives, jump_tokens):
+        """
+        Üst şeridi (yarı saydam bar, kalpler, jump token'lar) tek surface'e çiz
+        
+        Args:
+            width (int): Pencere genişliği
+            main_lives (int): Dolu kalp sayısı
+            jump_tokens (int): Dolu token sayısı
+        
+        Returns:
+            pygame.Surface: Premultiplied SRCALPHA şerit (alt çizgi dahil)
+        """
         # Üstte yarı-transparan üst şerit ve UI yerleşimi
         heart_size = int(32 * SCALE)
         token_size = int(20 * SCALE)
         start_x = int(10 * SCALE)
         start_y = int(6 * SCALE)
         spacing = int(40 * SCALE)
-        try:
-            sw, sh = screen.get_size()
-            bar_h = max(int(54 * SCALE), heart_size + token_size + int(16 * SCALE))
-            top_bar = pygame.Surface((sw, bar_h), pygame.SRCALPHA)
-            top_bar.fill((0, 0, 0, 120))
-            screen.blit(top_bar, (0, 0))
-            pygame.draw.line(screen, (80, 80, 80), (0, bar_h), (sw, bar_h), 1)
-        except Exception:
-            pass
+        bar_h = max(int(54 * SCALE), heart_size + token_size + int(16 * SCALE))
+        
+        # Parçalar premultiplied "over" ile birleştirilir; böylece tek blit,
+        # parçaları ekrana tek tek çizmekle aynı sonucu verir
+        strip = pygame.Surface((width, bar_h + 1), pygame.SRCALPHA)
+        strip.blit(self._get_top_bar(width, bar_h), (0, 0))
+        pygame.draw.line(strip, (80, 80, 80), (0, bar_h), (width, bar_h), 1)
         
         # 3 kalp çiz
         for i in range(3):
             x = start_x + i * spacing
             if self.heart_sprite:
-                # Sprite varsa onu kullan
-                if i < info['main_lives']:
-                    screen.blit(self.heart_sprite, (x, start_y))
-                else:
-                    # Boş kalp için soluk göster
-                    faded = self.heart_sprite.copy()
-                    faded.set_alpha(50)
-                    screen.blit(faded, (x, start_y))
+                # Sprite varsa onu kullan (boş kalp için önceden soluklaştırılmış kopya)
+                heart = self._heart_full if i < main_lives else self._heart_faded
+                strip.blit(heart, (x, start_y), special_flags=pygame.BLEND_PREMULTIPLIED)
             else:
                 # Sprite yoksa renkli kare
-                if i < info['main_lives']:
-                    pygame.draw.rect(screen, (255, 0, 0), (x, start_y, heart_size, heart_size))
-                else:
-                    pygame.draw.rect(screen, (100, 100, 100), (x, start_y, heart_size, heart_size))
+                color = (255, 0, 0) if i < main_lives else (100, 100, 100)
+                pygame.draw.rect(strip, color, (x, start_y, heart_size, heart_size))
         
         # Kalplerin altında 3 yeşil kare (jump tokens)
         token_y = start_y + heart_size + int(5 * SCALE)
         for i in range(3):
             x = start_x + i * spacing + (heart_size - token_size) // 2  # Ortalanmış
-            if i < info['jump_tokens']:
-                pygame.draw.rect(screen, (50, 200, 50), (x, token_y, token_size, token_size))
-            else:
-                pygame.draw.rect(screen, (100, 100, 100), (x, token_y, token_size, token_size))
-        
-        # Yıldız ve anahtar (kalbin sağında)
-        text_x = start_x + 3 * spacing + int(10 * SCALE)
-        text_y = start_y
+            color = (50, 200, 50) if i < jump_tokens else (100, 100, 100)
+            pygame.draw.rect(strip, color, (x, token_y, token_size, token_size))
         
-        # Oyun içinde gri metinler kaldırıldı (yıldız/anahtar metinleri gösterme)
-        
-        # Turn durumu (alt kısımda)
-        # Oyun içinde kontrol ipuçları (SPACE/WASD) metinleri kaldırıldı
+        # Oyun içinde yıldız/anahtar ve kontrol ipucu metinleri gösterilmiyor
+        return strip
     
-    def reset(self, x, y):
-        """
-        Oyuncuyu başlangıç pozisyonuna döndür
-        
-        Args:
-            x, y: Yeni pozisyon
-        """
-        self.x = x
-        self.y = y
-        self.rect.x = x
-        self.rect.y = y
-        self.grid_x = x // self.size
-        self.grid_y = y // self.size
-        self.target_grid_x = self.grid_x
-        self.target_grid_y = self.grid_y
-        self.turn_state = "waiting"
-        self.will_jump = False
-        self.move_progress = 0.0
-        self.just_pushed = False  # İtme bayrağını temizle
-        self.stars_collected = 0
-        self.has_key = False
-        self.is_alive = True
-        self.push_damage_enabled = True
-        if self.resource_manager:
-            self.resource_manager.reset()
-        print("🔄 Player reset!")
+    def _get_top_bar(self, width, bar_h):
+        """Genişlik başına bir kez oluşturulan yarı saydam üst bar"""
+        key = (width, bar_h)
+        bar = self._top_bars.get(key)
+        if bar is None:
+            bar = pygame.Surface(key, pygame.SRCALPHA)
+            bar.fill((0, 0, 0, 120))
+            self._top_bars[key] = bar
+        return bar
 
 
 # ============================================
@@ -0,0 +1,154 @@
+"""
+ReVerse - Game Rules
+pygame'den bağımsız saf oyun kuralları
+Entity'ler (Tile, Door, Player, ResourceManager) ve headless GameState aynı fonksiyonları kullanır
+"""
+import config
+from Scripts.Utils.Constants import *
+
+# ============================================
+# HAREKET (Movement)
+# ============================================
+MOVE_SPEED = 8.0  # Hareket animasyonu hız çarpanı (progress/saniye)
+
+DIRECTION_VECTORS = {
+    DIR_RIGHT: (1, 0),
+    DIR_LEFT: (-1, 0),
+    DIR_UP: (0, -1),
+    DIR_DOWN: (0, 1)
+}
+
+REVERSE_DIRECTION = {
+    DIR_RIGHT: DIR_LEFT,
+    DIR_LEFT: DIR_RIGHT,
+    DIR_UP: DIR_DOWN,
+    DIR_DOWN: DIR_UP
+}
+
+# Harita sembolü -> itici ok yönü
+ARROW_DIRECTIONS = {
+    TILE_PUSH_RIGHT: DIR_RIGHT,
+    TILE_PUSH_LEFT: DIR_LEFT,
+    TILE_PUSH_UP: DIR_UP,
+    TILE_PUSH_DOWN: DIR_DOWN
+}
+
+# Hasarsız oklar: Level 1, Row B, Column 2 (2,1) ok'u SADECE hasarsız
+# Level 2 ve diğer tüm oklar daima hasar verir
+SAFE_ARROWS = {
+    1: {(2, 1)}
+}
+
+
+def jump_arc(t):
+    """
+    Zıplama parabolü (negatif yukarı yönde)
+
+    Args:
+        t (float): Hareket ilerlemesi (0.0 - 1.0)
+
+    Returns:
+        float: Dikey piksel kayması
+    """
+    return config.JUMP_ARC_HEIGHT * (1 - (2*t - 1)**2)
+
+
+def in_bounds(gx, gy, cols, rows):
+    """Grid pozisyonu harita içinde mi"""
+    return 0 <= gx < cols and 0 <= gy < rows
+
+
+# ============================================
+# İTİCİ OKLAR (Push Arrows)
+# ============================================
+
+def is_safe_arrow(level, gx, gy):
+    """
+    Bu ok basıldığında hasar vermez mi
+
+    Args:
+        level (int): Level numarası
+        gx, gy: Okun grid koordinatı
+    """
+    return (gx, gy) in SAFE_ARROWS.get(level, ())
+
+
+def push_target(gx, gy, direction, cols, rows):
+    """
+    Okun oyuncuyu yerleştirdiği hücre (ok ucunun 1 önü, sınırlar içinde)
+
+    Args:
+        gx, gy: Okun grid koordinatı
+        direction (str): Ok yönü
+        cols, rows: Grid boyutu
+
+    Returns:
+        tuple: (hedef_x, hedef_y)
+    """
+    dx, dy = DIRECTION_VECTORS.get(direction, (0, 0))
+    target_gx = max(0, min(gx + dx, cols - 1))
+    target_gy = max(0, min(gy + dy, rows - 1))
+    return target_gx, target_gy
+
+
+# ============================================
+# LEVEL AKIŞI (Level Flow)
+# ============================================
+
+def other_level(level):
+    """Rotate sembolünün geçiş yaptığı karşı level (1 <-> 2)"""
+    return 2 if level == 1 else 1
+
+
+def can_enter_door(stars, required_stars, has_key, require_key=True):
+    """
+    Kapı açılır mı (anahtar + yeterli yıldız)
+
+    Returns:
+        bool: Girebilir mi?
+    """
+    return (has_key or not require_key) and stars >= required_stars
+
+
+# ============================================
+# CAN / ZIPLAMA HAVUZU (3x3 Kuralı)
+# ============================================
+
+def take_hit(lives, tokens, god_mode=False):
+    """
+    Engel teması: 1 can götür; can kalırsa jump token'ları yenile
+
+    Returns:
+        tuple: (lives, tokens, alive)
+    """
+    if god_mode:
+        return lives, tokens, True
+    lives -= 1
+    if lives > 0:
+        return lives, config.JUMPS_PER_LIFE, True
+    return lives, tokens, False
+
+
+def use_jump(lives, tokens, total_jumps, god_mode=False):
+    """
+    Zıplama hakkı kullan; token biterse 1 can gider ve tokenlar yenilenir
+
+    Returns:
+        tuple: (lives, tokens, total_jumps, alive)
+    """
+    if god_mode:
+        return lives, tokens, total_jumps, True
+    tokens -= 1
+    total_jumps += 1
+    if tokens <= 0:
+        lives -= 1
+        if lives > 0:
+            tokens = config.JUMPS_PER_LIFE
+        else:
+            return lives, tokens, total_jumps, False
+    return lives, tokens, total_jumps, True
+
+
+def add_life(lives):
+    """Yıldız bonusu: can maksimumun altındaysa 1 can ekle"""
+    return lives + 1 if lives < config.MAX_MAIN_LIVES else lives
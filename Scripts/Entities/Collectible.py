@@ -6,7 +6,8 @@ import pygame
 import math
 from config import *
 from Scripts.Utils.Constants import *
-from Scripts.Utils.Path import asset_path
+from Scripts.Systems.SpriteCache import get_sprite
+from Scripts.Core import Rules
 
 # ============================================
 # BASE COLLECTIBLE CLASS
@@ -29,6 +30,7 @@ class Collectible:
         self.collected = False
         self.bounce_offset = 0  # Zıplama animasyonu için
         self.bounce_speed = 2
+        self.clock = None  # GameClock (LevelLoader enjekte eder; yoksa animasyon durur)
         
     def draw(self, screen, camera_offset=(0, 0)):
         """
@@ -51,6 +53,19 @@ class Collectible:
         pygame.draw.circle(screen, self.color, center, radius)
         pygame.draw.circle(screen, (0, 0, 0), center, radius, 1)
     
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        """
+        Bu frame çizilen bölge (dirty rect renderer için)
+        
+        Returns:
+            pygame.Rect: Render surface koordinatında bölge veya None
+        """
+        if self.collected:
+            return None
+        draw_x = self.rect.x - camera_offset[0]
+        draw_y = self.rect.y - camera_offset[1] + int(self.bounce_offset)
+        return pygame.Rect(draw_x - 1, draw_y - 1, self.rect.width + 2, self.rect.height + 2)
+    
     def update(self, dt):
         """
         Zıplama animasyonu
@@ -58,17 +73,20 @@ class Collectible:
         Args:
             dt: Delta time
         """
-        if not self.collected:
-            self.bounce_offset = math.sin(pygame.time.get_ticks() * 0.003) * 5
+        if not self.collected and self.clock is not None:
+            self.bounce_offset = math.sin(self.clock.now() * 3.0) * 5
     
-    def collect(self, player):
+    def reinit(self, x, y):
         """
-        Toplanma eylemi
-        
-        Args:
-            player: Player objesi
+        Havuzdan (PrefabPool) tekrar kullanım: yeni konum + başlangıç durumu
+        (sprite'lar korunur, disk / decode yok)
         """
-        self.collected = True
+        self.x = x
+        self.y = y
+        padding = self.size // 8
+        self.rect.topleft = (x + padding, y + padding)
+        self.collected = False
+        self.bounce_offset = 0
     
     def is_collected(self):
         """Toplanmış mı kontrol et"""
@@ -86,10 +104,9 @@ class Star(Collectible):
         super().__init__(x, y, size)
         self.color = STAR_COLOR
         
-        # Sprite yükle
+        # Sprite yükle (paylaşılan önbellekten)
         try:
-            self.sprite = pygame.image.load(asset_path("Assets/Sprites/Yildiz.png"))
-            self.sprite = pygame.transform.scale(self.sprite, (size, size))
+            self.sprite = get_sprite("Assets/Sprites/Yildiz.png", (size, size))
         except (FileNotFoundError, pygame.error) as e:
             self.sprite = None
             print(f"⚠️ Yildiz.png yüklenemedi: {e}")
@@ -114,6 +131,12 @@ class Star(Collectible):
             pygame.draw.polygon(screen, self.color, points)
             pygame.draw.polygon(screen, (0, 0, 0), points, 2)
     
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        if self.collected:
+            return None
+        # Sprite ve yedek şekil hücre içinde, zıplama ofseti olmadan çiziliyor
+        return pygame.Rect(self.x - camera_offset[0], self.y - camera_offset[1], self.size, self.size)
+    
     def _get_star_points(self, center, radius):
         """5 köşeli yıldız noktaları"""
         cx, cy = center
@@ -127,14 +150,6 @@ class Star(Collectible):
             points.append((x, y))
         
         return points
-    
-    def collect(self, player):
-        super().collect(player)
-        player.stars_collected += 1
-        # Yıldız toplandığında can ekle
-        if player.resource_manager:
-            player.resource_manager.add_life()
-        print(f"⭐ Star collected! Total: {player.stars_collected}")
 
 
 class Key(Collectible):
@@ -144,10 +159,9 @@ class Key(Collectible):
         super().__init__(x, y, size)
         self.color = KEY_COLOR
         
-        # Sprite yükle
+        # Sprite yükle (paylaşılan önbellekten)
         try:
-            self.sprite = pygame.image.load(asset_path("Assets/Sprites/Key.png"))
-            self.sprite = pygame.transform.scale(self.sprite, (size, size))
+            self.sprite = get_sprite("Assets/Sprites/Key.png", (size, size))
         except (FileNotFoundError, pygame.error) as e:
             self.sprite = None
             print(f"⚠️ Key.png yüklenemedi: {e}")
@@ -173,10 +187,10 @@ class Key(Collectible):
             pygame.draw.circle(screen, (0, 0, 0), center, self.rect.width // 3, 2)
             pygame.draw.rect(screen, (0, 0, 0), body_rect, 2)
     
-    def collect(self, player):
-        super().collect(player)
-        player.has_key = True
-        print("🔑 Key obtained!")
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        if self.collected:
+            return None
+        return pygame.Rect(self.x - camera_offset[0], self.y - camera_offset[1], self.size, self.size)
 
 
 class Door(Collectible):
@@ -193,18 +207,11 @@ class Door(Collectible):
         self.bounce_offset = 0
         self.bounce_speed = 2
         self.is_open = False
-        self.last_try_time = 0  # Mesaj spam önleme
-        self.message_cooldown = 0.5  # saniye
         
-        # Sprite yükle (kapalı ve açık kapı)
+        # Sprite yükle (kapalı ve açık kapı) - smooth scale ile kaliteyi koru
         try:
-            # Orijinal görseli yükle ve aspect ratio'yu koru
-            closed_img = pygame.image.load(asset_path("Assets/Sprites/Kapi.png"))
-            open_img = pygame.image.load(asset_path("Assets/Sprites/AcikKapi.png"))
-            
-            # Smooth scale ile kaliteyi koru
-            self.sprite_closed = pygame.transform.smoothscale(closed_img, (size, size))
-            self.sprite_open = pygame.transform.smoothscale(open_img, (size, size))
+            self.sprite_closed = get_sprite("Assets/Sprites/Kapi.png", (size, size), smooth=True)
+            self.sprite_open = get_sprite("Assets/Sprites/AcikKapi.png", (size, size), smooth=True)
         except (FileNotFoundError, pygame.error) as e:
             self.sprite_closed = None
             self.sprite_open = None
@@ -237,6 +244,14 @@ class Door(Collectible):
             inner_rect = pygame.Rect(draw_x + 10, draw_y + 10, self.size - 20, self.size - 20)
             pygame.draw.rect(screen, (0, 0, 0), inner_rect, 1)
     
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        # Açık/kapalı görsel değişimi yıldız/anahtar durumuna bağlı; bölge sabit
+        return pygame.Rect(self.rect.x - camera_offset[0], self.rect.y - camera_offset[1], self.size, self.size)
+    
+    def dirty_token(self, player=None):
+        """Görünümü belirleyen durum (açık / kapalı): bölge sabitken değişimi dirty rect'e bildirir"""
+        return self.can_enter(player) if player else self.is_open
+    
     def can_enter(self, player):
         """
         Oyuncu kapıya girebilir mi kontrol et
@@ -249,36 +264,19 @@ class Door(Collectible):
         """
         # Anahtarı var mı ve yeterli yıldızı topladı mı?
         require_key = getattr(player, 'require_key', True)
-        has_key_or_not_required = (player.has_key or not require_key)
-        return has_key_or_not_required and player.stars_collected >= player.required_stars
+        return Rules.can_enter_door(player.stars_collected, player.required_stars, player.has_key, require_key)
     
-    def try_enter(self, player, current_time):
-        """
-        Kapıya girmeyi dene
-        
-        Args:
-            player: Player objesi
-            current_time: Şu anki zaman (saniye)
-            
-        Returns:
-            bool: Başarılı mı?
-        """
-        if self.can_enter(player):
-            self.is_open = True
-            print("🚪 Door opened! Level complete!")
-            return True
-        else:
-            # Mesaj spam önleme
-            if current_time - self.last_try_time > self.message_cooldown:
-                missing = []
-                if not player.has_key:
-                    missing.append("Key")
-                if player.stars_collected < player.required_stars:
-                    missing.append(f"Stars ({player.stars_collected}/{player.required_stars})")
-                
-                print(f"🚫 Door locked! Missing: {', '.join(missing)}")
-                self.last_try_time = current_time
-            return False
+    def reinit(self, x, y):
+        """Havuzdan tekrar kullanım (tam kare collision, kapalı kapı)"""
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
+        self.collected = False
+        self.bounce_offset = 0
+        self.is_open = False
+
+
+ROTATE_SPIN_SPEED = 300.0  # Rotate sembolü dönme animasyonu (derece/saniye = 60 FPS'te frame başına 5°)
 
 
 class RotateSymbol:
@@ -300,13 +298,16 @@ class RotateSymbol:
 
         # Tek görsel (BombeliOk.png) yükle
         try:
-            base_sprite = pygame.image.load(asset_path("Assets/Sprites/BombeliOk.png")).convert_alpha()
             # Tek, ortalanmış görsel (kare içinde %60 boyut)
             target_w = int(self.size * 0.6)
             target_h = int(self.size * 0.6)
-            self.symbol_sprite = pygame.transform.smoothscale(base_sprite, (target_w, target_h))
+            self.symbol_sprite = get_sprite("Assets/Sprites/BombeliOk.png", (target_w, target_h), smooth=True, alpha=True)
+            # flip_lr için 180° döndürülmüş hali de önbellekten (her frame rotate yerine)
+            self.symbol_sprite_flipped = get_sprite("Assets/Sprites/BombeliOk.png", (target_w, target_h),
+                                                    rotation=180, smooth=True, alpha=True)
         except (FileNotFoundError, pygame.error) as e:
             self.symbol_sprite = None
+            self.symbol_sprite_flipped = None
             print(f"⚠️ BombeliOk.png yüklenemedi: {e}")
         
     def draw(self, screen, camera_offset=(0, 0)):
@@ -320,7 +321,7 @@ class RotateSymbol:
         # Tek görseli ortala ve çiz (arka plan doldurma yok, sadece ince kenarlık)
         if self.symbol_sprite:
             # Opsiyonel yön değişimi: flip_lr ise 180° döndür
-            sprite = pygame.transform.rotate(self.symbol_sprite, 180) if self.flip_lr else self.symbol_sprite
+            sprite = self.symbol_sprite_flipped if self.flip_lr else self.symbol_sprite
             sx = draw_x + (self.size - sprite.get_width()) // 2
             sy = draw_y + (self.size - sprite.get_height()) // 2
             screen.blit(sprite, (sx, sy))
@@ -347,27 +348,28 @@ class RotateSymbol:
         # Kenarlık
         pygame.draw.rect(screen, (0, 0, 0), (draw_x, draw_y, self.size, self.size), 1)
     
+    def get_dirty_rect(self, camera_offset=(0, 0)):
+        if self.consumed:
+            return None
+        return pygame.Rect(self.rect.x - camera_offset[0], self.rect.y - camera_offset[1], self.size, self.size)
+    
+    def reinit(self, x, y):
+        """Havuzdan tekrar kullanım (tüketilmemiş, animasyonsuz)"""
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
+        self.rotation_angle = 0
+        self.activated = False
+        self.flip_lr = False
+        self.consumed = False
+    
     def update(self, dt):
         """Animasyon güncellemesi"""
         if self.activated:
-            self.rotation_angle += 5  # Dönme animasyonu
+            self.rotation_angle += ROTATE_SPIN_SPEED * dt  # Dönme animasyonu (derece/saniye)
             if self.rotation_angle >= 90:
                 self.rotation_angle = 0
                 self.activated = False
-    
-    def activate(self, game_manager):
-        """
-        Döndürme sembolü tetiklendi
-        
-        Args:
-            game_manager: GameManager objesi
-        """
-        if not self.activated and not self.consumed:
-            self.activated = True
-            # Ok yönlerini tersle (üst sağ <-> sol, alt sol <-> sağ)
-            self.flip_lr = not self.flip_lr
-            print("🔄 Rotation symbol activated!")
-            # GameManager'a döndürme sinyali gönder (GameManager tetikler)
 
 
 # ============================================
@@ -379,8 +381,15 @@ class CollectibleFactory:
     Collectible objesi oluşturma fabrikası
     """
     
+    TYPES = {
+        TILE_STAR: Star,
+        TILE_KEY: Key,
+        TILE_DOOR: Door,
+        TILE_ROTATE: RotateSymbol
+    }
+    
     @staticmethod
-    def create_collectible(tile_type, x, y, size):
+    def create_collectible(tile_type, x, y, size, pool=None):
         """
         Tile tipine göre collectible oluştur
         
@@ -389,20 +398,14 @@ class CollectibleFactory:
             x (int): X pozisyonu
             y (int): Y pozisyonu
             size (int): Boyut
+            pool: PrefabPool (verilirse boştaki obje reinit ile tekrar kullanılır)
             
         Returns:
             Collectible: Oluşturulan obje veya None
         """
-        if tile_type == TILE_STAR:
-            return Star(x, y, size)
-        
-        elif tile_type == TILE_KEY:
-            return Key(x, y, size)
-        
-        elif tile_type == TILE_DOOR:
-            return Door(x, y, size)
-        
-        elif tile_type == TILE_ROTATE:
-            return RotateSymbol(x, y, size)
-        
-        return None
+        cls = CollectibleFactory.TYPES.get(tile_type)
+        if cls is None:
+            return None
+        if pool is not None:
+            return pool.acquire(cls, x, y, size)
+        return cls(x, y, size)
@@ -5,8 +5,17 @@ Grid objeleri (Unity GameObject/Prefab benzeri)
 import pygame
 import config
 from config import *
-from Scripts.Utils.Path import asset_path
 from Scripts.Utils.Constants import *
+from Scripts.Systems.SpriteCache import get_sprite
+from Scripts.Core import Rules
+
+# Ok.png varsayılan olarak sağa bakar; diğer yönler için döndürme açısı
+DIRECTION_SPRITE_ROTATION = {
+    DIR_RIGHT: 0,
+    DIR_LEFT: 180,
+    DIR_UP: 90,
+    DIR_DOWN: -90
+}
 
 # ============================================
 # BASE TILE CLASS
@@ -43,19 +52,15 @@ class Tile:
         # Kenar lık (ince)
         pygame.draw.rect(screen, (0, 0, 0), (draw_x, draw_y, self.size, self.size), 1)
     
-    def on_player_land(self, player):
-        """
-        Oyuncu bu tile'a bastığında çağrılır
-        (Unity OnTriggerEnter benzeri)
-        
-        Args:
-            player: Player objesi
-        """
-        pass
-    
     def update(self, dt):
         """Frame güncellemesi (Unity Update benzeri)"""
         pass
+    
+    def reinit(self, x, y):
+        """Havuzdan (PrefabPool) tekrar kullanım: sadece konum (sprite korunur)"""
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
 
 
 # ============================================
@@ -81,10 +86,9 @@ class DamageTile(Tile):
         self.color = DAMAGE_TILE_COLOR
         self.stripe_spacing = 10  # Çizgi aralığı
         
-        # Sprite yükle
+        # Sprite yükle (paylaşılan önbellekten)
         try:
-            self.sprite = pygame.image.load(asset_path("Assets/Sprites/Engel.png"))
-            self.sprite = pygame.transform.scale(self.sprite, (size, size))
+            self.sprite = get_sprite("Assets/Sprites/Engel.png", (size, size))
         except (FileNotFoundError, pygame.error) as e:
             self.sprite = None
             print(f"⚠️ Engel.png yüklenemedi: {e}")
@@ -103,12 +107,6 @@ class DamageTile(Tile):
                 pygame.draw.line(screen, DAMAGE_STRIPE_COLOR, 
                                (draw_x + i, draw_y), 
                                (draw_x + i, draw_y + self.size), 1)
-    
-    def on_player_land(self, player):
-        """Can götür!"""
-        alive = player.resource_manager.take_hit("Damage tile")
-        if not alive:
-            print("💀 Player died on damage tile!")
 
 
 class PushTriangle(Tile):
@@ -125,19 +123,23 @@ class PushTriangle(Tile):
         self.is_solid = True
         
         # Sprite yükle ve yöne göre döndür (BombeliOk.png artık Ok.png için ayrıldı)
+        self.refresh_sprite()
+    
+    def reinit(self, x, y, direction=None):
+        """Havuzdan tekrar kullanım; yön değiştiyse sprite önbellekten yenilenir"""
+        super().reinit(x, y)
+        if direction is not None and direction != self.direction:
+            self.direction = direction
+            self.refresh_sprite()
+    
+    def refresh_sprite(self):
+        """Yöne uygun sprite'ı önbellekten al (rotasyon sonrası da çağrılır)"""
         try:
-            base_sprite = pygame.image.load(asset_path("Assets/Sprites/Ok.png")).convert_alpha()
-            base_sprite = pygame.transform.smoothscale(base_sprite, (size, size))
-            
-            # Yöne göre döndür
-            if direction == DIR_RIGHT:
-                self.sprite = base_sprite  # Varsayılan sağa baksın
-            elif direction == DIR_LEFT:
-                self.sprite = pygame.transform.rotate(base_sprite, 180)
-            elif direction == DIR_UP:
-                self.sprite = pygame.transform.rotate(base_sprite, 90)
-            elif direction == DIR_DOWN:
-                self.sprite = pygame.transform.rotate(base_sprite, -90)
+            self.sprite = get_sprite(
+                "Assets/Sprites/Ok.png", (self.size, self.size),
+                rotation=DIRECTION_SPRITE_ROTATION.get(self.direction, 0),
+                smooth=True, alpha=True
+            )
         except (FileNotFoundError, pygame.error) as e:
             self.sprite = None
             print(f"⚠️ Ok.png yüklenemedi: {e}")
@@ -196,63 +198,14 @@ class PushTriangle(Tile):
                 (cx, cy + half)
             ]
     
-    def on_player_land(self, player):
-        """Oyuncuyu ok ucunun baktığı yönün 1 önüne anında yerleştir; temas can götürür."""
-        if self.direction is None:
-            return
-        # Tile grid koordinatı
-        tile_grid_x = self.x // GRID_SIZE
-        tile_grid_y = self.y // GRID_SIZE
-        # Level 1, Row B, Column 2 (2,1) ok'u SADECE hasarsız
-        # Level 2 ve diğer tüm oklar daima hasar verir
-        current_level = getattr(player, 'current_level', 1)
-        is_level1_safe_arrow = (current_level == 1 and tile_grid_x == 2 and tile_grid_y == 1)
-        
-        # İtme okuna basmak 1 can düşürür (sadece Level 1 row B hariç)
-        if not is_level1_safe_arrow and getattr(player, 'push_damage_enabled', True):
-            alive = player.resource_manager.take_hit("Push arrow")
-            if not alive:
-                return
-        dir_map = {
-            DIR_RIGHT: (1, 0),
-            DIR_LEFT: (-1, 0),
-            DIR_UP: (0, -1),
-            DIR_DOWN: (0, 1)
-        }
-        dx, dy = dir_map.get(self.direction, (0, 0))
-        # Bu üçgenin grid koordinatı
-        gx = self.x // GRID_SIZE
-        gy = self.y // GRID_SIZE
-        target_gx = gx + dx
-        target_gy = gy + dy
-        # Sınırlar içinde tut
-        target_gx = max(0, min(target_gx, GRID_COLS - 1))
-        target_gy = max(0, min(target_gy, GRID_ROWS - 1))
-        # Oyuncuyu anında taşı
-        player.grid_x = target_gx
-        player.grid_y = target_gy
-        player.x = target_gx * GRID_SIZE
-        player.y = target_gy * GRID_SIZE
-        player.rect.x = player.x
-        player.rect.y = player.y
-        # Oyuncu itildi bayrağını set et (hedef tile'ın hasarını almayacak)
-        player.just_pushed = True
-        print(f"🏹 Snapped player in front of {self.direction} arrow to ({target_gx},{target_gy})")
-    
     def reverse_direction(self):
         """
         Yönü tersine çevir (Rotation için)
         """
         if self.direction is None:
             return
-            
-        reverse_map = {
-            DIR_RIGHT: DIR_LEFT,
-            DIR_LEFT: DIR_RIGHT,
-            DIR_UP: DIR_DOWN,
-            DIR_DOWN: DIR_UP
-        }
-        self.direction = reverse_map.get(self.direction, self.direction)
+        
+        self.direction = Rules.REVERSE_DIRECTION.get(self.direction, self.direction)
 
 
 # ============================================
@@ -266,7 +219,7 @@ class TileFactory:
     """
     
     @staticmethod
-    def create_tile(tile_type, x, y, size):
+    def create_tile(tile_type, x, y, size, pool=None):
         """
         Tile tipine göre obje oluştur
         
@@ -275,27 +228,30 @@ class TileFactory:
             x (int): X pozisyonu
             y (int): Y pozisyonu
             size (int): Tile boyutu
+            pool: PrefabPool (verilirse boştaki obje reinit ile tekrar kullanılır)
             
         Returns:
             Tile: Oluşturulan tile objesi veya None
         """
+        create = pool.acquire if pool is not None else (lambda cls, *args: cls(*args))
+        
         if tile_type == TILE_EMPTY:
-            return SafeTile(x, y, size)
+            return create(SafeTile, x, y, size)
         
         elif tile_type == TILE_DAMAGE:
-            return DamageTile(x, y, size)
+            return create(DamageTile, x, y, size)
         
         elif tile_type == TILE_PUSH_RIGHT:
-            return PushTriangle(x, y, size, DIR_RIGHT)
+            return create(PushTriangle, x, y, size, DIR_RIGHT)
         
         elif tile_type == TILE_PUSH_LEFT:
-            return PushTriangle(x, y, size, DIR_LEFT)
+            return create(PushTriangle, x, y, size, DIR_LEFT)
         
         elif tile_type == TILE_PUSH_UP:
-            return PushTriangle(x, y, size, DIR_UP)
+            return create(PushTriangle, x, y, size, DIR_UP)
         
         elif tile_type == TILE_PUSH_DOWN:
-            return PushTriangle(x, y, size, DIR_DOWN)
+            return create(PushTriangle, x, y, size, DIR_DOWN)
         
         # Başlangıç, kapı, anahtar, yıldız, döndürme sembolü için
         # ayrı objeler Entities.Collectible içinde oluşturuluyor.
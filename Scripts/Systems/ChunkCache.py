@@ -0,0 +1,146 @@
+"""
+ReVerse - Chunk Cache
+Statik tile katmanı için parça (chunk) önbelleği.
+Level, CHUNK_CELLS x CHUNK_CELLS hücrelik parçalara bölünür; her parça ilk
+göründüğünde kendi surface'ine bir kez çizilir ve bayt bütçeli LRU'da tutulur.
+Frame maliyeti görünür tile sayısıyla değil görünür parça sayısıyla orantılıdır.
+"""
+import pygame
+from collections import OrderedDict
+from config import CHUNK_CELLS, CHUNK_CACHE_BUDGET
+
+
+class ChunkCache:
+    """
+    (layout, cx, cy) -> pre-render surface.
+    layout: Tile düzeninin kimliği (LevelLoader her level örneğine ayrı değer verir)
+    """
+
+    def __init__(self, cell_size, chunk_cells=CHUNK_CELLS, budget_bytes=CHUNK_CACHE_BUDGET):
+        """
+        Args:
+            cell_size (int): Hücre boyutu (piksel)
+            chunk_cells (int): Parça kenarı (hücre)
+            budget_bytes (int): Surface'lerin toplam bellek sınırı (görünür parçalar her zaman tutulur)
+        """
+        self.cell_size = cell_size
+        self.chunk_cells = chunk_cells
+        self.chunk_px = cell_size * chunk_cells
+        self.budget_bytes = budget_bytes
+        self._chunks = OrderedDict()  # (layout, cx, cy) -> Surface
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def draw(self, screen, camera_offset, layout, bounds, paint):
+        """
+        Görünür parçaları screen'e çiz (eksik olanları paint ile oluştur)
+
+        Args:
+            screen: Hedef surface (görüş alanı boyutunda)
+            camera_offset: Kamera kayması
+            layout: Tile düzeni kimliği
+            bounds (tuple): Level boyutu (piksel)
+            paint: paint(surface, world_rect) parçanın içeriğini çizer
+        """
+        cam_x, cam_y = camera_offset
+        view_w, view_h = screen.get_size()
+        level_w, level_h = bounds
+        size = self.chunk_px
+        cx0, cy0 = max(0, cam_x // size), max(0, cam_y // size)
+        cx1 = min((level_w - 1) // size, (cam_x + view_w - 1) // size)
+        cy1 = min((level_h - 1) // size, (cam_y + view_h - 1) // size)
+
+        visible = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                key = (layout, cx, cy)
+                chunk = self._chunks.get(key)
+                if chunk is None:
+                    self.misses += 1
+                    world = pygame.Rect(cx * size, cy * size,
+                                        min(size, level_w - cx * size), min(size, level_h - cy * size))
+                    chunk = self._render(world, paint)
+                    self._chunks[key] = chunk
+                    self.bytes += self._size_of(chunk)
+                else:
+                    self._chunks.move_to_end(key)
+                    self.hits += 1
+                visible.append(key)
+                screen.blit(chunk, (cx * size - cam_x, cy * size - cam_y))
+        self._evict(len(visible))
+
+    def _render(self, world, paint):
+        chunk = pygame.Surface(world.size)
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        paint(chunk, world)
+        return chunk
+
+    @staticmethod
+    def _size_of(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _evict(self, keep):
+        """Bütçe aşıldıysa en eski parçaları at (son kullanılan keep parça korunur)"""
+        while self.bytes > self.budget_bytes and len(self._chunks) > keep:
+            _, chunk = self._chunks.popitem(last=False)
+            self.bytes -= self._size_of(chunk)
+            self.evictions += 1
+
+    def invalidate_cells(self, layout, cells):
+        """
+        Hücreleri içeren parçaları at (tile değişti: ok yönü, konum)
+
+        Args:
+            layout: Tile düzeni kimliği
+            cells (iterable): (gx, gy) hücreleri
+        """
+        for gx, gy in cells:
+            chunk = self._chunks.pop((layout, gx // self.chunk_cells, gy // self.chunk_cells), None)
+            if chunk is not None:
+                self.bytes -= self._size_of(chunk)
+
+    def invalidate_layout(self, layout):
+        """Bir tile düzeninin tüm parçalarını at"""
+        for key in [key for key in self._chunks if key[0] == layout]:
+            self.bytes -= self._size_of(self._chunks.pop(key))
+
+    def clear(self):
+        self._chunks.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return (f"ChunkCache {len(self._chunks)} chunks | {self.bytes // 1024} KB / "
+                f"{self.budget_bytes // 1024} KB | Hit {self.hits}/{self.misses} | Evicted {self.evictions}")
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    print("=== ChunkCache Test ===\n")
+    painted = []
+
+    def paint(surface, world):
+        painted.append(world.topleft)
+        surface.fill(((world.x // 8) % 256, (world.y // 8) % 256, 0))
+
+    cache = ChunkCache(cell_size=8, chunk_cells=4, budget_bytes=4 * 32 * 32 * 4)
+    view = pygame.Surface((48, 40))
+    cache.draw(view, (0, 0), "level", (256, 256), paint)
+    print(f"First frame painted {len(painted)} chunks (expected 4)")
+    cache.draw(view, (0, 0), "level", (256, 256), paint)
+    print(f"Static camera repaints: {len(painted) - 4} (expected 0)")
+    cache.invalidate_cells("level", [(5, 1)])
+    cache.draw(view, (0, 0), "level", (256, 256), paint)
+    print(f"After invalidating one cell: repainted {painted[4:]} (expected [(32, 0)])")
+    cache.draw(view, (128, 128), "level", (256, 256), paint)
+    print(f"Scrolled: {cache}")
+    print(f"Within budget: {'✅' if cache.bytes <= cache.budget_bytes else '❌'}")
+    print("\n=== Test Complete ===")
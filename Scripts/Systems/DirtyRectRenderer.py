@@ -0,0 +1,136 @@
+"""
+ReVerse - Dirty Rect Renderer
+Sadece değişen ekran bölgelerini pencereye gönderir (pygame.display.update)
+"""
+import pygame
+
+class FrameStats:
+    """
+    Frame başına pencereye gönderilen piksel istatistikleri
+    Debug panelde gösterilir
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.full_frames = 0
+        self.last_pixels = 0
+        self.last_rects = 0
+        self.total_pixels = 0
+        self.avg_pixels = 0.0  # Üssel hareketli ortalama
+
+    def record(self, pixels, rect_count, full):
+        """Bir frame'in sunum maliyetini kaydet"""
+        self.frames += 1
+        if full:
+            self.full_frames += 1
+        self.last_pixels = pixels
+        self.last_rects = rect_count
+        self.total_pixels += pixels
+        if self.frames == 1:
+            self.avg_pixels = float(pixels)
+        else:
+            self.avg_pixels += (pixels - self.avg_pixels) * 0.05
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return f"Px: {self.last_pixels} | Rects: {self.last_rects} | Full: {self.full_frames}/{self.frames}"
+
+
+class DirtyRectRenderer:
+    """
+    Entity, HUD ve overlay'lerin bildirdiği değişen bölgeleri toplar
+    ve frame sonunda yalnızca onları günceller.
+
+    Tam ekran flip'e düşülen durumlar: mark_full() (resize, state değişimi,
+    level yükleme vb.) veya ilk frame.
+    """
+
+    def __init__(self):
+        self._rects = []
+        self._full = True
+        self._tracked = {}  # key -> (rect, token)
+        self.stats = FrameStats()
+
+    def mark(self, rect):
+        """
+        Ekran koordinatında bir bölgeyi kirli olarak işaretle
+
+        Args:
+            rect: pygame.Rect veya (x, y, w, h)
+        """
+        if rect is None:
+            return
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._rects.append(rect)
+
+    def mark_full(self):
+        """Bu frame tüm pencereyi gönder ve takip edilen bölgeleri unut"""
+        self._full = True
+        self._tracked.clear()
+
+    def track(self, key, rect, token=None):
+        """
+        Bir widget'ın bu frame'deki bölgesini bildir. Bölge veya içerik
+        (token) önceki frame'den farklıysa eski ve yeni bölge işaretlenir.
+
+        Args:
+            key: Widget kimliği
+            rect: Ekran koordinatında bölge (çizilmediyse None)
+            token: İçerik imzası (ör. timer metni)
+        """
+        rect = pygame.Rect(rect) if rect is not None else None
+        previous = self._tracked.get(key)
+        current = (rect, token)
+        if previous == current:
+            return
+        if previous is not None:
+            self.mark(previous[0])
+        self.mark(rect)
+        self._tracked[key] = current
+
+    def present(self, screen):
+        """
+        Frame'i pencereye gönder (tam flip veya kirli bölgeler)
+
+        Args:
+            screen: Display surface
+        """
+        sw, sh = screen.get_size()
+        if self._full:
+            pygame.display.flip()
+            self.stats.record(sw * sh, 1, True)
+        else:
+            rects = self._merge(self._clip(self._rects, screen.get_rect()))
+            if rects:
+                pygame.display.update(rects)
+            pixels = sum(r.width * r.height for r in rects)
+            self.stats.record(pixels, len(rects), False)
+        self._rects = []
+        self._full = False
+
+    def _clip(self, rects, bounds):
+        """Ekran dışına taşan bölgeleri kırp"""
+        clipped = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width > 0 and rect.height > 0:
+                clipped.append(rect)
+        return clipped
+
+    def _merge(self, rects):
+        """Çakışan bölgeleri birleştir (aynı pikseli iki kez göndermemek için)"""
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            changed = True
+            while changed:
+                changed = False
+                for other in merged:
+                    if rect.colliderect(other):
+                        rect.union_ip(other)
+                        merged.remove(other)
+                        changed = True
+                        break
+            merged.append(rect)
+        return merged
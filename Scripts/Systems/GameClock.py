@@ -0,0 +1,127 @@
+"""
+ReVerse - Game Clock
+Enjekte edilebilir oyun saati (pygame.time.get_ticks yerine).
+Gerçek zamanlı mod perf_counter'ı izler (ölçek + duraklatma);
+manuel modda zaman sadece step() ile ilerler (sabit adımlı simülasyon, headless).
+"""
+import time
+
+
+class GameClock:
+    """
+    Oyun zamanı (saniye, float)
+
+    Gerçek zamanlı: now() = duraklatılmamış geçen perf_counter süresi x scale
+    Manuel: now() = step() ile eklenen süreler toplamı
+    """
+
+    def __init__(self, scale=1.0, manual=False, source=time.perf_counter):
+        """
+        Args:
+            scale (float): Zaman ölçeği (2.0 = iki kat hızlı)
+            manual (bool): True ise zaman sadece step() ile ilerler
+            source: Gerçek zaman kaynağı (saniye döndüren fonksiyon)
+        """
+        self.manual = manual
+        self._scale = scale
+        self._source = source
+        self._time = 0.0
+        self._last = source()
+        self._paused = False
+
+    def _sync(self):
+        """Gerçek zamanlı modda son okumadan beri geçen süreyi ekle"""
+        current = self._source()
+        if not self.manual and not self._paused:
+            self._time += (current - self._last) * self._scale
+        self._last = current
+
+    def now(self):
+        """
+        Returns:
+            float: Oyun zamanı (saniye)
+        """
+        self._sync()
+        return self._time
+
+    def step(self, dt):
+        """
+        Zamanı elle ilerlet (duraklatılmışken de çalışır: kare kare ilerleme)
+
+        Args:
+            dt (float): Eklenecek süre (saniye, ölçeksiz)
+        """
+        self._sync()
+        self._time += dt
+
+    # ============================================
+    # DURAKLATMA / ÖLÇEK (Pause / Scale)
+    # ============================================
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def pause(self):
+        self._sync()
+        self._paused = True
+
+    def resume(self):
+        self._sync()
+        self._paused = False
+
+    def toggle_pause(self):
+        """
+        Returns:
+            bool: Yeni duraklatma durumu
+        """
+        if self._paused:
+            self.resume()
+        else:
+            self.pause()
+        return self._paused
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self._sync()  # Eski ölçekle geçen süre önce eklenir
+        self._scale = value
+
+    def reset(self, value=0.0):
+        """Zamanı sıfırla (duraklatma ve ölçek korunur)"""
+        self._sync()
+        self._time = value
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        mode = "manual" if self.manual else f"x{self._scale:g}"
+        return f"GameClock {self.now():.3f}s ({mode}{', paused' if self._paused else ''})"
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    print("=== GameClock Test ===\n")
+    fake = [0.0]
+    clock = GameClock(scale=2.0, source=lambda: fake[0])
+    fake[0] = 1.0
+    print(f"1s real at x2: {clock.now():.2f} (expected 2.00)")
+    clock.pause()
+    fake[0] = 5.0
+    print(f"Paused 4s: {clock.now():.2f} (expected 2.00)")
+    clock.step(0.5)
+    print(f"Manual step while paused: {clock.now():.2f} (expected 2.50)")
+    clock.resume()
+    clock.scale = 1.0
+    fake[0] = 6.0
+    print(f"Resumed 1s at x1: {clock.now():.2f} (expected 3.50)")
+
+    sim = GameClock(manual=True)
+    for _ in range(60):
+        sim.step(1.0 / 60)
+    print(f"\nManual 60 ticks: {sim}")
+    print("\n=== Test Complete ===")
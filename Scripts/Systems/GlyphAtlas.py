@@ -0,0 +1,71 @@
+"""
+ReVerse - Glyph Atlas
+Timer rakamları için sabit genişlikli glyph atlası (gölge önceden birleştirilmiş)
+"""
+import pygame
+
+class GlyphAtlas:
+    """
+    Rakamlar, ':' ve '.' için tek bir SRCALPHA atlas surface'i.
+    Her karakter eşit genişlikte bir hücrede ortalanır ve gölgesi hücreye
+    önceden çizilir; metin, hücrelerin area blit'i ile oluşturulur.
+    Böylece her frame değişen timer için font.render ve Surface tahsisi olmaz.
+    """
+
+    CHARS = "0123456789:.-"
+
+    def __init__(self, font, color, shadow_color=(0, 0, 0), shadow_offset=(1, 1), chars=CHARS):
+        self.chars = chars
+        glyphs = [font.render(ch, True, color) for ch in chars]
+        shadows = [font.render(ch, True, shadow_color) for ch in chars]
+        dx, dy = shadow_offset
+
+        # Sabit hücre boyutu: en geniş glyph + gölge kayması
+        self.glyph_width = max(g.get_width() for g in glyphs)
+        self.glyph_height = max(g.get_height() for g in glyphs)
+        self.cell_width = self.glyph_width + dx
+        self.cell_height = self.glyph_height + dy
+
+        self.surface = pygame.Surface((self.cell_width * len(chars), self.cell_height), pygame.SRCALPHA)
+        self._areas = {}
+        for i, (ch, glyph, shadow) in enumerate(zip(chars, glyphs, shadows)):
+            cell_x = i * self.cell_width
+            gx = cell_x + (self.glyph_width - glyph.get_width()) // 2
+            self.surface.blit(shadow, (gx + dx, dy))
+            self.surface.blit(glyph, (gx, 0))
+            self._areas[ch] = pygame.Rect(cell_x, 0, self.cell_width, self.cell_height)
+
+    def text_size(self, text):
+        """
+        Atlas ile çizilecek metnin boyutu (gölge dahil)
+
+        Returns:
+            tuple: (genişlik, yükseklik)
+        """
+        if not text:
+            return 0, self.cell_height
+        # Hücreler glyph_width adımıyla dizilir; son hücrenin gölge payı eklenir
+        return self.glyph_width * len(text) + (self.cell_width - self.glyph_width), self.cell_height
+
+    def draw(self, target, text, pos):
+        """
+        Metni hedef surface'e glyph blit'leriyle çiz
+
+        Args:
+            target: Hedef surface
+            text (str): Sadece atlas karakterlerinden oluşan metin
+            pos (tuple): Sol üst köşe
+        """
+        x, y = pos
+        atlas = self.surface
+        areas = self._areas
+        step = self.glyph_width
+        for ch in text:
+            area = areas.get(ch)
+            if area is not None:
+                target.blit(atlas, (x, y), area)
+            x += step
+
+    def supports(self, text):
+        """Metnin tüm karakterleri atlasta var mı"""
+        return all(ch in self._areas for ch in text)
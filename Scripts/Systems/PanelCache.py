@@ -0,0 +1,42 @@
+"""
+ReVerse - Panel Cache
+Bir kez render edilip tekrar kullanılan overlay panelleri (retained UI)
+"""
+
+class RetainedPanel:
+    """
+    Overlay panelini (debug, yardım, kazanma, game over) bir kez oluşturur;
+    içerik anahtarı veya boyut değişmedikçe aynı Surface'i döndürür.
+    """
+
+    def __init__(self, builder):
+        """
+        Args:
+            builder: (size, content) -> pygame.Surface üreten fonksiyon
+        """
+        self._builder = builder
+        self._key = None
+        self.surface = None
+        self.builds = 0
+
+    def get(self, size, content=None):
+        """
+        Paneli döndür, boyut veya içerik değiştiyse yeniden oluştur
+
+        Args:
+            size (tuple): Panel boyutu (w, h)
+            content: Hashlenebilir içerik imzası
+
+        Returns:
+            pygame.Surface
+        """
+        key = (tuple(size), content)
+        if key != self._key or self.surface is None:
+            self.surface = self._builder(tuple(size), content)
+            self._key = key
+            self.builds += 1
+        return self.surface
+
+    def invalidate(self):
+        """Bir sonraki get() çağrısında yeniden oluşturmaya zorla"""
+        self._key = None
@@ -0,0 +1,100 @@
+"""
+ReVerse - Prefab Pool
+Entity nesne havuzu (Unity object pooling benzeri).
+Level ısınmasında (warm-up) oluşturulan Star, Key, Door, RotateSymbol ve tile
+objeleri serbest bırakılınca saklanır; acquire() onları reinit(x, y) ile
+yeniden kullanır, böylece oyun ortasında spawn / reset constructor, disk
+okuması veya sprite ölçekleme yapmaz.
+"""
+
+
+class PrefabPool:
+    """
+    (sınıf, boyut) başına serbest obje listeleri.
+    Havuza giren objeler reinit(x, y, *args) metodunu sağlamalı.
+    """
+
+    def __init__(self):
+        self._free = {}   # (sınıf, boyut) -> [obje, ...]
+        self.created = 0  # Constructor ile oluşturulan
+        self.reused = 0   # Havuzdan reinit ile verilen
+
+    def acquire(self, cls, x, y, size, *args):
+        """
+        Boştaki objeyi yeniden kullan, yoksa oluştur
+
+        Args:
+            cls: Entity sınıfı (Star, Key, PushTriangle, ...)
+            x, y (int): Konum (piksel)
+            size (int): Boyut (sprite ölçeği buna bağlı)
+            args: Sınıfa özel ek parametreler (ör. PushTriangle yönü)
+
+        Returns:
+            Entity objesi
+        """
+        free = self._free.get((cls, size))
+        if free:
+            obj = free.pop()
+            obj.reinit(x, y, *args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return cls(x, y, size, *args)
+
+    def release(self, obj):
+        """Objeyi havuza geri ver (artık sahnede kullanılmamalı)"""
+        self._free.setdefault((obj.__class__, obj.size), []).append(obj)
+
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+
+    def warm(self, cls, size, count, *args):
+        """
+        Havuzda en az count adet hazır obje olsun (level yüklenirken çağrılır)
+
+        Args:
+            cls: Entity sınıfı
+            size (int): Boyut
+            count (int): Hedef boş obje sayısı
+        """
+        free = self._free.setdefault((cls, size), [])
+        while len(free) < count:
+            free.append(cls(0, 0, size, *args))
+            self.created += 1
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        free = sum(len(objects) for objects in self._free.values())
+        return f"PrefabPool | Free: {free} | Created: {self.created} | Reused: {self.reused}"
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from Scripts.Entities.Collectible import Key, Star
+    from Scripts.Entities.Tile import PushTriangle
+
+    print("=== PrefabPool Test ===\n")
+    pool = PrefabPool()
+    pool.warm(Key, 64, 1)
+    key = pool.acquire(Key, 128, 64, 64)
+    print(f"Warm key reused: {'✅' if pool.reused == 1 and key.x == 128 and not key.collected else '❌'}")
+    key.collected = True
+    pool.release(key)
+    again = pool.acquire(Key, 0, 0, 64)
+    print(f"Released key reinit: {'✅' if again is key and not again.collected else '❌'}")
+
+    arrow = pool.acquire(PushTriangle, 0, 0, 64, "right")
+    pool.release(arrow)
+    flipped = pool.acquire(PushTriangle, 64, 0, 64, "left")
+    print(f"Arrow direction reinit: {'✅' if flipped is arrow and flipped.direction == 'left' else '❌'}")
+    pool.acquire(Star, 0, 0, 32)
+    print(f"\n{pool}")
+    print("\n=== Test Complete ===")
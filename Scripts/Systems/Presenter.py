@@ -0,0 +1,119 @@
+"""
+ReVerse - Presenter
+Render surface'i pencereye ölçekleyen sunum katmanı (kalıcı hedef buffer ile)
+"""
+import pygame
+
+PRESENT_STRETCH = "stretch"      # Tüm alanı doldur (en-boy oranı bozulabilir)
+PRESENT_INTEGER = "integer"      # Tam sayı katı ölçek, ortalanmış (piksel-mükemmel)
+PRESENT_LETTERBOX = "letterbox"  # En-boy oranını koru, kenarlarda siyah bant
+
+PRESENT_MODES = (PRESENT_STRETCH, PRESENT_INTEGER, PRESENT_LETTERBOX)
+
+
+class Presenter:
+    """
+    Yerleşim sadece relayout() ile (resize, F10, F11, mod değişimi)
+    hesaplanır. Her frame render surface, kalıcı hedef surface'e
+    pygame.transform.scale(..., dest_surface) ile ölçeklenir; frame başına
+    pencere boyutunda yeni Surface tahsis edilmez.
+    """
+
+    def __init__(self, mode=PRESENT_STRETCH):
+        self.mode = mode if mode in PRESENT_MODES else PRESENT_STRETCH
+        self.area_rect = pygame.Rect(0, 0, 0, 0)   # Haritaya ayrılan ekran alanı
+        self.dest_rect = pygame.Rect(0, 0, 0, 0)   # Ölçeklenmiş haritanın ekrandaki yeri
+        self.bar_rects = []                        # Letterbox/integer kenar bantları
+        self.source_size = (0, 0)
+        self._dest = None
+        self.relayout_count = 0
+
+    def relayout(self, area_rect, source_size):
+        """
+        Hedef boyutunu ve konumunu yeniden hesapla
+
+        Args:
+            area_rect: Haritaya ayrılan ekran alanı (x, y, w, h)
+            source_size: Render surface boyutu (w, h)
+        """
+        self.area_rect = pygame.Rect(area_rect)
+        self.source_size = tuple(source_size)
+        ax, ay, aw, ah = self.area_rect
+        src_w, src_h = self.source_size
+        self.relayout_count += 1
+
+        if aw <= 0 or ah <= 0 or src_w <= 0 or src_h <= 0:
+            self.dest_rect = pygame.Rect(ax, ay, 0, 0)
+            self.bar_rects = []
+            self._dest = None
+            return
+
+        if self.mode == PRESENT_STRETCH:
+            w, h = aw, ah
+        else:
+            fit = min(aw / src_w, ah / src_h)
+            if self.mode == PRESENT_INTEGER and fit >= 1:
+                fit = int(fit)
+            w = max(1, int(src_w * fit))
+            h = max(1, int(src_h * fit))
+
+        self.dest_rect = pygame.Rect(ax + (aw - w) // 2, ay + (ah - h) // 2, w, h)
+        self.bar_rects = self._compute_bars()
+
+        if self._dest is None or self._dest.get_size() != (w, h):
+            self._dest = pygame.Surface((w, h)).convert()
+
+    def _compute_bars(self):
+        """Harita alanında hedefin kaplamadığı bölgeler"""
+        area, dest = self.area_rect, self.dest_rect
+        bars = [
+            pygame.Rect(area.x, area.y, area.width, dest.y - area.y),
+            pygame.Rect(area.x, dest.bottom, area.width, area.bottom - dest.bottom),
+            pygame.Rect(area.x, dest.y, dest.x - area.x, dest.height),
+            pygame.Rect(dest.right, dest.y, area.right - dest.right, dest.height)
+        ]
+        return [bar for bar in bars if bar.width > 0 and bar.height > 0]
+
+    def present(self, screen, source):
+        """
+        Render surface'i ölçekleyip ekrana çiz
+
+        Args:
+            screen: Display surface
+            source: Render surface
+        """
+        if self._dest is None:
+            return
+        for bar in self.bar_rects:
+            screen.fill((0, 0, 0), bar)
+        if self.dest_rect.size == source.get_size():
+            screen.blit(source, self.dest_rect.topleft)
+            return
+        pygame.transform.scale(source, self.dest_rect.size, self._dest)
+        screen.blit(self._dest, self.dest_rect.topleft)
+
+    def map_rect(self, rect):
+        """
+        Render surface koordinatındaki bölgeyi ekran koordinatına çevir
+
+        Args:
+            rect: pygame.Rect (render surface koordinatı)
+
+        Returns:
+            pygame.Rect: Ekran koordinatı (ölçekleme yuvarlaması için 1 piksel pay ile)
+        """
+        src_w, src_h = self.source_size
+        if src_w <= 0 or src_h <= 0:
+            return None
+        sx = self.dest_rect.width / src_w
+        sy = self.dest_rect.height / src_h
+        return pygame.Rect(
+            self.dest_rect.x + int(rect.x * sx) - 1, self.dest_rect.y + int(rect.y * sy) - 1,
+            int(rect.width * sx) + 3, int(rect.height * sy) + 3
+        )
+
+    def cycle_mode(self):
+        """Sıradaki sunum moduna geç (relayout çağıran tarafın sorumluluğunda)"""
+        index = PRESENT_MODES.index(self.mode)
+        self.mode = PRESENT_MODES[(index + 1) % len(PRESENT_MODES)]
+        return self.mode
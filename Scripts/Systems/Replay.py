@@ -0,0 +1,280 @@
+"""
+ReVerse - Replay
+Oturum kaydı: (tick, hamle) çiftlerinin kompakt ikili akışı.
+GameManager kabul edilen her hamleyi kaydeder; aynı tick'lerde geri beslenen
+hamleler sabit adımlı (1/FPS) oyunu birebir tekrar oynatır.
+
+Dosya formatı:
+    başlık : MAGIC (4) | sürüm (1) | bayraklar (1) | config hash (8) | level (varint)
+    kayıt  : varint((tick farkı << 3) | hamle kodu), dosya sonuna kadar
+    son    : REPLAY_END kaydı (son tick); yarım kalmış dosyalar da okunur
+"""
+import hashlib
+import os
+import time
+import config
+from Scripts.Utils.Constants import *
+from Scripts.Core import Rules
+from Levels.LevelData import LevelData
+
+MAGIC = b"RVRP"
+VERSION = 1
+
+# Hamle kodları (3 bit)
+ACTION_RESTART = "restart"  # R / B tuşu (Level 1'den yeniden başla)
+ACTION_GOD = "god"          # G tuşu (god mode aç/kapat)
+REPLAY_END = "end"          # Kayıt sonu (oturumun son tick'i)
+
+ACTION_CODES = {
+    DIR_UP: 0,
+    DIR_DOWN: 1,
+    DIR_LEFT: 2,
+    DIR_RIGHT: 3,
+    "jump": 4,
+    ACTION_RESTART: 5,
+    ACTION_GOD: 6,
+    REPLAY_END: 7
+}
+CODE_ACTIONS = {code: action for action, code in ACTION_CODES.items()}
+_CODE_BITS = 3
+
+FLAG_GOD_MODE = 1  # Kayıt başında god mode açıktı
+
+
+def config_hash():
+    """
+    Oynanışı etkileyen ayarların ve level içeriğinin özeti.
+    Farklı hash = kayıt bu build'de aynı sonucu vermeyebilir.
+    Restart Level 1'e, kapılar sıradaki level'a götürdüğü için her level
+    oynanabilir; level'lar decode edilmez, kaynağın ham içeriği hash'lenir
+    (bkz. LevelData.content_digest).
+
+    Returns:
+        bytes: 8 baytlık özet
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    settings = (config.GRID_COLS, config.GRID_ROWS, config.FPS, config.MAX_MAIN_LIVES,
+                config.JUMPS_PER_LIFE, config.STARS_TO_WIN, Rules.MOVE_SPEED, sorted(Rules.SAFE_ARROWS.items()))
+    digest.update(repr(settings).encode("utf-8"))
+    digest.update(LevelData.content_digest())
+    return digest.digest()
+
+
+# ============================================
+# VARINT (LEB128)
+# ============================================
+
+def encode_varint(value):
+    """Negatif olmayan tamsayıyı 7 bitlik gruplara kodla"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data, pos):
+    """
+    Returns:
+        tuple: (değer, yeni konum); veri yarım kaldıysa (None, pos)
+    """
+    value = 0
+    shift = 0
+    while pos < len(data):
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+    return None, pos
+
+
+# ============================================
+# KAYIT (Writer)
+# ============================================
+
+class ReplayWriter:
+    """
+    Kayıtları tamponlu dosyaya akıtır: record() sadece birkaç baytı
+    bellekteki buffer'a ekler, diske yazım buffer dolunca / flush'ta olur.
+    """
+
+    def __init__(self, path, level=1, god_mode=False, buffer_size=None):
+        """
+        Args:
+            path (str): Çıktı dosyası
+            level (int): Başlangıç level'ı
+            god_mode (bool): Kayıt başındaki god mode durumu
+            buffer_size (int): Dosya buffer'ı (bayt, None = config.REPLAY_BUFFER_SIZE)
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.last_tick = 0
+        self.records = 0
+        self._file = open(path, "wb", buffering=buffer_size or config.REPLAY_BUFFER_SIZE)
+        flags = FLAG_GOD_MODE if god_mode else 0
+        self._file.write(MAGIC + bytes((VERSION, flags)) + config_hash() + encode_varint(level))
+
+    @classmethod
+    def new_session(cls, folder=None, level=1, god_mode=False):
+        """Zaman damgalı yeni kayıt dosyası aç (replays/session_YYYYmmdd_HHMMSS.rvr)"""
+        folder = folder or config.REPLAY_DIR
+        name = time.strftime("session_%Y%m%d_%H%M%S") + config.REPLAY_EXTENSION
+        return cls(os.path.join(folder, name), level, god_mode)
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def record(self, tick, action):
+        """
+        Hamleyi kaydet
+
+        Args:
+            tick (int): Hamlenin işlendiği oyun tick'i (artan sırada)
+            action (str): ACTION_CODES anahtarı
+        """
+        delta = tick - self.last_tick
+        self._file.write(encode_varint((delta << _CODE_BITS) | ACTION_CODES[action]))
+        self.last_tick = tick
+        self.records += 1
+
+    def flush(self):
+        """Buffer'ı diske yaz (level sonu gibi seyrek anlarda)"""
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self, tick=None):
+        """
+        Son tick'i REPLAY_END olarak yaz ve dosyayı kapat
+
+        Args:
+            tick (int): Oturumun son tick'i (None = son kayıt)
+        """
+        if self._file.closed:
+            return
+        self.record(self.last_tick if tick is None else max(tick, self.last_tick), REPLAY_END)
+        self._file.close()
+
+
+# ============================================
+# OYNATMA (Reader)
+# ============================================
+
+class ReplayReader:
+    """Kayıt dosyasını okur ve tick sırasıyla hamleleri verir"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): .rvr dosyası
+
+        Raises:
+            ValueError: Dosya replay formatında değilse
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        header = len(MAGIC) + 2 + 8
+        if len(data) < header + 1 or data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"❌ Not a ReVerse replay: {path}")
+        version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version != VERSION:
+            raise ValueError(f"❌ Unsupported replay version {version}: {path}")
+
+        self.path = path
+        self.size = len(data)
+        self.god_mode = bool(flags & FLAG_GOD_MODE)
+        self.config_hash = data[len(MAGIC) + 2:header]
+        self.level, pos = decode_varint(data, header)
+        if self.level is None:
+            raise ValueError(f"❌ Truncated replay header: {path}")
+
+        self.events = []  # (tick, hamle) listesi, REPLAY_END hariç
+        self.end_tick = None
+        tick = 0
+        while pos < len(data):
+            value, pos = decode_varint(data, pos)
+            if value is None:
+                break  # Yarım kalmış son kayıt (oyun kapanırken kesilmiş)
+            tick += value >> _CODE_BITS
+            action = CODE_ACTIONS[value & ((1 << _CODE_BITS) - 1)]
+            if action == REPLAY_END:
+                self.end_tick = tick
+                break
+            self.events.append((tick, action))
+        if self.end_tick is None:
+            self.end_tick = self.events[-1][0] if self.events else 0
+        self._next = 0
+
+    @property
+    def matches_config(self):
+        """Kayıt bu build'in ayarları ve levelleriyle mi yapıldı"""
+        return self.config_hash == config_hash()
+
+    @property
+    def finished(self):
+        return self._next >= len(self.events)
+
+    def pop(self, tick):
+        """
+        Bu tick'e ait hamleleri sırayla döndür (her hamle bir kez)
+
+        Returns:
+            list: Hamle isimleri
+        """
+        actions = []
+        while self._next < len(self.events) and self.events[self._next][0] <= tick:
+            actions.append(self.events[self._next][1])
+            self._next += 1
+        return actions
+
+    def rewind(self):
+        """Baştan oynat"""
+        self._next = 0
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return (f"Replay {os.path.basename(self.path)} | Level {self.level} | "
+                f"{len(self.events)} actions | {self.end_tick} ticks | {self.size} bytes")
+
+
+class ReplayKeys:
+    """pygame.key.get_pressed() yerine: sadece kayıttaki hamlenin tuşu basılı"""
+
+    _KEYS = None
+
+    def __init__(self, action=None):
+        if ReplayKeys._KEYS is None:
+            import pygame
+            ReplayKeys._KEYS = {DIR_UP: pygame.K_UP, DIR_DOWN: pygame.K_DOWN, DIR_LEFT: pygame.K_LEFT,
+                                DIR_RIGHT: pygame.K_RIGHT, "jump": pygame.K_SPACE}
+        self._key = ReplayKeys._KEYS.get(action)
+
+    def __getitem__(self, key):
+        return key == self._key
+
+
+# ============================================
+# TEST CODE
+# ============================================
+if __name__ == "__main__":
+    import tempfile
+
+    print("=== Replay Test ===\n")
+    path = os.path.join(tempfile.mkdtemp(), "test" + config.REPLAY_EXTENSION)
+    moves = [(30, DIR_RIGHT), (45, "jump"), (52, DIR_DOWN), (200, ACTION_RESTART), (300, DIR_LEFT)]
+    writer = ReplayWriter(path, level=1)
+    for tick, action in moves:
+        writer.record(tick, action)
+    writer.close(tick=360)
+
+    reader = ReplayReader(path)
+    print(reader)
+    print(f"Round trip: {'✅' if reader.events == moves and reader.end_tick == 360 else '❌'}")
+    print(f"Config match: {'✅' if reader.matches_config else '❌'}")
+    print(f"Tick 50: {reader.pop(50)} | Tick 400: {reader.pop(400)}")
+    print("\n=== Test Complete ===")
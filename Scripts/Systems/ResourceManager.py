@@ -3,6 +3,7 @@ ReVerse - Resource Manager
 3x3 Can Kuralı Sistemi (Unity Component benzeri)
 """
 import config
+from Scripts.Core import Rules
 
 class ResourceManager:
     """
@@ -21,17 +22,16 @@ class ResourceManager:
             print(f"🛡️ GOD MODE: Hit ignored ({reason})")
             return True
 
-        self.main_lives -= 1
+        # Kural hesabı Rules'ta (headless GameState ile ortak)
+        self.main_lives, self.jump_tokens, alive = Rules.take_hit(self.main_lives, self.jump_tokens)
         print(f"💔 Hit: -1 life (reason: {reason}) → Lives: {self.main_lives}")
 
-        if self.main_lives > 0:
-            # Her can kaybında zıplama haklarını tazele
-            self.jump_tokens = config.JUMPS_PER_LIFE
+        if alive:
+            # Her can kaybında zıplama hakları tazelendi
             print(f"🔄 Jump tokens refilled: {self.jump_tokens}")
-            return True
         else:
             print("☠️ GAME OVER - No lives left!")
-            return False
+        return alive
         
     def use_jump(self):
         """
@@ -45,28 +45,24 @@ class ResourceManager:
             print("🛡️ GOD MODE: Jump ignored")
             return True
         
-        # Jump token kullan
-        self.jump_tokens -= 1
-        self.total_jumps_used += 1
-        
-        print(f"⚡ Jump used! Tokens left: {self.jump_tokens}")
+        # Jump token kullan (token biterse ana can azalır ve tokenlar yenilenir)
+        lives_before = self.main_lives
+        self.main_lives, self.jump_tokens, self.total_jumps_used, alive = Rules.use_jump(
+            self.main_lives, self.jump_tokens, self.total_jumps_used
+        )
         
-        # Token bitti mi?
-        if self.jump_tokens <= 0:
-            # Ana can azalt
-            self.main_lives -= 1
+        if self.main_lives == lives_before:
+            print(f"⚡ Jump used! Tokens left: {self.jump_tokens}")
+        else:
+            print(f"⚡ Jump used! Tokens left: 0")
             print(f"💔 Main life lost! Lives: {self.main_lives}")
-            
-            if self.main_lives > 0:
-                # Tokenları yenile
-                self.jump_tokens = config.JUMPS_PER_LIFE
+            if alive:
                 print(f"🔄 Jump tokens refilled: {self.jump_tokens}")
             else:
                 # Game Over
                 print("☠️ GAME OVER - No lives left!")
-                return False
         
-        return True
+        return alive
     
     def is_game_over(self):
         """
@@ -107,10 +103,23 @@ class ResourceManager:
         self.total_jumps_used = 0
         print("🔄 Resources reset!")
     
+    def load_state(self, main_lives, jump_tokens, total_jumps):
+        """
+        Değerleri oyun durumundan kopyala (GameManager her tur sonunda GameState'ten eşitler)
+        
+        Args:
+            main_lives (int): Ana can
+            jump_tokens (int): Zıplama hakkı
+            total_jumps (int): Toplam kullanılan zıplama
+        """
+        self.main_lives = main_lives
+        self.jump_tokens = jump_tokens
+        self.total_jumps_used = total_jumps
+    
     def add_life(self):
         """Bonus can ekle (ileride powerup için)"""
         if self.main_lives < config.MAX_MAIN_LIVES:
-            self.main_lives += 1
+            self.main_lives = Rules.add_life(self.main_lives)
             print(f"❤️ Life restored! Lives: {self.main_lives}")
     
     def __str__(self):
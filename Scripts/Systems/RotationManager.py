@@ -2,8 +2,6 @@
 ReVerse - Rotation Manager
 Dünya döndürme sistemi (90° rotasyon)
 """
-import pygame
-from Scripts.Utils.Path import asset_path
 from Scripts.Utils.Constants import *
 
 class RotationManager:
@@ -26,15 +24,19 @@ class RotationManager:
         
         print(f"🔄 Rotating world... (rotation count: {self.rotation_count})")
         
-        # 1. Grid boyutlarını al
-        from config import GRID_COLS, GRID_ROWS, GRID_SIZE
+        # 1. Grid boyutlarını al (aktif level'ın kendi boyutu)
+        grid_cols, grid_rows = level_loader.grid_width, level_loader.grid_height
+        grid_size = level_loader.grid_size
         
         # 2. Tüm PushTriangle'ların yönlerini döndür
-        for tile in level_loader.tiles:
-            if tile.__class__.__name__ == 'PushTriangle':
-                self._rotate_triangle_direction(tile, GRID_COLS, GRID_ROWS, GRID_SIZE)
+        triangles = [tile for tile in level_loader.tiles if tile.__class__.__name__ == 'PushTriangle']
+        for tile in triangles:
+            self._rotate_triangle_direction(tile, grid_cols, grid_rows, grid_size)
         
-        print(f"✅ Reversed {len([t for t in level_loader.tiles if t.__class__.__name__ == 'PushTriangle'])} push triangles")
+        # Ok sprite'ları değişti; sadece okları içeren statik katman parçalarını geçersiz kıl
+        level_loader.invalidate_tiles(triangles)
+        
+        print(f"✅ Reversed {len(triangles)} push triangles")
     
     def _rotate_triangle_direction(self, triangle, grid_cols, grid_rows, grid_size):
         """
@@ -58,20 +60,9 @@ class RotationManager:
         old_direction = triangle.direction
         triangle.direction = direction_map.get(old_direction, DIR_RIGHT)
         
-        # Sprite'ı yeni yöne göre döndür
-        try:
-            base_sprite = pygame.image.load(asset_path("Assets/Sprites/Ok.png"))
-            base_sprite = pygame.transform.smoothscale(base_sprite, (grid_size, grid_size))
-            if triangle.direction == DIR_RIGHT:
-                triangle.sprite = base_sprite
-            elif triangle.direction == DIR_LEFT:
-                triangle.sprite = pygame.transform.rotate(base_sprite, 180)
-            elif triangle.direction == DIR_UP:
-                triangle.sprite = pygame.transform.rotate(base_sprite, 90)
-            elif triangle.direction == DIR_DOWN:
-                triangle.sprite = pygame.transform.rotate(base_sprite, -90)
-        except Exception:
-            pass
+        # Sprite'ı yeni yöne göre döndür (paylaşılan önbellekten, disk I/O yok)
+        if hasattr(triangle, 'refresh_sprite'):
+            triangle.refresh_sprite()
     
     def reset(self):
         """Rotasyonu sıfırla"""
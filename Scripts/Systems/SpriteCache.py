@@ -0,0 +1,125 @@
+"""
+ReVerse - Sprite Cache
+Süreç genelinde paylaşılan sprite önbelleği (Unity AssetDatabase benzeri)
+"""
+import pygame
+from Scripts.Utils.Path import asset_path
+
+class SpriteCache:
+    """
+    Her görseli süreç başına bir kez diskten okur ve her
+    (yol, boyut, rotasyon, flip) kombinasyonunu bir kez ölçekler.
+
+    Dönen Surface'ler paylaşılır; çağıran taraf bunları değiştirmemeli
+    (set_alpha vb. gerekiyorsa .copy() almalı).
+    """
+
+    def __init__(self):
+        self._images = {}    # (rel_path, alpha) -> decode edilmiş Surface (yoksa None)
+        self._sprites = {}   # (rel_path, size, rotation, flip, smooth, alpha) -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def get(self, rel_path, size=None, rotation=0, flip=(False, False), smooth=False, alpha=False):
+        """
+        Paylaşılan sprite'ı döndür, gerekirse yükle ve dönüştür
+
+        Args:
+            rel_path (str): Assets/ ile başlayan göreli yol
+            size (tuple): Hedef (w, h) boyutu; None = orijinal boyut
+            rotation (int): Saat yönünün tersine derece (pygame.transform.rotate)
+            flip (tuple): (yatay, dikey) aynalama
+            smooth (bool): smoothscale mi scale mi kullanılsın
+            alpha (bool): convert_alpha() uygulansın mı (display gerekli)
+
+        Returns:
+            pygame.Surface: Paylaşılan surface
+
+        Raises:
+            FileNotFoundError / pygame.error: Görsel yüklenemezse
+        """
+        size = tuple(size) if size is not None else None
+        flip = (bool(flip[0]), bool(flip[1]))
+        key = (rel_path, size, rotation % 360, flip, bool(smooth), bool(alpha))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._load_image(rel_path, alpha)
+        if size is not None and sprite.get_size() != size:
+            if smooth:
+                sprite = pygame.transform.smoothscale(sprite, size)
+            else:
+                sprite = pygame.transform.scale(sprite, size)
+        if rotation % 360:
+            sprite = pygame.transform.rotate(sprite, rotation)
+        if flip[0] or flip[1]:
+            sprite = pygame.transform.flip(sprite, flip[0], flip[1])
+        if (rel_path, bool(alpha)) in self._images:  # Dönüştürülemeyen görselin türevleri de geçici
+            self._sprites[key] = sprite
+        return sprite
+
+    def _load_image(self, rel_path, alpha):
+        """Orijinal görseli (dönüşümsüz) bir kez decode et"""
+        image_key = (rel_path, bool(alpha))
+        if image_key in self._images:
+            image = self._images[image_key]
+            if image is None:
+                raise FileNotFoundError(f"Sprite not found: {rel_path}")
+            return image
+
+        self.disk_loads += 1
+        try:
+            image = pygame.image.load(asset_path(rel_path))
+        except FileNotFoundError:
+            # Eksik dosyayı tekrar tekrar diskte aramamak için negatif kayıt
+            self._images[image_key] = None
+            raise
+        if alpha:
+            try:
+                image = image.convert_alpha()
+            except pygame.error as e:
+                # Display henüz yok: dönüştürülmemiş görseli kullan, önbelleğe alma
+                # (display açıldıktan sonraki istek tekrar dönüştürmeyi dener)
+                print(f"⚠️ {rel_path}: {e}")
+                return image
+        self._images[image_key] = image
+        return image
+
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndür (debug panel için)
+
+        Returns:
+            dict: hits, misses, disk_loads, sprites
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_loads": self.disk_loads,
+            "sprites": len(self._sprites)
+        }
+
+    def clear(self):
+        """Tüm önbelleği boşalt (display yeniden oluşturulursa)"""
+        self._images.clear()
+        self._sprites.clear()
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return f"Sprites: {len(self._sprites)} | Hits: {self.hits} | Misses: {self.misses} | Disk: {self.disk_loads}"
+
+
+# Süreç genelinde tek örnek
+sprite_cache = SpriteCache()
+
+
+def get_sprite(rel_path, size=None, rotation=0, flip=(False, False), smooth=False, alpha=False):
+    """sprite_cache.get() kısayolu"""
+    return sprite_cache.get(rel_path, size, rotation, flip, smooth, alpha)
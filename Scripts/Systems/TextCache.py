@@ -0,0 +1,104 @@
+"""
+ReVerse - Text Cache
+HUD metinleri için sınırlı (LRU) render önbelleği
+"""
+import pygame
+from collections import OrderedDict
+
+class TextCache:
+    """
+    font.render() sonuçlarını (metin, font boyutu, renk, antialias)
+    anahtarıyla saklar; en eski kullanılan giriş kapasite dolunca atılır.
+    Genişlik ölçümü render yerine font.size() ile yapılır ve o da önbelleklenir.
+    """
+
+    def __init__(self, max_entries=256, font_name='consolas'):
+        self.max_entries = max_entries
+        self.font_name = font_name
+        self._fonts = {}                 # (size, bold) -> Font
+        self._surfaces = OrderedDict()   # (text, size, color, antialias, bold) -> Surface
+        self._metrics = OrderedDict()    # (text, size, bold) -> (w, h)
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, bold=False):
+        """
+        Boyuta göre font döndür (SysFont sadece ilk istekte aranır)
+
+        Args:
+            size (int): Piksel boyutu
+            bold (bool): Kalın mı
+
+        Returns:
+            pygame.font.Font
+        """
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.SysFont(self.font_name, size, bold=bold)
+            except Exception:
+                font = pygame.font.Font(None, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size, color, antialias=True, bold=False):
+        """
+        Metni render et veya önbellekten döndür
+
+        Args:
+            text (str): Metin
+            size (int): Font boyutu
+            color (tuple): RGB renk
+            antialias (bool): Kenar yumuşatma
+
+        Returns:
+            pygame.Surface: Paylaşılan surface (değiştirmeyin)
+        """
+        key = (text, size, tuple(color), antialias, bold)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self.font(size, bold).render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def measure(self, text, size, bold=False):
+        """
+        Metnin render edilmeden (w, h) boyutunu döndür
+
+        Args:
+            text (str): Metin
+            size (int): Font boyutu
+
+        Returns:
+            tuple: (genişlik, yükseklik)
+        """
+        key = (text, size, bold)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self.font(size, bold).size(text)
+            self._metrics[key] = metrics
+            if len(self._metrics) > self.max_entries * 4:
+                self._metrics.popitem(last=False)
+        else:
+            self._metrics.move_to_end(key)
+        return metrics
+
+    def clear(self):
+        """Render ve ölçüm önbelleğini boşalt (fontlar korunur)"""
+        self._surfaces.clear()
+        self._metrics.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __str__(self):
+        """String representation (Debug için)"""
+        return f"Texts: {len(self._surfaces)}/{self.max_entries} | Hits: {self.hits} | Misses: {self.misses}"
@@ -8,8 +8,11 @@ Unity benzeri global ayarlar
 # Önce grid boyutları, sonra ekran boyutu hesaplanır
 # ============================================
 GRID_SIZE = 64  # Her kare 64x64 piksel
-GRID_COLS = 6   # Harita genişliği (6 sütun)
-GRID_ROWS = 5   # Harita yüksekliği (5 satır)
+GRID_COLS = 6   # Varsayılan harita genişliği (6 sütun); leveller kendi boyutunu kullanır
+GRID_ROWS = 5   # Varsayılan harita yüksekliği (5 satır)
+VIEW_COLS = GRID_COLS  # Kamera görüş alanı (hücre); daha büyük leveller kamera ile kaydırılır
+VIEW_ROWS = GRID_ROWS
+CAMERA_SMOOTHING = 0.1  # Tick başına hedefe yaklaşma oranı (1.0 = anında)
 
 # ============================================
 # SCREEN SETTINGS (Ekran Ayarları)
@@ -19,9 +22,19 @@ SCALE = 2.5  # Pencere büyütme çarpanı
 SCREEN_WIDTH = int(GRID_SIZE * GRID_COLS * SCALE)
 SCREEN_HEIGHT = int(GRID_SIZE * GRID_ROWS * SCALE)
 FPS = 60
+LOOP_MODE = "adaptive"   # "fixed": her zaman FPS; "adaptive": boştayken event bekle, düşük kadans
+IDLE_FPS = 10            # Boşta (oyuncu beklerken) animasyon/timer kadansı
+IDLE_MENU_WAIT_MS = 500  # Win/Game Over ekranlarında event bekleme süresi (ms)
+MAX_FRAME_DT = 0.1       # Uzun beklemeden sonra dt sınırı (saniye)
+SIM_TICK_DT = 1.0 / FPS  # Sabit simülasyon adımı (render hızından bağımsız)
+SIM_SPEED = 1.0          # Simülasyon hız çarpanı (replay/demo için 2-100x)
 FULLSCREEN = False  # F11 ile açılabilir
 VSYNC = True
+PRESENT_MODE = "stretch"  # Harita ölçekleme: "stretch", "integer", "letterbox" (F9 ile değişir)
 HUD_HEIGHT = int(64 * SCALE)  # Üst HUD yüksekliği (Zelda-1 tarzı sabit üst şerit)
+HUD_TEXT_CACHE_SIZE = 128     # HUD metin render önbelleği (LRU giriş sayısı)
+CHUNK_CELLS = 8               # Statik tile katmanı parça kenarı (hücre); 8x8 x 64 px = 1 MB surface
+CHUNK_CACHE_BUDGET = 32 * 1024 * 1024  # Parça surface önbelleği bellek bütçesi (bayt, LRU)
 
 # ============================================
 # GAME RULES (Oyun Kuralları)
@@ -89,6 +102,15 @@ SHOW_FPS = True           # FPS göster
 SHOW_GRID = True          # Grid çizgilerini göster
 SHOW_COLLIDERS = False    # Çarpışma kutularını göster
 GOD_MODE = False          # Can sonsuz (test için)
+DEBUG_PANEL_REFRESH = 0.25  # Debug panel içeriğinin yenilenme aralığı (saniye)
+
+# ============================================
+# REPLAY (Oturum kaydı)
+# ============================================
+REPLAY_RECORD = True          # Her oturumu (tick, hamle) akışı olarak kaydet
+REPLAY_DIR = "replays"        # Kayıt klasörü (python main.py replay <dosya> ile oynatılır)
+REPLAY_EXTENSION = ".rvr"
+REPLAY_BUFFER_SIZE = 4096     # Dosya yazma buffer'ı (bayt); tam bir oturum genelde birkaç yüz bayt
 
 # ============================================
 # PATHS (Dosya Yolları)
@@ -98,3 +120,8 @@ SPRITES_PATH = ASSETS_PATH + "Sprites/"
 VIDEOS_PATH = ASSETS_PATH + "Videos/"
 FONTS_PATH = ASSETS_PATH + "Fonts/"
 SPLASH_VIDEO = VIDEOS_PATH + "splash.mp4"
+LEVELS_PATH = "Levels/Data/"          # Level metin dosyaları (level_XX.txt, isim sırasıyla numaralanır)
+LEVEL_CACHE_PATH = "Levels/.cache/"    # Derlenmiş (ikili) level önbelleği, içerik hash'i ile adlandırılır
+LEVEL_PACK = None                      # .rvpk level paketi (None = LEVELS_PATH dosyaları); mmap ile açılır
+LEVEL_PACK_CACHE_SIZE = 32             # Paketten decode edilmiş level LRU kapasitesi
+LEVEL_BUILD_CACHE_SIZE = 8             # Oluşturulmuş (entity'leri kurulu) level örneği LRU kapasitesi
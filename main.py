@@ -169,9 +169,191 @@ def test_systems():
     print(f"   Loaded {len(objects['collectibles'])} collectibles")
     print("   ✅ LevelLoader OK\n")
     
+    # GameState testi (pygame'siz simülasyon)
+    print("4️⃣ Testing GameState...")
+    from Scripts.Core.GameState import new_game, step, ACTION_RIGHT
+    state = new_game()
+    state, events = step(state, ACTION_RIGHT)
+    print(f"   After move: {state}")
+    print(f"   Events: {[name for name, _ in events]}")
+    print("   ✅ GameState OK\n")
+    
     print("✅ All systems tested successfully!\n")
 
 
+def validate_levels(argv):
+    """
+    Tüm levelleri yapısal kontrol + flood-fill + solver ile doğrula (JSON rapor)
+
+    Args:
+        argv (list): 'validate' sonrası argümanlar (--jobs N, --pack FILE, ...)
+
+    Returns:
+        int: Çıkış kodu (0 = tüm leveller çözülebilir)
+    """
+    import argparse
+    import json
+    from Levels.LevelSolver import METHOD_BFS, METHOD_ASTAR, DEFAULT_MAX_STATES
+    from Levels import LevelValidator
+
+    parser = argparse.ArgumentParser(prog="main.py validate", description="ReVerse level validator")
+    parser.add_argument("--jobs", type=int, default=None, help="Process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--pack", default=None, help="JSON veya .rvpk level paketi (varsayılan: LevelData seviyeleri)")
+    parser.add_argument("--method", choices=(METHOD_BFS, METHOD_ASTAR), default=METHOD_BFS)
+    parser.add_argument("--max-states", type=int, default=DEFAULT_MAX_STATES)
+    parser.add_argument("--out", default=None, help="JSON raporu dosyaya yaz (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.pack:
+        jobs = LevelValidator.pack_jobs(LevelValidator.load_pack(args.pack), args.method, args.max_states)
+    else:
+        jobs = LevelValidator.game_jobs(args.method, args.max_states)
+    report = LevelValidator.validate_all(jobs, workers=args.jobs)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    # Özet stderr'e: stdout sadece JSON kalsın
+    summary = report["summary"]
+    mark = "✅" if summary["failed"] == 0 else "❌"
+    print(f"{mark} {summary['passed']}/{summary['levels']} levels solvable "
+          f"({summary['elapsed']:.2f}s, {summary['jobs']} jobs)", file=sys.stderr)
+    return 0 if summary["failed"] == 0 else 1
+
+
+def generate_levels(argv):
+    """
+    Solver ile doğrulanmış rastgele level paketi üret
+
+    Args:
+        argv (list): 'generate' sonrası argümanlar (--count N, --size 6x5, ...)
+
+    Returns:
+        int: Çıkış kodu (0 = istenen tüm leveller üretildi)
+    """
+    import argparse
+    from Levels import LevelGenerator
+
+    parser = argparse.ArgumentParser(prog="main.py generate", description="ReVerse level generator")
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=None, help="Process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--first-index", type=int, default=1, help="İlk level indeksi (parça parça üretim)")
+    parser.add_argument("--difficulty", choices=sorted(LevelGenerator.DIFFICULTIES), default="normal")
+    parser.add_argument("--size", default=f"{LevelGenerator.DEFAULT_COLS}x{LevelGenerator.DEFAULT_ROWS}",
+                        help="Grid boyutu (COLSxROWS)")
+    parser.add_argument("--stars", type=int, default=2)
+    parser.add_argument("--required", type=int, default=None, help="Gereken yıldız (varsayılan: --stars)")
+    parser.add_argument("--rotates", type=int, default=2)
+    parser.add_argument("--min-moves", type=int, default=None)
+    parser.add_argument("--max-moves", type=int, default=None)
+    parser.add_argument("--max-states", type=int, default=LevelGenerator.DEFAULT_MAX_STATES)
+    parser.add_argument("--max-attempts", type=int, default=LevelGenerator.DEFAULT_MAX_ATTEMPTS)
+    parser.add_argument("--out", default="generated_levels.json", help="Çıktı paketi (.json veya mmap'li .rvpk)")
+    args = parser.parse_args(argv)
+
+    cols, rows = (int(value) for value in args.size.lower().split("x"))
+    overrides = {}
+    if args.min_moves is not None:
+        overrides["min_moves"] = args.min_moves
+    if args.max_moves is not None:
+        overrides["max_moves"] = args.max_moves
+    target = LevelGenerator.GenerationTarget(
+        args.difficulty, cols, rows, args.stars,
+        args.stars if args.required is None else args.required, args.rotates,
+        args.max_states, args.max_attempts, **overrides
+    )
+
+    pack = LevelGenerator.generate_pack(args.count, target, seed=args.seed, workers=args.jobs,
+                                        first_index=args.first_index)
+    LevelGenerator.save_pack(pack, args.out)
+    summary = pack["summary"]
+    mark = "✅" if not summary["failed"] else "⚠️"
+    print(f"{mark} {summary['accepted']}/{summary['requested']} levels -> {args.out} "
+          f"({summary['attempts']} candidates, {summary['elapsed']:.1f}s)")
+    if summary["failed"]:
+        print(f"   No level within {args.max_attempts} attempts for: {summary['failed']}")
+    return 0 if not summary["failed"] else 1
+
+
+def fuzz_gameplay(argv):
+    """
+    Rastgele hamle dizileriyle invariant testi (JSON rapor)
+
+    Args:
+        argv (list): 'fuzz' sonrası argümanlar (--episodes N, --jobs N, ...)
+
+    Returns:
+        int: Çıkış kodu (0 = ihlal yok)
+    """
+    import argparse
+    import json
+    from Scripts.Core import Fuzzer
+
+    parser = argparse.ArgumentParser(prog="main.py fuzz", description="ReVerse gameplay fuzzer")
+    parser.add_argument("--episodes", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, default=None, help="Process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--seed", type=int, default=0, help="İlk bölüm seed'i")
+    parser.add_argument("--steps", type=int, default=Fuzzer.DEFAULT_STEPS, help="Bölüm başına en fazla hamle")
+    parser.add_argument("--target", choices=Fuzzer.TARGETS, default=Fuzzer.TARGET_SIM,
+                        help="sim = GameState, game = GameManager (ekransız) + GameState karşılaştırması")
+    parser.add_argument("--god", action="store_true", help="God mode (can kaybı yok)")
+    parser.add_argument("--out", default=None, help="JSON raporu dosyaya yaz (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    report = Fuzzer.fuzz(args.episodes, jobs=args.jobs, seed=args.seed, max_steps=args.steps,
+                         target=args.target, god_mode=args.god)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    summary = report["summary"]
+    mark = "✅" if not report["failures"] else "❌"
+    print(f"{mark} {summary['episodes']} episodes, {len(report['failures'])} invariant failures "
+          f"({summary['elapsed']:.1f}s, {summary['episodes_per_min']} episodes/min)", file=sys.stderr)
+    return 0 if not report["failures"] else 1
+
+
+def play_replay(argv):
+    """
+    Kaydedilmiş oturumu (replays/*.rvr) oynat: pencerede (x hız) veya headless
+
+    Args:
+        argv (list): 'replay' sonrası argümanlar (<dosya> [--speed N] [--headless])
+
+    Returns:
+        int: Çıkış kodu (1 = dosya okunamadı)
+    """
+    import argparse
+    from Scripts.Systems.Replay import ReplayReader
+
+    parser = argparse.ArgumentParser(prog="main.py replay", description="ReVerse replay player")
+    parser.add_argument("file", help="Kayıt dosyası (.rvr)")
+    parser.add_argument("--speed", type=float, default=None, help="Hız çarpanı (örn. 2, 10, 100)")
+    parser.add_argument("--headless", action="store_true", help="Çizimsiz, CPU hızında oynat ve son durumu yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        replay = ReplayReader(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot load replay: {e}")
+        return 1
+
+    try:
+        game = GameManager(replay=replay, speed=args.speed, headless=args.headless)
+        game.run()
+    finally:
+        pygame.quit()
+    return 0
+
+
 # ============================================
 # ENTRY POINTS
 # ============================================
@@ -191,12 +373,32 @@ if __name__ == "__main__":
             # Splash olmadan başlat
             quick_start()
         
+        elif command == "validate":
+            # Toplu level doğrulama (JSON rapor)
+            sys.exit(validate_levels(sys.argv[2:]))
+        
+        elif command == "generate":
+            # Solver onaylı level üretimi
+            sys.exit(generate_levels(sys.argv[2:]))
+        
+        elif command == "fuzz":
+            # Invariant fuzzer (JSON rapor)
+            sys.exit(fuzz_gameplay(sys.argv[2:]))
+        
+        elif command == "replay":
+            # Kayıtlı oturumu oynat
+            sys.exit(play_replay(sys.argv[2:]))
+        
         elif command == "help":
             # Yardım
             print("\nReVerse - Command Line Options:")
             print("  python main.py        - Normal oyun başlatma (splash ile)")
             print("  python main.py quick  - Hızlı başlatma (splash olmadan)")
             print("  python main.py test   - Sistem testleri")
+            print("  python main.py validate [--jobs N] [--pack FILE] - Level doğrulama (JSON)")
+            print("  python main.py generate [--count N] [--difficulty D] [--size 6x5] [--out F.json|F.rvpk] - Level üretimi")
+            print("  python main.py fuzz [--episodes N] [--jobs N] [--target sim|game] - Invariant fuzzer (JSON)")
+            print("  python main.py replay FILE [--speed N] [--headless] - Kayıtlı oturumu oynat (replays/*.rvr)")
             print("  python main.py help   - Bu yardım menüsü")
             print()
         